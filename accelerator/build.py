@@ -33,7 +33,7 @@ from importlib import import_module
 from argparse import ArgumentParser, RawTextHelpFormatter
 
 from accelerator.compat import unicode, str_types, PY3
-from accelerator.compat import urlencode, urlopen, Request, URLError, HTTPError
+from accelerator.compat import urlencode, Request, URLError, HTTPError
 from accelerator.compat import getarglist
 
 from accelerator import setupfile
@@ -41,7 +41,7 @@ from accelerator.extras import json_encode, json_decode, DotDict, _ListTypePrese
 from accelerator.job import Job
 from accelerator.status import print_status_stacks
 from accelerator.error import JobError, DaemonError, UrdError, UrdPermissionError, UrdConflictError
-from accelerator import unixhttp; unixhttp # for unixhttp:// URLs, as used to talk to the daemon
+from accelerator.unixhttp import pooled_urlopen as urlopen # keep-alive, and unixhttp:// URLs (as used to talk to the daemon)
 
 
 class Automata:
@@ -552,6 +552,32 @@ class Urd(object):
 	def peek_latest(self, path):
 		return self.peek(path, self._latest_str())
 
+	def _bulk(self, lookups):
+		lookups = [(self._path(path), _tsfix(timestamp),) for path, timestamp in lookups]
+		url = '/'.join((self._url, 'bulk'))
+		res = self._call(url, lookups, fmt=lambda d: [UrdResponse(v and _urd_typeify(v)) for v in json.loads(d)])
+		return lookups, res
+
+	def peek_many(self, lookups):
+		"""Like [urd.peek(path, timestamp) for path, timestamp in lookups]
+		but in a single request."""
+		return self._bulk(lookups)[1]
+
+	def get_many(self, lookups):
+		"""Like [urd.get(path, timestamp) for path, timestamp in lookups]
+		but in a single request. Use "latest" or "first" as timestamp
+		for urd.latest/urd.first."""
+		assert self._current, "Can't record dependency with nothing running"
+		lookups, res = self._bulk((path, self._latest_str() if timestamp == 'latest' else timestamp) for path, timestamp in lookups)
+		paths = [path for path, _ in lookups]
+		assert len(set(paths)) == len(paths), 'Duplicate paths in get_many'
+		for path, r in zip(paths, res):
+			assert path not in self._deps, 'Duplicate ' + path
+			if r:
+				self._deps[path] = r.as_dep
+			self._latest_joblist = r.joblist
+		return res
+
 	def peek_first(self, path):
 		return self.peek(path, 'first')
 
@@ -25,13 +25,13 @@ from __future__ import unicode_literals
 
 import os
 from keyword import kwlist
-from collections import namedtuple, Counter
-from itertools import compress
+from collections import namedtuple, Counter, OrderedDict
+from itertools import compress, islice
 from functools import partial
 from contextlib import contextmanager
-from operator import itemgetter
+from operator import itemgetter, truth, and_
 
-from accelerator.compat import unicode, uni, ifilter, imap, iteritems, str_types
+from accelerator.compat import unicode, uni, ifilter, imap, iteritems, str_types, PY3
 from accelerator.compat import builtins, open, getarglist, izip, izip_longest
 
 from accelerator import blob
@@ -60,6 +60,13 @@ iskeyword = frozenset(kwlist).__contains__
 #     lines = [line, count, per, slice,],
 #     cache = ((id, data), ...), # key is missing if there is no cache in this dataset
 #     cache_distance = datasets_since_last_cache, # key is missing if previous is None
+#     sketches = {"column name": "jobid/path/to/sketches"}, # key is missing if no column has sketches
+#     chain_summary = summary of previous and everything before it, # key is missing if previous is None
+#
+# A chain summary is a dict with:
+#     length = number of datasets,
+#     lines = [total, lines, per, slice,] (or None if the datasets have different slice counts),
+#     columns = {"column name": (datasets with this column, any none_support, (min, max) or None if not comparable)},
 #
 # A DatasetColumn has these fields:
 #     type = "type", # something that exists in type2iter and doesn't start with _
@@ -85,6 +92,8 @@ iskeyword = frozenset(kwlist).__contains__
 # There is a ds.column_filename function to do this for you (not the seeking, obviously).
 #
 # The dataset pickle is jid/name/dataset.pickle, so jid/default/dataset.pickle for the default dataset.
+# The sketches are in a separate pickle (jid/name/dataset.sketches for the columns written there),
+# {"column name": [sketch, per, slice,]}, so they are not copied into caches or loaded until used.
 
 def _clean_name(n, seen_n):
 	n = ''.join(c if c.isalnum() else '_' for c in n)
@@ -126,16 +135,27 @@ class _New_dataset_marker(unicode): pass
 _new_dataset_marker = _New_dataset_marker('new')
 _no_override = object()
 
-_ds_cache = {}
+# Loaded dataset.pickle files, {filename: (mtime, data)}, least recently
+# used first. The mtime is checked on each use, so a rewritten dataset is
+# not taken from here. (This is shared, so the data must not be modified.)
+_ds_cache = OrderedDict()
+_ds_cache_size = 1024
+
 def _ds_load(obj):
-	n = unicode(obj)
-	if n not in _ds_cache:
-		fn = obj.job.filename(obj._name('pickle'))
-		if not os.path.exists(fn):
-			raise NoSuchDatasetError('Dataset %r does not exist' % (n,))
-		_ds_cache[n] = blob.load(fn)
-		_ds_cache.update(_ds_cache[n].get('cache', ()))
-	return _ds_cache[n]
+	fn = obj.job.filename(obj._name('pickle'))
+	try:
+		mtime = os.stat(fn).st_mtime
+	except OSError:
+		raise NoSuchDatasetError('Dataset %r does not exist' % (unicode(obj),))
+	cached = _ds_cache.pop(fn, None)
+	if cached and cached[0] == mtime:
+		data = cached[1]
+	else:
+		data = blob.load(fn)
+	_ds_cache[fn] = (mtime, data,) # (re)insert last, for LRU
+	while len(_ds_cache) > _ds_cache_size:
+		_ds_cache.popitem(last=False)
+	return data
 
 class Dataset(unicode):
 	"""
@@ -154,7 +174,9 @@ class Dataset(unicode):
 	These decay to a (unicode) string when pickled.
 	"""
 
-	def __new__(cls, jobid, name=None):
+	def __new__(cls, jobid, name=None, _data=None):
+		# _data is only for .chain, which can get it from the cache in a
+		# later dataset instead of loading it.
 		if isinstance(jobid, (tuple, list)):
 			jobid = _dsid(jobid)
 		elif isinstance(jobid, dict):
@@ -197,7 +219,7 @@ class Dataset(unicode):
 			obj.job = None
 		else:
 			obj.job = Job(jobid)
-			obj._data = DotDict(_ds_load(obj))
+			obj._data = DotDict(_data or _ds_load(obj))
 			assert obj._data.version[0] == 3 and obj._data.version[1] >= 0, "%s/%s: Unsupported dataset pickle version %r" % (jobid, name, obj._data.version,)
 			obj._data.columns = dict(obj._data.columns)
 		obj._cache = {}
@@ -252,6 +274,23 @@ class Dataset(unicode):
 	def shape(self):
 		return (len(self.columns), sum(self.lines),)
 
+	def sketch(self, column, sliceno=None):
+		"""Approximate distinct count and quantiles (an accelerator.sketch.Sketch)
+		for column, for one slice or the whole dataset.
+		None if the column was not written with sketches."""
+		from accelerator.sketch import merge_raw
+		location = self._data.get('sketches', {}).get(column)
+		if not location:
+			return None
+		key = ('sketches', location,)
+		if key not in self._cache:
+			jid, path = location.split('/', 1)
+			self._cache[key] = blob.load(Job(jid).filename(path))
+		raws = self._cache[key][column]
+		if sliceno is not None:
+			raws = raws[sliceno:sliceno + 1]
+		return merge_raw(raws)
+
 	def link_to_here(self, name='default', column_filter=None, override_previous=_no_override):
 		"""Use this to expose a subjob as a dataset in your job:
 		Dataset(subjid).link_to_here()
@@ -268,6 +307,8 @@ class Dataset(unicode):
 			assert not left_over, "Columns in filter not available in dataset: %r" % (left_over,)
 			assert filtered_columns, "Filter produced no desired columns."
 			d._data.columns = filtered_columns
+			if 'sketches' in d._data:
+				d._data.sketches = {k: v for k, v in d._data.sketches.items() if k in column_filter}
 		from accelerator.g import job
 		if override_previous is not _no_override:
 			override_previous = _dsid(override_previous)
@@ -302,6 +343,11 @@ class Dataset(unicode):
 		if len(hashlabels) > 1:
 			raise DatasetUsageError("Hashlabel mismatch, %s has %s, %s has %s" % (self, self.hashlabel, other, other.hashlabel,))
 		new_ds._data.columns.update(other._data.columns)
+		sketches = dict(self._data.get('sketches', {}))
+		for n in other._data.columns:
+			sketches.pop(n, None)
+		sketches.update(other._data.get('sketches', {}))
+		new_ds._data.sketches = sketches
 		if not allow_unrelated:
 			def parents(ds, tips):
 				if not isinstance(ds, tuple):
@@ -326,12 +372,24 @@ class Dataset(unicode):
 		new_ds._save()
 		return job.dataset(name) # new_ds has the wrong string value, so we must make a new instance here.
 
-	def _column_iterator(self, sliceno, col, _type=None, **kw):
+	def _column_iterator(self, sliceno, col, _type=None, rows=None, **kw):
 		from accelerator.sourcedata import type2iter
 		dc = self.columns[col]
 		mkiter = partial(type2iter[_type or dc.backing_type], **kw)
 		def one_slice(sliceno):
 			fn = self.column_filename(col, sliceno)
+			if rows:
+				# Only the lines in range(start, stop) in this slice.
+				start, stop = rows
+				if stop is None or stop > self.lines[sliceno]:
+					stop = self.lines[sliceno]
+				if dc.offsets:
+					it = mkiter(fn, seek=dc.offsets[sliceno], max_count=stop)
+				else:
+					it = mkiter(fn, max_count=stop)
+				if start:
+					it.skip(start)
+				return it
 			if dc.offsets:
 				return mkiter(fn, seek=dc.offsets[sliceno], max_count=self.lines[sliceno])
 			else:
@@ -343,12 +401,12 @@ class Dataset(unicode):
 		else:
 			return one_slice(sliceno)
 
-	def _iterator(self, sliceno, columns=None):
+	def _iterator(self, sliceno, columns=None, rows=None):
 		res = []
 		not_found = []
 		for col in columns or sorted(self.columns):
 			if col in self.columns:
-				res.append(self._column_iterator(sliceno, col))
+				res.append(self._column_iterator(sliceno, col, rows=rows))
 			else:
 				not_found.append(col)
 		assert not not_found, 'Columns %r not found in %s/%s' % (not_found, self.job, self.name)
@@ -370,31 +428,65 @@ class Dataset(unicode):
 			return jid.filename(name % (sliceno,))
 
 	def chain(self, length=-1, reverse=False, stop_ds=None):
+		return self._chain(length, reverse, stop_ds)
+
+	def _chain(self, length=-1, reverse=False, stop_ds=None, range=None):
+		"""chain, but if range is specified it stops as soon as no
+		earlier dataset can have any lines in range."""
 		if stop_ds:
 			# resolve all formats to the same format
 			stop_ds = Dataset(stop_ds)
+		if range:
+			range_k, (range_bottom, range_top,) = next(iteritems(range))
 		chain = DatasetChain()
 		current = self
+		whole = False
+		# Every 64th dataset in a chain has a cache of the previous 63,
+		# so only those need to be loaded once the first one is found.
+		known = {}
 		while length != len(chain) and current != stop_ds:
 			chain.append(current)
-			if not current.previous:
+			known.update((_dsid(k), v) for k, v in current._data.get('cache', ()))
+			previous = _dsid(current._data.previous)
+			if not previous:
+				whole = True
+				break
+			if range and _out_of_range(current._data.get('chain_summary'), range_k, range_bottom, range_top):
 				break
-			current = Dataset(current.previous)
+			ds = Dataset(previous, _data=known.pop(previous, None))
+			current._cache['previous'] = (current._data.previous, ds,)
+			current = ds
 		if not reverse:
 			chain.reverse()
+		if whole and (not self.previous or 'chain_summary' in self._data):
+			chain._whole = (list(chain), self._chain_summary(),)
 		return chain
 
+	def _chain_summary(self):
+		"""Summary (as in chain_summary) of the chain up to and including this dataset"""
+		if self.previous and 'chain_summary' not in self._data:
+			# Written by an older version, so summarise the long way.
+			summary = None
+			for ds in self.chain():
+				summary = _summarise(summary, ds)
+			return summary
+		return _summarise(self._data.get('chain_summary'), self)
+
 	def iterate_chain(self, sliceno, columns=None, length=-1, range=None, sloppy_range=False, reverse=False, hashlabel=None, stop_ds=None, pre_callback=None, post_callback=None, filters=None, translators=None, status_reporting=True, rehash=False):
 		"""Iterate a list of datasets. See .chain and .iterate_list for details."""
-		chain = self.chain(length, reverse, stop_ds)
+		chain = self._chain(length, reverse, stop_ds, range)
 		return self.iterate_list(sliceno, columns, chain, range=range, sloppy_range=sloppy_range, hashlabel=hashlabel, pre_callback=pre_callback, post_callback=post_callback, filters=filters, translators=translators, status_reporting=status_reporting, rehash=rehash)
 
-	def iterate(self, sliceno, columns=None, hashlabel=None, filters=None, translators=None, status_reporting=True, rehash=False):
-		"""Iterate just this dataset. See .iterate_list for details."""
-		return self.iterate_list(sliceno, columns, [self], hashlabel=hashlabel, filters=filters, translators=translators, status_reporting=status_reporting, rehash=rehash)
+	def iterate(self, sliceno, columns=None, hashlabel=None, filters=None, translators=None, status_reporting=True, rehash=False, rows=None):
+		"""Iterate just this dataset. See .iterate_list for details.
+		rows=(start, stop) limits iteration to those lines in the slice,
+		skipping over the first start lines without decoding them.
+		(This is what you get as the rows argument in analysis when
+		your method sets split_analysis.)"""
+		return self.iterate_list(sliceno, columns, [self], hashlabel=hashlabel, filters=filters, translators=translators, status_reporting=status_reporting, rehash=rehash, rows=rows)
 
 	@staticmethod
-	def iterate_list(sliceno, columns, datasets, range=None, sloppy_range=False, hashlabel=None, pre_callback=None, post_callback=None, filters=None, translators=None, status_reporting=True, rehash=False):
+	def iterate_list(sliceno, columns, datasets, range=None, sloppy_range=False, hashlabel=None, pre_callback=None, post_callback=None, filters=None, translators=None, status_reporting=True, rehash=False, rows=None):
 		"""Iterator over the specified columns from datasets
 		(iterable of dataset-specifiers, or single dataset-specifier).
 		callbacks are called before and after each dataset is iterated.
@@ -419,6 +511,13 @@ class Dataset(unicode):
 
 		Translators run before filters.
 
+		With filters as a dict (or a range, see below) the columns they
+		need are read first, and the other columns only decode the rows
+		that were selected. (Except with a translators callable or when
+		rehashing.) Either way the range is checked first, on the
+		untranslated value, and the filters (in column order) are only
+		called for rows that nothing before them has rejected.
+
 		You can also pass a single name (a str) as columns, in which case you
 		don't get a tuple back (just the values). Tuple-filters/translators also
 		get just the value in this case (column versions are unaffected).
@@ -442,6 +541,10 @@ class Dataset(unicode):
 		If you set sloppy_range=True you may get all rows from datasets that
 		contain any rows you asked for. (This can be faster.)
 
+		rows=(start, stop) limits iteration to lines start to stop (not
+		included) of the slice. This only works for a single dataset and
+		a single (not rehashed) slice.
+
 		status_reporting should normally be left as True, which will give you
 		information about this iteration in ^T, but there is one case where you
 		need to turn it off:
@@ -455,6 +558,10 @@ class Dataset(unicode):
 		if isinstance(datasets, str_types + (Dataset, dict)):
 			datasets = [datasets]
 		datasets = [ds if isinstance(ds, Dataset) else Dataset(ds) for ds in datasets]
+		if rows:
+			assert len(datasets) == 1, "rows only works when iterating a single dataset"
+			assert isinstance(sliceno, int), "rows only works when iterating a single slice"
+			assert not (hashlabel and datasets[0].hashlabel != hashlabel), "rows doesn't work with rehashing"
 		if not columns:
 			columns = datasets[0].columns
 		if isinstance(columns, str_types):
@@ -501,11 +608,13 @@ class Dataset(unicode):
 			pre_callback=pre_callback,
 			post_callback=post_callback,
 			filter_func=filter_func,
+			filters=filters,
 			translation_func=translation_func,
 			translators=translators,
 			want_tuple=want_tuple,
 			range=range,
 			status_reporting=status_reporting,
+			rows=rows,
 		)
 		if sliceno == "roundrobin":
 			# We do our own status reporting
@@ -597,7 +706,7 @@ class Dataset(unicode):
 			yield update_status
 
 	@staticmethod
-	def _iterate_datasets(to_iter, columns, pre_callback, post_callback, filter_func, translation_func, translators, want_tuple, range, status_reporting):
+	def _iterate_datasets(to_iter, columns, pre_callback, post_callback, filter_func, translation_func, translators, want_tuple, range, status_reporting, rows=None, filters=None):
 		skip_ds = None
 		def argfixup(func, is_post):
 			if func:
@@ -617,6 +726,7 @@ class Dataset(unicode):
 		post_callback, unsliced_post_callback = argfixup(post_callback, True)
 		if not to_iter:
 			return
+		range_k = range_check = None
 		if range:
 			range_k, (range_bottom, range_top,) = next(iteritems(range))
 			range_check = range_check_function(range_bottom, range_top)
@@ -629,6 +739,13 @@ class Dataset(unicode):
 					range_f = range_check
 			else:
 				has_range_column = False
+		# With per column filters (and/or a range) the columns they need
+		# are read first, and the other columns skip the lines that were
+		# not selected without decoding them.
+		if want_tuple and not translation_func and filters and not callable(filters):
+			column_filters = {columns.index(name): f for name, f in filters.items()}
+		else:
+			column_filters = {}
 		with Dataset._iterstatus(status_reporting, to_iter) as update:
 			for ix, (d, sliceno, rehash) in enumerate(to_iter, 1):
 				if unsliced_post_callback:
@@ -651,30 +768,38 @@ class Dataset(unicode):
 						continue
 					except StopIteration:
 						return
-				it = d._iterator(None if rehash else sliceno, columns)
-				for ix, trans in translators.items():
-					it[ix] = imap(trans, it[ix])
-				if want_tuple:
-					it = izip(*it)
-				else:
-					it = it[0]
-				if rehash:
-					it = d._hashfilter(sliceno, rehash, it)
-				if translation_func:
-					it = imap(translation_func, it)
+				range_needed = False
 				if range:
 					c = d.columns[range_k]
-					if c.min is not None and (not range_check(c.min) or not range_check(c.max)):
+					range_needed = c.min is not None and (not range_check(c.min) or not range_check(c.max))
+				if want_tuple and not translation_func and not rehash and (column_filters or range_needed):
+					it = Dataset._iterate_selected(d, sliceno, columns, rows, translators, column_filters, filter_func if column_filters else None, range_k if range_needed else None, range_check)
+					if filter_func and not column_filters:
+						# A callable filter, only sees the lines in the range.
+						it = ifilter(filter_func, it)
+				else:
+					it = d._iterator(None if rehash else sliceno, columns, rows)
+					for ix, trans in translators.items():
+						it[ix] = imap(trans, it[ix])
+					if want_tuple:
+						it = izip(*it)
+					else:
+						it = it[0]
+					if rehash:
+						it = d._hashfilter(sliceno, rehash, it)
+					if translation_func:
+						it = imap(translation_func, it)
+					if range_needed:
 						if has_range_column:
 							it = ifilter(range_f, it)
 						else:
 							if rehash:
 								filter_it = d._hashfilter(sliceno, rehash, d._column_iterator(None, range_k))
 							else:
-								filter_it = d._column_iterator(sliceno, range_k)
+								filter_it = d._column_iterator(sliceno, range_k, rows=rows)
 							it = compress(it, imap(range_check, filter_it))
-				if filter_func:
-					it = ifilter(filter_func, it)
+					if filter_func:
+						it = ifilter(filter_func, it)
 				yield it
 				if post_callback and not unsliced_post_callback:
 					try:
@@ -688,7 +813,97 @@ class Dataset(unicode):
 					return
 
 	@staticmethod
-	def new(columns, filenames, lines, minmax={}, filename=None, hashlabel=None, caption=None, previous=None, name='default'):
+	def _iterate_selected(d, sliceno, columns, rows, translators, filters, filter_func, range_k, range_check):
+		"""Iterate columns (as tuples) from d, _SELECT_CHUNK lines at a
+		time. First range_check (on range_k, unless that is None) and then
+		filters ({column index: filter}) in column order select lines,
+		each only looking at the lines still selected. The other columns
+		then only decode the selected lines.
+		If the first chunk keeps more than half the lines this is slower
+		than decoding everything, so then the rest is zipped and filtered
+		with filter_func (and range_check) like normal iteration."""
+		from accelerator import gzutil
+		from itertools import chain, repeat
+		from collections import deque
+		iters = {} # {column index or None: iterator}
+		def reader(ix, name):
+			it = iters[ix] = d._column_iterator(sliceno, name, rows=rows)
+			return it, getattr(it, 'take', None) or partial(gzutil.take, it)
+		stages = [] # [(column index or None, (iterator, take function), translator, check)]
+		range_ix = None
+		if range_k is not None:
+			# The range is checked on the untranslated values (like
+			# the other iteration does).
+			if range_k in columns and columns.index(range_k) not in translators:
+				range_ix = columns.index(range_k)
+			stages.append((range_ix, reader(range_ix, range_k), None, range_check,))
+		for ix, f in sorted(filters.items()):
+			# The range column is already read if it is untranslated.
+			rd = None if ix == range_ix else reader(ix, columns[ix])
+			stages.append((ix, rd, translators.get(ix), f or truth,))
+		staged = set(ix for ix, _, _, _ in stages)
+		takers = [] # [(column index, take function, translator)]
+		for ix, name in enumerate(columns):
+			if ix not in staged:
+				takers.append((ix, reader(ix, name)[1], translators.get(ix),))
+		def unselected():
+			# All readers are at the same line, continue from there.
+			its = [iters[ix] for ix in range(len(columns))]
+			for ix, trans in translators.items():
+				its[ix] = imap(trans, its[ix])
+			it = izip(*its)
+			if range_k is not None:
+				if range_ix is None:
+					it = compress(it, imap(range_check, iters[None]))
+				else:
+					it = ifilter(lambda t: range_check(t[range_ix]), it)
+			if filter_func:
+				it = ifilter(filter_func, it)
+			return it
+		def chunks():
+			first = True
+			while True:
+				kept = {} # {column index: values of the selected lines}
+				mask = None
+				for ix, rd, trans, check in stages:
+					if ix in kept:
+						values = kept[ix]
+					elif mask is None:
+						values = list(islice(rd[0], _SELECT_CHUNK))
+						if not values:
+							return
+						lines = len(values)
+						selected = range(lines)
+					else:
+						# Only the lines that are still selected are decoded.
+						values = rd[1](mask)
+					if trans:
+						values = list(imap(trans, values))
+					if ix is not None:
+						kept[ix] = values
+					ok = bytearray(imap(truth, imap(check, values)))
+					selected = list(compress(selected, ok))
+					for k, v in kept.items():
+						kept[k] = list(compress(v, ok))
+					mask = bytearray(lines)
+					deque(imap(mask.__setitem__, selected, repeat(1)), 0)
+				values = [None] * len(columns)
+				for ix, v in kept.items():
+					values[ix] = v
+				for ix, take, trans in takers:
+					# Always called, so the readers skip the unselected lines.
+					values[ix] = take(mask)
+					if trans:
+						values[ix] = imap(trans, values[ix])
+				yield izip(*values)
+				if first and len(selected) * 2 > lines:
+					yield unselected()
+					return
+				first = False
+		return chain.from_iterable(chunks())
+
+	@staticmethod
+	def new(columns, filenames, lines, minmax={}, filename=None, hashlabel=None, caption=None, previous=None, name='default', sketches={}):
 		"""columns = {"colname": "type"}, lines = [n, ...] or {sliceno: n}"""
 		columns = {uni(k): (uni(v[0]), bool(v[1])) if isinstance(v, tuple) else uni(v) for k, v in columns.items()}
 		if hashlabel:
@@ -697,7 +912,7 @@ class Dataset(unicode):
 		res = Dataset(_new_dataset_marker, name)
 		res._data.lines = list(Dataset._linefixup(lines))
 		res._data.hashlabel = hashlabel
-		res._append(columns, filenames, minmax, filename, caption, previous, None, name)
+		res._append(columns, filenames, minmax, filename, caption, previous, None, name, sketches)
 		return res
 
 	@staticmethod
@@ -709,7 +924,7 @@ class Dataset(unicode):
 		assert len(lines) == slices, "Lines must be specified for all slices"
 		return lines
 
-	def append(self, columns, filenames, lines, minmax={}, filename=None, hashlabel=None, hashlabel_override=False, caption=None, previous=None, column_filter=None, name='default'):
+	def append(self, columns, filenames, lines, minmax={}, filename=None, hashlabel=None, hashlabel_override=False, caption=None, previous=None, column_filter=None, name='default', sketches={}):
 		hashlabel = uni(hashlabel)
 		if hashlabel_override:
 			self._data.hashlabel = hashlabel
@@ -717,7 +932,7 @@ class Dataset(unicode):
 			assert self.hashlabel == hashlabel, 'Hashlabel mismatch %s != %s' % (self.hashlabel, hashlabel,)
 		assert self._linefixup(lines) == self.lines, "New columns don't have the same number of lines as parent columns"
 		columns = {uni(k): (uni(v[0]), bool(v[1])) if isinstance(v, tuple) else uni(v) for k, v in columns.items()}
-		self._append(columns, filenames, minmax, filename, caption, previous, column_filter, name)
+		self._append(columns, filenames, minmax, filename, caption, previous, column_filter, name, sketches)
 
 	def _minmax_merge(self, minmax):
 		def minmax_fixup(a, b):
@@ -736,7 +951,7 @@ class Dataset(unicode):
 					res[name] = [min(mm[0], omm[0]), max(mm[1], omm[1])]
 		return res
 
-	def _append(self, columns, filenames, minmax, filename, caption, previous, column_filter, name):
+	def _append(self, columns, filenames, minmax, filename, caption, previous, column_filter, name, sketches):
 		from accelerator.sourcedata import type2iter
 		from accelerator.g import job
 		name = uni(name)
@@ -758,6 +973,22 @@ class Dataset(unicode):
 			left_over = column_filter - set(filtered_columns)
 			assert not left_over, "Columns in filter not available in dataset: %r" % (left_over,)
 			self._data.columns = filtered_columns
+		all_sketches = {k: v for k, v in self._data.get('sketches', {}).items() if k in self._data.columns and k not in columns}
+		new_sketches = {}
+		for n in columns:
+			per_slice = [sketches.get(sliceno, {}).get(n) for sliceno in range(len(self.lines))]
+			if any(per_slice):
+				new_sketches[n] = per_slice
+		if new_sketches:
+			if not os.path.exists(self.name):
+				os.mkdir(self.name)
+			blob.save(new_sketches, self._name('sketches'), temp=False)
+			location = '%s/%s' % (job, self._name('sketches'),)
+			all_sketches.update((n, location) for n in new_sketches)
+		if all_sketches:
+			self._data.sketches = all_sketches
+		elif 'sketches' in self._data:
+			del self._data['sketches']
 		for n, (t, none_support) in sorted(columns.items()):
 			if t not in type2iter:
 				raise DatasetUsageError('Unknown type %s on column %s' % (t, n,))
@@ -778,11 +1009,12 @@ class Dataset(unicode):
 		self._save()
 
 	def _update_caches(self):
-		for k in ('cache', 'cache_distance',):
+		for k in ('cache', 'cache_distance', 'chain_summary',):
 			if k in self._data:
 				del self._data[k]
 		if self.previous:
 			d = Dataset(self.previous)
+			self._data['chain_summary'] = d._chain_summary()
 			cache_distance = d._data.get('cache_distance', 1) + 1
 			if cache_distance == 64:
 				cache_distance = 0
@@ -845,6 +1077,9 @@ _datasets_written = []
 
 _nodefault = object()
 
+# How many lines _iterate_selected looks at at a time.
+_SELECT_CHUNK = 64 * 1024
+
 class DatasetWriter(object):
 	"""
 	Create in prepare, use in analysis. Or do the whole thing in
@@ -903,11 +1138,15 @@ class DatasetWriter(object):
 	In this case you also need to call dw.set_lines(sliceno, count)
 	before finishing. You should also call
 	dw.set_minmax(sliceno, {colname: (min, max)}) if you can.
+	
+	Set sketches=True (or to a list of column names) to have the writers
+	also collect approximate distinct counts and quantiles (see
+	accelerator.sketch). This costs some time for each value written.
 	"""
 
 	_split = _split_dict = _split_list = _allwriters_ = None
 
-	def __new__(cls, columns={}, filename=None, hashlabel=None, hashlabel_override=False, caption=None, previous=None, name='default', parent=None, meta_only=False, for_single_slice=None):
+	def __new__(cls, columns={}, filename=None, hashlabel=None, hashlabel_override=False, caption=None, previous=None, name='default', parent=None, meta_only=False, for_single_slice=None, sketches=False):
 		"""columns can be {'name': 'type'} or {'name': ('type', none_support)}.
 		It can also be {'name': DatasetColumn} to simplify basing your dataset on another."""
 		name = uni(name)
@@ -916,7 +1155,7 @@ class DatasetWriter(object):
 		from accelerator.g import running
 		if running == 'analysis':
 			assert name in _datasetwriters, 'Dataset with name "%s" not created' % (name,)
-			assert not columns and not filename and not hashlabel and not caption and not parent and for_single_slice is None, "Don't specify any arguments (except optionally name) in analysis"
+			assert not columns and not filename and not hashlabel and not caption and not parent and for_single_slice is None and not sketches, "Don't specify any arguments (except optionally name) in analysis"
 			return _datasetwriters[name]
 		else:
 			assert name not in _datasetwriters, 'Duplicate dataset name "%s"' % (name,)
@@ -950,6 +1189,8 @@ class DatasetWriter(object):
 			obj._started = False
 			obj._lens = {}
 			obj._minmax = {}
+			obj._sketch_columns = sketches if sketches is True else set(uni(n) for n in sketches or ())
+			obj._sketches = {}
 			obj._order = []
 			for k, v in sorted(columns.items()):
 				if v is None:
@@ -1026,6 +1267,9 @@ class DatasetWriter(object):
 				self.hashcheck = w.hashcheck
 			else:
 				w = wt(fn, **kw)
+			if self._sketch_columns is True or (self._sketch_columns and colname in self._sketch_columns):
+				if hasattr(w, 'enable_sketch'): # not for json
+					w.enable_sketch()
 			writers[colname] = w
 		return writers
 
@@ -1148,14 +1392,21 @@ class DatasetWriter(object):
 	def _close(self, sliceno, writers):
 		lens = {}
 		minmax = {}
+		sketches = {}
 		for k, w in writers.items():
 			lens[k] = w.count
 			minmax[k] = (w.min, w.max,)
+			if self._sketch_columns:
+				sketch = getattr(w, 'sketch', None)
+				if sketch:
+					sketches[k] = sketch()
 			w.close()
 		len_set = set(lens.values())
 		assert len(len_set) == 1, "Not all columns have the same linecount in slice %d: %r" % (sliceno, lens)
 		self._lens[sliceno] = len_set.pop()
 		self._minmax[sliceno] = minmax
+		if sketches:
+			self._sketches[sliceno] = sketches
 
 	def close(self):
 		if self._started == 2:
@@ -1192,6 +1443,7 @@ class DatasetWriter(object):
 			filenames=self._clean_names,
 			lines=self._lens,
 			minmax=self._minmax,
+			sketches=self._sketches,
 			filename=self.filename,
 			hashlabel=self.hashlabel,
 			caption=self.caption,
@@ -1208,13 +1460,69 @@ class DatasetWriter(object):
 		_datasets_written.append(self.name)
 		return res
 
+def _summarise(summary, ds):
+	"""A new chain summary with ds added to summary (which can be None)"""
+	if not summary:
+		return dict(
+			length=1,
+			lines=list(ds.lines),
+			columns={n: (1, c.none_support, (c.min, c.max),) for n, c in ds.columns.items()},
+		)
+	lines = summary['lines']
+	if lines is not None:
+		if len(lines) == len(ds.lines):
+			lines = [a + b for a, b in zip(lines, ds.lines)]
+		else:
+			lines = None
+	columns = dict(summary['columns'])
+	for n, c in ds.columns.items():
+		count, none_support, minmax = columns.get(n, (0, False, (None, None),))
+		if minmax:
+			mn, mx = minmax
+			try:
+				if c.min is not None:
+					mn = c.min if mn is None else min(mn, c.min)
+				if c.max is not None:
+					mx = c.max if mx is None else max(mx, c.max)
+				minmax = (mn, mx,)
+			except TypeError:
+				minmax = None
+		columns[n] = (count + 1, none_support or c.none_support, minmax,)
+	return dict(length=summary['length'] + 1, lines=lines, columns=columns)
+
+def _out_of_range(summary, range_k, range_bottom, range_top):
+	"""True if no (non-empty) dataset in summary can have lines in range"""
+	if not summary:
+		return False
+	count, _, minmax = summary['columns'].get(range_k, (0, False, None,))
+	if count != summary['length'] or not minmax or minmax[0] is None:
+		return False
+	if range_top is not None and minmax[0] >= range_top:
+		return True
+	if range_bottom is not None and minmax[1] < range_bottom:
+		return True
+	return False
+
 class DatasetChain(_ListTypePreserver):
 	"""
 	These are lists of datasets returned from Dataset.chain.
 	They exist to provide some convenience methods on chains.
 	"""
 
+	def _summary(self):
+		"""The chain summary if this is (still) a whole chain from .chain"""
+		whole = getattr(self, '_whole', None)
+		if whole and whole[1] and list.__eq__(self, whole[0]):
+			return whole[1]
+
 	def _minmax(self, column, minmax):
+		summary = self._summary()
+		if summary:
+			c = summary['columns'].get(column)
+			if not c:
+				return None
+			if c[2]:
+				return c[2][minmax == 'max']
 		vl = []
 		for ds in self:
 			c = ds.columns.get(column)
@@ -1239,21 +1547,43 @@ class DatasetChain(_ListTypePreserver):
 		min/max tracking"""
 		return self._minmax(column, 'max')
 
+	def sketch(self, column):
+		"""Approximate distinct count and quantiles (an accelerator.sketch.Sketch)
+		for column over the whole chain. None unless all (non-empty)
+		datasets in the chain that contain column have sketches for it."""
+		res = None
+		for ds in self:
+			if column in ds.columns and sum(ds.lines):
+				s = ds.sketch(column)
+				if s is None:
+					return None
+				res = s if res is None else res.merge(s)
+		return res
+
 	def lines(self, sliceno=None):
 		"""Number of rows in this chain, optionally for a specific slice."""
 		if sliceno is None:
 			sel = sum
 		else:
 			sel = itemgetter(sliceno)
+		summary = self._summary()
+		if summary and summary['lines'] is not None:
+			return sel(summary['lines'])
 		return sum(sel(ds.lines) for ds in self)
 
 	def column_counts(self):
 		"""Counter {colname: occurances}"""
+		summary = self._summary()
+		if summary:
+			return Counter({n: c[0] for n, c in summary['columns'].items()})
 		from itertools import chain
 		return Counter(chain.from_iterable(ds.columns.keys() for ds in self))
 
 	def column_count(self, column):
 		"""How many datasets in this chain contain column"""
+		summary = self._summary()
+		if summary:
+			return summary['columns'].get(column, (0,))[0]
 		return sum(column in ds.columns for ds in self)
 
 	def with_column(self, column):
@@ -1262,6 +1592,9 @@ class DatasetChain(_ListTypePreserver):
 
 	def none_support(self, column):
 		"""If any dataset in the chain has None support for this column"""
+		summary = self._summary()
+		if summary:
+			return summary['columns'].get(column, (0, False,))[1]
 		return True in (ds.columns[column].none_support for ds in self if column in ds.columns)
 
 	def iterate(self, sliceno, columns=None, range=None, sloppy_range=False, hashlabel=None, pre_callback=None, post_callback=None, filters=None, translators=None, status_reporting=True, rehash=False):
@@ -1285,6 +1618,90 @@ def range_check_function(bottom, top):
 			return v >= bottom and v < top
 		return range_f
 
+def parse_value(coltype, text):
+	"""Parse text as a value for a column of type coltype
+	(like a dscat --range value or a dataset_filter condition)"""
+	from datetime import datetime, date, time
+	if not text:
+		return None
+	if coltype in ('int64', 'int32', 'bits64', 'bits32',):
+		return int(text)
+	if coltype in ('float64', 'float32',):
+		return float(text)
+	if coltype == 'number':
+		try:
+			return int(text)
+		except ValueError:
+			return float(text)
+	if coltype in ('unicode', 'ascii', 'bytes',):
+		# Unchanged, but as the type the column gives.
+		if coltype == 'bytes' or (coltype == 'ascii' and not PY3):
+			if isinstance(text, unicode):
+				text = text.encode('utf-8', 'surrogateescape' if PY3 else 'strict')
+		elif isinstance(text, bytes):
+			text = text.decode('utf-8')
+		return text
+	if coltype == 'time':
+		formats, cls = ('%H:%M:%S', '%H:%M:%S.%f',), time
+	elif coltype == 'date':
+		formats, cls = ('%Y-%m-%d',), date
+	elif coltype == 'datetime':
+		formats, cls = ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S.%f',), datetime
+	else:
+		raise ValueError("Can't parse values for %s columns" % (coltype,))
+	for fmt in formats:
+		try:
+			v = datetime.strptime(text, fmt)
+		except ValueError:
+			continue
+		if cls is time:
+			return v.time()
+		if cls is date:
+			return v.date()
+		return v
+	raise ValueError("Can't parse %r as %s" % (text, coltype,))
+
+def writers_like(datasets, jobid, previous=None):
+	"""DatasetWriters for copies of datasets, chained after previous.
+	The last one is named default and the others are numbered. They have
+	the columns, hashlabel, caption, filename and sketched columns of the
+	dataset they copy."""
+	dws = []
+	for ix, ds in enumerate(datasets):
+		name = 'default' if ix == len(datasets) - 1 else str(ix)
+		sketches = ds._data.get('sketches', {})
+		dw = DatasetWriter(
+			name=name,
+			caption=ds.caption,
+			hashlabel=ds.hashlabel,
+			filename=ds.filename,
+			previous=previous,
+			sketches=[n for n in ds.columns if n in sketches],
+		)
+		for n, c in ds.columns.items():
+			dw.add(n, c.type, none_support=c.none_support)
+		previous = (jobid, name)
+		dws.append(dw)
+	return dws
+
+def column_copier(ds, dw, name):
+	"""(function to open readers, copy function) for copying column name
+	from ds to dw as it is stored. The first is called like
+	ds._column_iterator without the column, the second like gzutil.copy
+	without the writer (and also works for JSON)."""
+	from accelerator import gzutil
+	w = dw.writers[name]
+	if ds.columns[name].backing_type == 'json':
+		_type = 'unicode' if PY3 else 'bytes'
+		copy = w.copy
+	else:
+		_type = None
+		def copy(reader, mask, **kw):
+			return gzutil.copy(reader, w, mask, **kw)
+	def mkreader(sliceno, **kw):
+		return ds._column_iterator(sliceno, name, _type=_type, **kw)
+	return mkreader, copy
+
 class SkipJob(Exception):
 	"""Raise this in pre_callback to skip iterating the coming job
 	(or the remaining slices of it)"""
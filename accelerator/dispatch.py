@@ -98,15 +98,20 @@ def launch(workdir, setup, config, Methods, active_workdirs, slices, debug, daem
 		daemon_url=daemon_url,
 		subjob_cookie=subjob_cookie,
 		parent_pid=parent_pid,
+		method=method,
 	)
 	from accelerator.runner import runners
 	runner = runners[Methods.db[method].version]
 	child, prof_r = runner.launch_start(args)
+	if child is None:
+		# Not started, prof_r is why (like the source changing since it was loaded).
+		print('%s| %s [%s]  failed!    (%5.1fs) |' % (print_prefix, jobid, method, time.time() -  starttime))
+		raise JobError(jobid, method, {'launcher': prof_r})
 	# There's a race where if we get interrupted right after fork this is not recorded
 	# (the launched job could continue running)
 	try:
 		children.add(child)
-		status, data = runner.launch_finish(child, prof_r, workdir, jobid, method)
+		status, data = runner.launch_finish(child, prof_r, workdir, jobid)
 		if status:
 			os.killpg(child, SIGTERM) # give it a chance to exit gracefully
 			# The dying process won't have sent an end message, so it has
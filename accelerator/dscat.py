@@ -0,0 +1,184 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+# print the contents of a dataset(chain)
+
+from __future__ import division, print_function
+
+import sys
+import errno
+from argparse import ArgumentParser
+
+from accelerator.compat import PY3
+from accelerator.dscmdhelper import name2ds, parallel_output, Output
+from accelerator.dataset import range_check_function, parse_value
+from accelerator import g
+from accelerator import gzutil
+
+FORMATS = dict(
+	tsv=dict(separator='\t'),
+	csv=dict(separator=',', quote='"'),
+	json={},
+)
+
+def main(argv):
+	usage = "%(prog)s [options] ds [ds [...]] [column [column [...]]"
+	parser = ArgumentParser(usage=usage, prog=argv.pop(0))
+	parser.add_argument('-c', '--chain',      dest="chain",      action='store_true', help="Follow dataset chains", )
+	parser.add_argument('-f', '--format',     dest="format",     default='tsv', choices=sorted(FORMATS), help="Output format (json is one object per line), default tsv", )
+	parser.add_argument('-H', '--header',     dest="header",     action='store_true', help="Start with a line of column names (tsv and csv)", )
+	parser.add_argument('-s', '--slice',      dest="slice",      action='append',     help="Print this slice only. Can be specified multiple times.", type=int)
+	parser.add_argument('-R', '--roundrobin', dest="roundrobin", action='store_true', help="Output in roundrobin order (like iterate with sliceno=\"roundrobin\")", )
+	parser.add_argument('-r', '--range',      dest="range",                           help="Only lines where START <= COLUMN < STOP (either can be left out)", metavar="COLUMN=START:STOP")
+	parser.add_argument('-n', '--limit',      dest="limit",                           help="Stop after this many lines", type=int, metavar="NUM")
+	parser.add_argument('dataset')
+	parser.add_argument('columns', nargs='*', default=[])
+	args = parser.parse_args(argv)
+
+	datasets = [name2ds(args.dataset)]
+	columns = []
+
+	for ds_or_col in args.columns:
+		if columns:
+			columns.append(ds_or_col)
+		else:
+			try:
+				datasets.append(name2ds(ds_or_col))
+			except Exception:
+				columns.append(ds_or_col)
+
+	if args.chain:
+		datasets = [ds for chain_end in datasets for ds in chain_end.chain()]
+	columns = columns or sorted(datasets[0].columns)
+	for ds in datasets:
+		missing = set(columns) - set(ds.columns)
+		if missing:
+			print('Columns %s not found in %s' % (', '.join(sorted(missing)), ds,), file=sys.stderr)
+			return 1
+
+	range_check = None
+	if args.range:
+		try:
+			range_column, range_values = args.range.split('=', 1)
+			range_bottom, range_top = range_values.split(':', 1)
+			if range_column not in datasets[0].columns:
+				raise ValueError("Column %s not found" % (range_column,))
+			coltype = datasets[0].columns[range_column].type
+			range_bottom = parse_value(coltype, range_bottom)
+			range_top = parse_value(coltype, range_top)
+		except ValueError as e:
+			print('Bad --range %r: %s' % (args.range, e,), file=sys.stderr)
+			return 1
+		if range_bottom is not None or range_top is not None:
+			range_check = range_check_function(range_bottom, range_top)
+
+	# json columns are read as the JSON text, which is inserted as it is
+	# in json output and is a text field like any other in tsv and csv.
+	json_columns = [ix for ix, name in enumerate(columns) if datasets[0].columns[name].type == 'json']
+	fmt = dict(FORMATS[args.format])
+	raw_columns = []
+	if args.format == 'json':
+		fmt['names'] = columns
+		raw_columns = json_columns
+
+	def readers(ds, sliceno):
+		types = dict.fromkeys((columns[ix] for ix in json_columns), 'unicode' if PY3 else 'bytes')
+		return [ds._column_iterator(sliceno, name, _type=types.get(name)) for name in columns]
+
+	def mask(ds, sliceno):
+		"""None if all lines are in range, a bytearray if some are, and False
+		if none are. (Like iterate, this uses the min/max of the dataset to
+		avoid looking at the values when possible.)"""
+		if not range_check:
+			return None
+		c = ds.columns[range_column]
+		if c.min is not None:
+			if range_top is not None and c.min >= range_top:
+				return False
+			if range_bottom is not None and c.max < range_bottom:
+				return False
+			if range_check(c.min) and range_check(c.max):
+				return None
+		elif c.type not in ('unicode', 'ascii', 'bytes',):
+			# No min/max because there are only None values.
+			return False
+		in_range = lambda v: v is not None and range_check(v)
+		return bytearray(map(in_range, ds._column_iterator(sliceno, range_column)))
+
+	def groups(tasks):
+		"""readers and masks for the tasks (leaving out those with nothing to print)"""
+		res = []
+		masks = []
+		for ds, sliceno in tasks:
+			if not ds.lines[sliceno]:
+				continue
+			m = mask(ds, sliceno)
+			if m is not False:
+				res.append(readers(ds, sliceno))
+				masks.append(m)
+		return res, masks
+
+	def formatted(groups, masks, max_lines=-1):
+		"""Yields (data, lines) in chunks until max_lines lines are done"""
+		while groups and max_lines:
+			data, lines = gzutil.format_lines(groups, raw_columns=raw_columns, masks=masks, max_lines=max_lines, **fmt)
+			if not lines:
+				return
+			yield data, lines
+			if max_lines > 0:
+				max_lines -= lines
+
+	want_slices = sorted(set(args.slice)) if args.slice else range(g.slices)
+	tasks = [(ds, sliceno) for ds in datasets for sliceno in want_slices]
+
+	if args.header and args.format != 'json':
+		header, _ = gzutil.format_lines([[iter([name]) for name in columns]], **fmt)
+		out = Output(1)
+		out.add(header)
+		out.flush()
+
+	if args.limit is None and not args.roundrobin:
+		# Each slice is formatted in a worker, and written in slice order.
+		def produce(task):
+			for data, _ in formatted(*groups([task])):
+				yield 0, data
+		return parallel_output(tasks, produce, 'slice')
+
+	# Round robin has to be done with all slices at once, and a limit
+	# is quickest done without starting any workers.
+	if args.roundrobin:
+		per_ds = len(want_slices)
+		parts = [tasks[start:start + per_ds] for start in range(0, len(tasks), per_ds)]
+	else:
+		parts = [[task] for task in tasks]
+	left = -1 if args.limit is None else args.limit
+	out = Output(1)
+	try:
+		for part in parts:
+			if not left:
+				break
+			for data, lines in formatted(*groups(part), max_lines=left):
+				out.add(data)
+				if left > 0:
+					left -= lines
+		out.flush()
+	except KeyboardInterrupt:
+		print()
+	except (IOError, OSError) as e:
+		if e.errno != errno.EPIPE:
+			raise
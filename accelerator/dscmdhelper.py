@@ -22,7 +22,16 @@
 
 from __future__ import division, print_function
 
+import sys
+import errno
+from os import write, read, pipe, close
 from os.path import join, exists, realpath
+from multiprocessing import Process
+from itertools import chain
+from collections import deque
+from heapq import merge
+from select import select
+from struct import Struct
 
 from accelerator.job import WORKDIRS
 from accelerator.dataset import Dataset
@@ -56,3 +65,186 @@ def name2ds(n):
 	else:
 		g.slices = slices
 	return ds
+
+# How much output to collect before writing it.
+OUTPUT_BUFFER = 1024 * 1024
+# Output is sent from the workers to the main process as
+# (task index, line number, size) followed by the data.
+# Line number -1 (and no data) means the task is done.
+HEADER = Struct('<IqI')
+
+class WorkerFailed(Exception):
+	pass
+
+class Output(object):
+	"""Collects data to write to fd in large writes"""
+
+	def __init__(self, fd):
+		self.fd = fd
+		self.parts = []
+		self.size = 0
+
+	def add(self, data):
+		self.parts.append(data)
+		self.size += len(data)
+		if self.size >= OUTPUT_BUFFER:
+			self.flush()
+
+	def flush(self):
+		if not self.parts:
+			return
+		data = memoryview(b''.join(self.parts))
+		self.parts = []
+		self.size = 0
+		while data:
+			data = data[write(self.fd, data):]
+
+def parallel_output(tasks, produce, order=None, group_size=1, max_count=None):
+	"""Run produce(task) for all tasks in (up to slices) worker processes
+	and write what they produce to stdout.
+
+	produce is a generator of (lineno, data), or None when it is a good
+	time to send what it has so far to the main process.
+
+	order can be None (whatever comes first), "slice" (task order) or
+	"roundrobin" (task order for each group of group_size tasks, but
+	merged on lineno). Ordered output is kept in memory until it can be
+	written.
+
+	max_count stops after that many items.
+
+	Returns 1 if a worker failed."""
+
+	from accelerator import g
+
+	if max_count is not None and max_count < 1:
+		return
+
+	def one_process(todo, fd):
+		out = Output(fd)
+		count = 0
+		try:
+			for taskix in todo:
+				for item in produce(tasks[taskix]):
+					if item is None:
+						out.flush()
+						continue
+					lineno, data = item
+					out.add(HEADER.pack(taskix, lineno, len(data)) + data)
+					count += 1
+					if count == max_count:
+						# No more items from this process can be needed.
+						break
+				out.add(HEADER.pack(taskix, -1, 0))
+				out.flush()
+				if count == max_count:
+					break
+		except KeyboardInterrupt:
+			return
+		except (IOError, OSError) as e:
+			if e.errno == errno.EPIPE:
+				return
+			else:
+				raise
+
+	if order:
+		queues = [deque() for _ in tasks]
+	else:
+		# Unordered, so everything can go in the same queue.
+		queues = [deque()] * len(tasks)
+	finished = [False] * len(tasks)
+	unparsed = {}
+	workers = {}
+
+	def receive():
+		"""Read whatever the workers have sent (waiting if nothing has been
+		sent yet) into queues"""
+		out.flush()
+		ready, _, _ = select(list(unparsed), [], [])
+		for fd in ready:
+			data = read(fd, OUTPUT_BUFFER)
+			if not data:
+				close(fd)
+				del unparsed[fd]
+				p, todo = workers.pop(fd)
+				p.join()
+				if p.exitcode:
+					raise WorkerFailed(p.name)
+				# It may have stopped early because of max_count,
+				# in which case the rest of its tasks are not needed.
+				for taskix in todo:
+					finished[taskix] = True
+				continue
+			data = unparsed[fd] + data
+			pos = 0
+			while len(data) - pos >= HEADER.size:
+				taskix, lineno, size = HEADER.unpack_from(data, pos)
+				end = pos + HEADER.size + size
+				if end > len(data):
+					break
+				if lineno == -1:
+					finished[taskix] = True
+				else:
+					queues[taskix].append((lineno, taskix, data[pos + HEADER.size:end]))
+				pos = end
+			unparsed[fd] = data[pos:]
+
+	def task_items(taskix):
+		q = queues[taskix]
+		while True:
+			while q:
+				yield q.popleft()
+			if finished[taskix]:
+				return
+			receive()
+
+	def all_items():
+		while unparsed:
+			receive()
+			q = queues[0]
+			while q:
+				yield q.popleft()
+
+	if order == 'roundrobin':
+		items = chain.from_iterable(
+			merge(*[task_items(taskix) for taskix in range(start, min(start + group_size, len(tasks)))])
+			for start in range(0, len(tasks), group_size)
+		)
+	elif order == 'slice':
+		items = chain.from_iterable(task_items(taskix) for taskix in range(len(tasks)))
+	else:
+		items = all_items()
+
+	out = Output(1)
+	children = []
+	try:
+		process_count = min(len(tasks), g.slices)
+		for ix in range(process_count):
+			todo = range(ix, len(tasks), process_count)
+			rfd, wfd = pipe()
+			p = Process(target=one_process, args=(todo, wfd,), name='worker-%d' % (ix,))
+			p.start()
+			close(wfd)
+			unparsed[rfd] = b''
+			workers[rfd] = (p, todo)
+			children.append(p)
+		count = 0
+		for _, _, data in items:
+			out.add(data)
+			count += 1
+			if count == max_count:
+				break
+		out.flush()
+	except KeyboardInterrupt:
+		print()
+	except WorkerFailed as e:
+		print("%s failed" % (e,), file=sys.stderr)
+		return 1
+	except (IOError, OSError) as e:
+		if e.errno != errno.EPIPE:
+			raise
+	finally:
+		for p in children:
+			if p.is_alive():
+				p.terminate()
+			p.join()
@@ -24,13 +24,21 @@ from __future__ import division, print_function
 import sys
 import re
 from argparse import ArgumentParser
-from multiprocessing import Process
-import errno
-from os import write
+from itertools import islice
 
-from accelerator.compat import unicode
-from accelerator.dscmdhelper import name2ds
+from accelerator.compat import unicode, imap, izip, PY2
+from accelerator.dscmdhelper import name2ds, parallel_output
 from accelerator import g
+from accelerator import gzutil
+
+# How many lines (at most) to search before printing the matches.
+CHUNK_LINES = 256 * 1024
+text_readers = (gzutil.GzBytes, gzutil.GzAscii, gzutil.GzUnicode)
+
+def find(matched, value, start):
+	"""The next position in matched (from start) that is value, or the end"""
+	pos = matched.find(b'\x01' if value else b'\x00', start)
+	return len(matched) if pos == -1 else pos
 
 def main(argv):
 	usage = "%(prog)s [options] pattern ds [ds [...]] [column [column [...]]"
@@ -38,6 +46,10 @@ def main(argv):
 	parser.add_argument('-c', '--chain',       dest="chain",      action='store_true', help="Follow dataset chains", )
 	parser.add_argument('-i', '--ignore-case', dest="ignorecase", action='store_true', help="Case insensitive pattern", )
 	parser.add_argument('-s', '--slice',       dest="slice",      action='append',     help="Grep this slice only. Can be specified multiple times.",  type=int)
+	parser.add_argument('-g', '--grep',        dest="grep",       action='append',     help="Grep this column only (default is the printed columns). Can be specified multiple times.", metavar="COLUMN")
+	parser.add_argument('-o', '--ordered',     dest="ordered",    action='store_true', help="Output in slice order (like iterate with sliceno=None)", )
+	parser.add_argument('-R', '--roundrobin',  dest="roundrobin", action='store_true', help="Output in roundrobin order (like iterate with sliceno=\"roundrobin\")", )
+	parser.add_argument('-m', '--max-count',   dest="max_count",                       help="Stop after this many matching lines", type=int, metavar="NUM")
 	parser.add_argument('pattern')
 	parser.add_argument('dataset')
 	parser.add_argument('columns', nargs='*', default=[])
@@ -45,6 +57,14 @@ def main(argv):
 
 	pat_s = re.compile(args.pattern                , re.IGNORECASE if args.ignorecase else 0)
 	pat_b = re.compile(args.pattern.encode('utf-8'), re.IGNORECASE if args.ignorecase else 0)
+	# A pattern without special characters can be found directly in the
+	# (utf-8) file data of text columns, without making any objects.
+	if args.ignorecase or re.escape(args.pattern) != args.pattern:
+		needle = None
+	else:
+		needle = args.pattern.encode('utf-8')
+	# None in a text column is searched as "None", like everything else.
+	none_match = bool(pat_s.search('None'))
 	datasets = [name2ds(args.dataset)]
 	columns = []
 	
@@ -61,53 +81,95 @@ def main(argv):
 		parser.print_help(file=sys.stderr)
 		return 1
 	
-	def grep(lines):
-		chk_b = pat_b.search
-		chk_s = pat_s.search
-		def match(items):
-			for item in items:
-				if isinstance(item, bytes):
-					if chk_b(item):
-						return True
-				else:
-					if chk_s(str(item)):
-						return True
-		def fmt(v):
-			if not isinstance(v, (unicode, bytes)):
-				v = str(v)
-			if isinstance(v, unicode):
-				v = v.encode('utf-8', 'replace')
-			return v
-		for items in lines:
-			if match(items):
-				# This will be atomic if the line is not too long
-				# (at least up to PIPE_BUF bytes, should be at least 512).
-				write(1, b'\t'.join(map(fmt, items)) + b'\n')
+	if args.chain:
+		datasets = [ds for chain_end in datasets for ds in chain_end.chain()]
+	for ds in datasets:
+		missing = set(columns + (args.grep or [])) - set(ds.columns)
+		if missing:
+			print('Columns %s not found in %s' % (', '.join(sorted(missing)), ds,), file=sys.stderr)
+			return 1
+	
+	chk_b = pat_b.search
+	chk_s = pat_s.search
+	
+	def fmt(v):
+		if not isinstance(v, (unicode, bytes)):
+			v = str(v)
+		if isinstance(v, unicode):
+			v = v.encode('utf-8', 'replace')
+		return v
 	
-	def one_slice(sliceno):
-		try:
-			for ds in datasets:
-				if args.chain:
-					f = ds.iterate_chain
+	def search_column(it, matched):
+		"""Set matched[ix] for the next len(matched) values in it that match"""
+		if isinstance(it, text_readers):
+			if needle is not None:
+				gzutil.grep(it, matched, needle, None, none_match)
+			else:
+				if isinstance(it, gzutil.GzBytes) or (PY2 and isinstance(it, gzutil.GzAscii)):
+					search = chk_b
 				else:
-					f = ds.iterate
-				grep(f(sliceno, columns))
-		except KeyboardInterrupt:
+					search = chk_s
+				gzutil.grep(it, matched, None, search, none_match)
+		else:
+			# Other readers never give bytes. Only the lines that have
+			# not already matched are searched.
+			pos = 0
+			while pos < len(matched):
+				start = find(matched, 0, pos)
+				if start > pos:
+					it.skip(start - pos)
+				end = find(matched, 1, start)
+				found = imap(chk_s, imap(str, islice(it, end - start)))
+				for ix, hit in enumerate(found, start):
+					if hit:
+						matched[ix] = 1
+				pos = end
+	
+	def grep(ds, sliceno):
+		"""Yields (lineno, line) for matching lines, and None after each
+		chunk of lines"""
+		lines = ds.lines[sliceno]
+		if not lines:
 			return
-		except IOError as e:
-			if e.errno == errno.EPIPE:
-				return
-			else:
-				raise
+		print_columns = columns or sorted(ds.columns)
+		grep_columns = args.grep or print_columns
+		# The searched columns are read first, and then only the
+		# matching lines are read (the others skipped) from the
+		# printed columns.
+		grep_its = [ds._column_iterator(sliceno, col) for col in grep_columns]
+		# Text columns are faster to search, so do them first.
+		grep_its.sort(key=lambda it: not isinstance(it, text_readers))
+		print_its = [ds._column_iterator(sliceno, col) for col in print_columns]
+		done = 0
+		# Start with small chunks so the first matches show up quickly.
+		chunk_lines = 1024
+		while done < lines:
+			matched = bytearray(min(chunk_lines, lines - done))
+			chunk_lines = min(chunk_lines * 4, CHUNK_LINES)
+			for it in grep_its:
+				search_column(it, matched)
+			pos = 0
+			while pos < len(matched):
+				start = find(matched, 1, pos)
+				if start > pos:
+					for it in print_its:
+						it.skip(start - pos)
+				end = find(matched, 0, start)
+				lines_it = islice(izip(*print_its), end - start)
+				for lineno, items in enumerate(lines_it, done + start):
+					yield lineno, b'\t'.join(map(fmt, items)) + b'\n'
+				pos = end
+			done += len(matched)
+			yield None
 	
-	try:
-		children = []
-		want_slices = set(args.slice) if args.slice else range(g.slices)
-		for sliceno in want_slices:
-			p = Process(target=one_slice, args=(sliceno,), name='slice-%d' % (sliceno,))
-			p.start()
-			children.append(p)
-		for p in children:
-			p.join()
-	except KeyboardInterrupt:
-		print()
+	want_slices = sorted(set(args.slice)) if args.slice else range(g.slices)
+	# Each (dataset, slice) is a separate task, so a chain is searched
+	# in parallel even when only one slice is wanted.
+	tasks = [(ds, sliceno) for ds in datasets for sliceno in want_slices]
+	if args.roundrobin:
+		order = 'roundrobin'
+	elif args.ordered:
+		order = 'slice'
+	else:
+		order = None
+	return parallel_output(tasks, lambda task: grep(*task), order, len(want_slices), args.max_count)
@@ -162,14 +162,21 @@ def main(argv):
 			name2typ = {n: c.type + '+None' if c.none_support else c.type for n, c in ds.columns.items()}
 			len_n, len_t = colwidth((quote(n), name2typ[n]) for n, c in ds.columns.items())
 			template = "{2} {0:%d}  {1:%d} " % (len_n, len_t,)
+			if args.chainedslices or args.chain:
+				chain = ds.chain()
 			for n, c in sorted(ds.columns.items()):
 				if args.chainedslices or args.chain:
-					chain = ds.chain()
 					minval, maxval = chain.min(n), chain.max(n)
+					sketch = chain.sketch(n)
 				else:
 					minval, maxval = c.min, c.max
+					sketch = ds.sketch(n)
 				hashdot = "\x1b[1m*\x1b[m" if n == ds.hashlabel else " "
-				print(' ' * 8 + template.format(quote(n), name2typ[n], hashdot), prettyminmax(minval, maxval))
+				if sketch:
+					distinct = "  ~{0:n} distinct".format(sketch.distinct())
+				else:
+					distinct = ""
+				print(' ' * 8 + template.format(quote(n), name2typ[n], hashdot), prettyminmax(minval, maxval) + distinct)
 			print("    {0:n} columns".format(len(ds.columns)))
 		print("    {0:n} lines".format(sum(ds.lines)))
 
@@ -24,6 +24,7 @@ from __future__ import division
 import os
 import datetime
 import json
+import struct
 from traceback import print_exc
 from collections import OrderedDict
 import sys
@@ -232,10 +233,192 @@ class FileWriteMove(object):
 			except Exception:
 				print_exc()
 
+# Segments with zero-copy results in them, these must stay mapped.
+_shm_segments = []
+
+def shm_save(variable):
+	"""Pickle variable into a new shared memory segment.
+	Returns a description to pass to shm_attach (in another process),
+	or None if shared memory is not available (python < 3.8) or there
+	was not enough space for this variable.
+
+	Contiguous buffers (like arrays) are stored out of band (pickle
+	protocol 5), so the loading side gets them without copying.
+	"""
+	try:
+		from multiprocessing import shared_memory, resource_tracker
+	except ImportError:
+		return None
+	buffers = []
+	def buffer_callback(buf):
+		try:
+			buffers.append(buf.raw())
+			return False
+		except BufferError: # not contiguous, keep it in the pickle
+			return True
+	data = pickle.dumps(variable, 5, buffer_callback=buffer_callback)
+	layout = []
+	pos = 0
+	for part in [memoryview(data)] + buffers:
+		layout.append((pos, part.nbytes,))
+		pos += (part.nbytes + 63) & ~63 # keep buffers nicely aligned
+	try:
+		shm = shared_memory.SharedMemory(create=True, size=max(pos, 1))
+	except OSError:
+		return None
+	try:
+		# Reserve the memory now. Otherwise running out of space in the
+		# shm filesystem would kill us with SIGBUS while copying.
+		if hasattr(os, 'posix_fallocate'):
+			os.posix_fallocate(shm._fd, 0, max(pos, 1))
+		for (start, size), part in zip(layout, [memoryview(data)] + buffers):
+			shm.buf[start:start + size] = part
+	except OSError:
+		shm.close()
+		shm.unlink()
+		return None
+	# The receiving process takes over responsibility for unlinking this.
+	resource_tracker.unregister(shm._name, 'shared_memory')
+	shm.close()
+	return shm.name, layout
+
+def shm_attach(desc):
+	"""Attach to a segment from shm_save and unlink it, so it goes away
+	when it is no longer mapped (even if we crash). Returns what you
+	pass to shm_load."""
+	from multiprocessing import shared_memory
+	name, layout = desc
+	shm = shared_memory.SharedMemory(name)
+	shm.unlink()
+	return shm, layout
+
+def shm_load(attached):
+	"""Unpickle the variable in a segment from shm_attach."""
+	shm, layout = attached
+	parts = [shm.buf[start:start + size] for start, size in layout]
+	res = pickle.loads(parts[0], buffers=parts[1:])
+	if len(parts) == 1:
+		parts[0].release()
+		shm.close()
+	else:
+		_shm_segments.append(shm)
+	return res
+
+try:
+	from collections.abc import Mapping
+except ImportError:
+	from collections import Mapping
+
+class SharedDict(Mapping):
+	"""Read-only dict kept in (anonymous) shared memory.
+
+	Use this for big lookup tables in prepare_res. A normal dict gets
+	copied page by page into every analysis process as soon as its
+	contents are touched (reference counts are writes), so memory use
+	grows with the number of slices. A SharedDict is only ever read,
+	so all analysis processes use the same memory.
+
+	Keys and values must be picklable, and values are unpickled on
+	every lookup (so you get a new copy each time). Hashing uses the
+	normal python hash, so this is only usable in processes forked
+	from the one that created it (which is the case for prepare_res).
+	"""
+
+	_slot = struct.Struct('<qq') # hash, offset of record (-1 for empty)
+	_reclen = struct.Struct('<I')
+
+	def __init__(self, *a, **kw):
+		import mmap
+		src = dict(*a, **kw)
+		records = []
+		slots = []
+		pos = 0
+		for k, v in iteritems(src):
+			rec = pickle.dumps((k, v), pickle.HIGHEST_PROTOCOL)
+			records.append(self._reclen.pack(len(rec)))
+			records.append(rec)
+			slots.append((hash(k), pos,))
+			pos += self._reclen.size + len(rec)
+		del src
+		table_size = 16
+		while table_size < len(slots) * 2:
+			table_size *= 2
+		mask = table_size - 1
+		table = bytearray(b'\xff' * (table_size * self._slot.size))
+		for h, offset in slots:
+			ix = h & mask
+			while self._slot.unpack_from(table, ix * self._slot.size)[1] != -1:
+				ix = (ix + 1) & mask
+			self._slot.pack_into(table, ix * self._slot.size, h, offset)
+		self._data_start = len(table)
+		self._data_end = self._data_start + pos
+		self._mm = mmap.mmap(-1, max(self._data_end, 1))
+		self._mm.write(bytes(table))
+		del table
+		for rec in records:
+			self._mm.write(rec)
+		self._mask = mask
+		self._len = len(slots)
+
+	def _record(self, offset):
+		pos = self._data_start + offset
+		size, = self._reclen.unpack_from(self._mm, pos)
+		pos += self._reclen.size
+		return pickle.loads(self._mm[pos:pos + size])
+
+	def _lookup(self, key):
+		h = hash(key)
+		mask = self._mask
+		ix = h & mask
+		while True:
+			slot_h, offset = self._slot.unpack_from(self._mm, ix * self._slot.size)
+			if offset == -1:
+				return None
+			if slot_h == h:
+				k, v = self._record(offset)
+				if k == key:
+					return (v,)
+			ix = (ix + 1) & mask
+
+	def __getitem__(self, key):
+		found = self._lookup(key)
+		if found is None:
+			raise KeyError(key)
+		return found[0]
+
+	def __contains__(self, key):
+		return self._lookup(key) is not None
+
+	def __len__(self):
+		return self._len
+
+	def _iter_records(self):
+		pos = self._data_start
+		while pos < self._data_end:
+			size, = self._reclen.unpack_from(self._mm, pos)
+			pos += self._reclen.size
+			yield pickle.loads(self._mm[pos:pos + size])
+			pos += size
+
+	def __iter__(self):
+		return (k for k, v in self._iter_records())
+
+	def items(self):
+		return list(self._iter_records())
+
+	def iteritems(self):
+		return self._iter_records()
+
+	def __reduce__(self):
+		# The memory can't follow along, so this pickles as a normal dict.
+		return dict, (self.items(),)
+
 class ResultIter(object):
-	def __init__(self, slices):
+	def __init__(self, slices, shm_res={}):
+		self._slice_count = slices
 		slices = range(slices)
 		self._slices = iter(slices)
+		self._shm_res = shm_res
 		tuple_len = pickle_load("Analysis.tuple")
 		if tuple_len is False:
 			self._is_tupled = False
@@ -245,14 +428,27 @@ class ResultIter(object):
 			self._tupled = izip(*self._loaders)
 	def __iter__(self):
 		return self
+	def _load(self, name, ix, sliceno):
+		attached = self._shm_res.get(sliceno)
+		if attached and attached[ix]:
+			res = shm_load(attached[ix])
+			attached[ix] = None
+			return res
+		return pickle_load(name, sliceno=sliceno)
+	def _discard(self, ix):
+		# Release shared memory for results that were loaded elsewhere.
+		for attached in self._shm_res.values():
+			if attached[ix]:
+				attached[ix][0].close()
+				attached[ix] = None
 	def _loader(self, ix, slices):
 		for sliceno in slices:
-			yield pickle_load("Analysis.%d." % (ix,), sliceno=sliceno)
+			yield self._load("Analysis.%d." % (ix,), ix, sliceno)
 	def __next__(self):
 		if self._is_tupled:
 			return next(self._tupled)
 		else:
-			return pickle_load("Analysis.", sliceno=next(self._slices))
+			return self._load("Analysis.", 0, next(self._slices))
 	next = __next__
 
 class ResultIterMagic(object):
@@ -262,8 +458,8 @@ class ResultIterMagic(object):
 	it was a list.
 	"""
 
-	def __init__(self, slices, reuse_msg="Attempted to iterate past end of iterator.", exc=Exception):
-		self._inner = ResultIter(slices)
+	def __init__(self, slices, reuse_msg="Attempted to iterate past end of iterator.", exc=Exception, shm_res={}):
+		self._inner = ResultIter(slices, shm_res)
 		self._reuse_msg = reuse_msg
 		self._exc = exc
 		self._done = False
@@ -285,7 +481,7 @@ class ResultIterMagic(object):
 		return item
 	next = __next__
 
-	def merge_auto(self):
+	def merge_auto(self, parallel=False):
 		"""Merge values from iterator using magic.
 		Currenly supports data that has .update, .itervalues and .iteritems
 		methods.
@@ -293,15 +489,76 @@ class ResultIterMagic(object):
 		level, otherwise the value will be overwritten by later slices.
 		Don't try to use this if all your values don't have the same depth,
 		or if you have empty dicts at the last level.
+
+		With parallel=True the slices are merged pairwise in a pool of
+		processes (log2(slices) rounds), which is faster when merging is
+		expensive (large dicts/Counters). The result is the same.
 		"""
 		if self._started:
 			raise self._exc("Will not merge after iteration started")
+		if parallel:
+			inner = self._inner
+			self._started = self._done = True
+			self._inner = iter(())
+			if inner._is_tupled:
+				return (self._merge_auto_parallel(inner, ix) for ix in range(len(inner._loaders)))
+			else:
+				return self._merge_auto_parallel(inner, -1)
 		if self._inner._is_tupled:
 			return (self._merge_auto_single(it, ix) for ix, it in enumerate(self._inner._loaders))
 		else:
 			return self._merge_auto_single(self, -1)
 
-	def _merge_auto_single(self, it, ix):
+	def _merge_auto_parallel(self, inner, ix):
+		from accelerator.safe_pool import Pool
+		global _merge_state
+		parts = [('slice', sliceno) for sliceno in range(inner._slice_count)]
+		if len(parts) == 1:
+			return _merge_load(inner, ix, parts[0])
+		# Find the depth once, from the first non-empty slice like the
+		# sequential merge does, so all pairs merge at the same depth.
+		# The slices loaded here are not loaded again.
+		preloaded = {}
+		depth = None
+		for sliceno in range(inner._slice_count):
+			data = preloaded[sliceno] = _merge_load(inner, ix, ('slice', sliceno))
+			if sliceno == 0 and isinstance(data, num_types + (list,)):
+				break
+			if data:
+				depth = self._merge_depth(data, ix)
+				break
+		else:
+			# All were empty, return last one
+			return data
+		del data
+		filenames = []
+		# The workers are forked, so they find this (and can load the
+		# slice results, including attached shared memory) here.
+		_merge_state = (self, inner, ix, depth, preloaded)
+		pool = Pool(processes=len(parts) // 2)
+		try:
+			while len(parts) > 1:
+				pairs = []
+				for pos in range(0, len(parts) - 1, 2):
+					filename = os.path.abspath('Analysis.merge.%d.%d' % (ix, len(filenames),))
+					filenames.append(filename)
+					pairs.append((parts[pos:pos + 2], filename))
+				merged = pool.map(_merge_pair, pairs, chunksize=1)
+				if len(parts) % 2:
+					merged.append(parts[-1])
+				parts = merged
+			pool.close()
+			pool.join()
+			inner._discard(ix if inner._is_tupled else 0)
+			return _merge_load(inner, ix, parts[0])
+		finally:
+			pool.terminate()
+			_merge_state = None
+			for filename in filenames:
+				if os.path.exists(filename):
+					os.unlink(filename)
+
+	def _merge_auto_single(self, it, ix, depth=None):
 		# find a non-empty one, so we can look at the data in it
 		data = next(it)
 		if isinstance(data, num_types):
@@ -317,17 +574,8 @@ class ResultIterMagic(object):
 			except StopIteration:
 				# All were empty, return last one
 				return data
-		depth = 0
-		to_check = data
-		while hasattr(to_check, "values"):
-			if not to_check:
-				raise self._exc("Empty value at depth %d (index %d)" % (depth, ix,))
-			to_check = first_value(to_check)
-			depth += 1
-		if hasattr(to_check, "update"): # like a set
-			depth += 1
-		if not depth:
-			raise self._exc("Top level has no .values (index %d)" % (ix,))
+		if depth is None:
+			depth = self._merge_depth(data, ix)
 		def upd(aggregate, part, level):
 			if level == depth:
 				aggregate.update(part)
@@ -341,6 +589,54 @@ class ResultIterMagic(object):
 			upd(data, part, 1)
 		return data
 
+	def _merge_depth(self, data, ix):
+		depth = 0
+		to_check = data
+		while hasattr(to_check, "values"):
+			if not to_check:
+				raise self._exc("Empty value at depth %d (index %d)" % (depth, ix,))
+			to_check = first_value(to_check)
+			depth += 1
+		if hasattr(to_check, "update"): # like a set
+			depth += 1
+		if not depth:
+			raise self._exc("Top level has no .values (index %d)" % (ix,))
+		return depth
+
+# Helpers for ResultIterMagic._merge_auto_parallel.
+# Parts are ('slice', sliceno), ('shm', desc) or ('file', filename).
+
+_merge_state = None
+
+def _merge_load(inner, ix, part):
+	how, what = part
+	if how == 'slice':
+		if inner._is_tupled:
+			return inner._load("Analysis.%d." % (ix,), ix, what)
+		else:
+			return inner._load("Analysis.", 0, what)
+	elif how == 'shm':
+		return shm_load(shm_attach(what))
+	else:
+		res = pickle_load(what)
+		os.unlink(what)
+		return res
+
+def _merge_pair(args):
+	pair, filename = args
+	magic, inner, ix, depth, preloaded = _merge_state
+	def load(part):
+		if part[0] == 'slice' and part[1] in preloaded:
+			return preloaded[part[1]]
+		return _merge_load(inner, ix, part)
+	data = magic._merge_auto_single((load(part) for part in pair), ix, depth)
+	desc = shm_save(data)
+	if desc:
+		return 'shm', desc
+	with open(filename, 'wb') as fh:
+		pickle.dump(data, fh, pickle.HIGHEST_PROTOCOL)
+	return 'file', filename
+
 
 class DotDict(dict):
 	"""Like a dict, but with d.foo as well as d['foo'].
@@ -73,6 +73,12 @@ class GzWriteJson(object):
 	def write(self, o):
 		self.count += 1
 		self.fh.write(dumps(o, ensure_ascii=False, escape_forward_slashes=False))
+	def copy(self, reader, mask, **kw):
+		"""gzutil.copy for this, reader must give the stored JSON text
+		(a GzUnicode on python 3, GzBytes on python 2)."""
+		count = gzutil.copy(reader, self.fh, mask, **kw)
+		self.count += count
+		return count
 	def close(self):
 		self.fh.close()
 	def __enter__(self):
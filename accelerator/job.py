@@ -177,9 +177,9 @@ class CurrentJob(Job):
 		from accelerator.extras import json_save
 		json_save(obj, filename, sliceno, sort_keys=sort_keys, temp=temp)
 
-	def datasetwriter(self, columns={}, filename=None, hashlabel=None, hashlabel_override=False, caption=None, previous=None, name='default', parent=None, meta_only=False, for_single_slice=None):
+	def datasetwriter(self, columns={}, filename=None, hashlabel=None, hashlabel_override=False, caption=None, previous=None, name='default', parent=None, meta_only=False, for_single_slice=None, sketches=False):
 		from accelerator.dataset import DatasetWriter
-		return DatasetWriter(columns=columns, filename=filename, hashlabel=hashlabel, hashlabel_override=hashlabel_override, caption=caption, previous=previous, name=name, parent=parent, meta_only=meta_only, for_single_slice=for_single_slice)
+		return DatasetWriter(columns=columns, filename=filename, hashlabel=hashlabel, hashlabel_override=hashlabel_override, caption=caption, previous=previous, name=name, parent=parent, meta_only=meta_only, for_single_slice=for_single_slice, sketches=sketches)
 
 	def open(self, filename, mode='r', sliceno=None, encoding=None, errors=None, temp=None):
 		"""Mostly like standard open with sliceno and temp,
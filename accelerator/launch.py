@@ -24,6 +24,7 @@ from __future__ import division
 import os
 import signal
 import sys
+import gc
 from collections import defaultdict
 from struct import pack
 from importlib import import_module
@@ -34,7 +35,7 @@ import ctypes
 
 from accelerator.job import CurrentJob, WORKDIRS
 from accelerator.compat import pickle, iteritems, setproctitle, QueueEmpty, getarglist, open
-from accelerator.extras import job_params, ResultIterMagic
+from accelerator.extras import job_params, ResultIterMagic, shm_save, shm_attach
 from accelerator.build import JobError
 from accelerator import g
 from accelerator import blob
@@ -58,7 +59,30 @@ def c_fflush():
 	clib.fflush(None)
 
 
-def call_analysis(analysis_func, sliceno_, q, preserve_result, parent_pid, output_fds, **kw):
+def split_analysis_pieces(lines, slices):
+	"""Split each slice in pieces of about a quarter of an even slice
+	(but not tiny), so that processes that finish early can help out
+	with the big slices. Every slice gets at least one piece."""
+	size = max(sum(lines) // (slices * 4), 1000)
+	pieces = []
+	for sliceno, cnt in enumerate(lines):
+		start = 0
+		while True:
+			stop = min(start + size, cnt)
+			pieces.append((sliceno, (start, stop),))
+			start = stop
+			if start >= cnt:
+				break
+	return pieces
+
+def take_piece(pieces, next_piece):
+	with next_piece.get_lock():
+		ix = next_piece.value
+		next_piece.value = ix + 1
+	if ix < len(pieces):
+		return (ix,) + pieces[ix]
+
+def call_analysis(analysis_func, sliceno_, q, preserve_result, shm_result, parent_pid, output_fds, pieces, next_piece, **kw):
 	try:
 		# tell iowrapper our PID, so our output goes to the right status stack.
 		os.write(output_fds[sliceno_], pack("=Q", os.getpid()))
@@ -71,73 +95,107 @@ def call_analysis(analysis_func, sliceno_, q, preserve_result, parent_pid, outpu
 		status._start(slicename, parent_pid, 't')
 		setproctitle(slicename)
 		os.close(_prof_fd)
-		kw['sliceno'] = g.sliceno = sliceno_
-		for dw in dataset._datasetwriters.values():
-			if dw._for_single_slice is None:
-				dw._set_slice(sliceno_)
-		res = analysis_func(**kw)
-		if preserve_result:
-			# Remove defaultdicts until we find one with a picklable default_factory.
-			# (This is what you end up doing manually anyway.)
-			def picklable(v):
-				try:
-					pickle.dumps(v, pickle.HIGHEST_PROTOCOL)
-					return True
-				except Exception:
-					return False
-			def fixup(d):
-				if isinstance(d, defaultdict) and not picklable(d.default_factory):
-					if not d:
-						return {}
-					v = next(iteritems(d))
-					if isinstance(v, defaultdict) and not picklable(v.default_factory):
-						return {k: fixup(v) for k, v in iteritems(d)}
-					else:
-						return dict(d)
+		if pieces:
+			# Keep taking pieces until there are none left.
+			todo = iter(lambda: take_piece(pieces, next_piece), None)
+		else:
+			todo = [(sliceno_, sliceno_, None)]
+			for dw in dataset._datasetwriters.values():
+				if dw._for_single_slice is None:
+					dw._set_slice(sliceno_)
+		# Remove defaultdicts until we find one with a picklable default_factory.
+		# (This is what you end up doing manually anyway.)
+		def picklable(v):
+			try:
+				pickle.dumps(v, pickle.HIGHEST_PROTOCOL)
+				return True
+			except Exception:
+				return False
+		def fixup(d):
+			if isinstance(d, defaultdict) and not picklable(d.default_factory):
+				if not d:
+					return {}
+				v = next(iteritems(d))
+				if isinstance(v, defaultdict) and not picklable(v.default_factory):
+					return {k: fixup(v) for k, v in iteritems(d)}
 				else:
-					return d
+					return dict(d)
+			else:
+				return d
+		shm_res = {}
+		for res_ix, sliceno, rows in todo:
+			kw['sliceno'] = g.sliceno = sliceno
+			if 'rows' in kw:
+				kw['rows'] = g.rows = rows
+			res = analysis_func(**kw)
+			if not preserve_result:
+				continue
+			if shm_result:
+				shm_res[res_ix] = []
 			def save(item, name):
-				blob.save(fixup(item), name, sliceno=sliceno_, temp=True)
+				item = fixup(item)
+				if shm_result:
+					desc = shm_save(item)
+					shm_res[res_ix].append(desc)
+					if desc:
+						return
+				# No shared memory available (or no space), use a file.
+				blob.save(item, name, sliceno=res_ix, temp=True)
 			if isinstance(res, tuple):
-				if sliceno_ == 0:
+				if res_ix == 0:
 					blob.save(len(res), "Analysis.tuple", temp=True)
 				for ix, item in enumerate(res):
 					save(item, "Analysis.%d." % (ix,))
 			else:
-				if sliceno_ == 0:
+				if res_ix == 0:
 					blob.save(False, "Analysis.tuple", temp=True)
 				save(res, "Analysis.")
 		from accelerator.extras import saved_files
 		dw_lens = {}
 		dw_minmax = {}
+		dw_sketches = {}
 		for name, dw in dataset._datasetwriters.items():
 			if dw._for_single_slice in (None, sliceno_,):
 				dw.close()
 				dw_lens[name] = dw._lens
 				dw_minmax[name] = dw._minmax
+				dw_sketches[name] = dw._sketches
 		c_fflush()
-		q.put((sliceno_, time(), saved_files, dw_lens, dw_minmax, None,))
+		q.put((sliceno_, time(), saved_files, dw_lens, dw_minmax, dw_sketches, shm_res, None,))
 	except:
 		c_fflush()
-		q.put((sliceno_, time(), {}, {}, {}, fmt_tb(1),))
+		q.put((sliceno_, time(), {}, {}, {}, {}, {}, fmt_tb(1),))
 		print_exc()
 		sleep(5) # give launcher time to report error (and kill us)
 		exitfunction()
 
-def fork_analysis(slices, analysis_func, kw, preserve_result, output_fds):
-	from multiprocessing import Process, Queue
+def fork_analysis(slices, analysis_func, kw, preserve_result, shm_result, output_fds, pieces=None):
+	from multiprocessing import Process, Queue, Value
 	q = Queue()
 	children = []
 	t = time()
 	pid = os.getpid()
+	if pieces:
+		# One process per slice still, but they take pieces as they go.
+		next_piece = Value('l', 0)
+	else:
+		next_piece = None
+	if hasattr(gc, 'freeze'):
+		# Move everything (prepare_res in particular) out of the GC's view,
+		# so a collection in analysis doesn't write to (and copy) all pages
+		# with GC-tracked objects. (Only matters if the method enables GC.)
+		gc.freeze()
 	for i in range(slices):
-		p = Process(target=call_analysis, args=(analysis_func, i, q, preserve_result, pid, output_fds), kwargs=kw, name='analysis-%d' % (i,))
+		p = Process(target=call_analysis, args=(analysis_func, i, q, preserve_result, shm_result, pid, output_fds, pieces, next_piece), kwargs=kw, name='analysis-%d' % (i,))
 		p.start()
 		children.append(p)
+	if hasattr(gc, 'freeze'):
+		gc.unfreeze()
 	for fd in output_fds:
 		os.close(fd)
 	per_slice = []
 	temp_files = {}
+	shm_res = {}
 	no_children_no_messages = False
 	while len(per_slice) < slices:
 		still_alive = []
@@ -153,7 +211,7 @@ def fork_analysis(slices, analysis_func, kw, preserve_result, output_fds):
 		# No need to handle that very quickly though, 10 seconds is fine.
 		# (Typically this is caused by running out of memory.)
 		try:
-			s_no, s_t, s_temp_files, s_dw_lens, s_dw_minmax, s_tb = q.get(timeout=10)
+			s_no, s_t, s_temp_files, s_dw_lens, s_dw_minmax, s_dw_sketches, s_shm_res, s_tb = q.get(timeout=10)
 		except QueueEmpty:
 			if not children:
 				# No children left, so they must have all sent their messages.
@@ -169,15 +227,20 @@ def fork_analysis(slices, analysis_func, kw, preserve_result, output_fds):
 			exitfunction()
 		per_slice.append((s_no, s_t))
 		temp_files.update(s_temp_files)
+		for res_ix, descs in s_shm_res.items():
+			# Attach (and unlink) right away, so nothing is left behind if we fail.
+			shm_res[res_ix] = [shm_attach(desc) if desc else None for desc in descs]
 		for name, lens in s_dw_lens.items():
 			dataset._datasetwriters[name]._lens.update(lens)
 		for name, minmax in s_dw_minmax.items():
 			dataset._datasetwriters[name]._minmax.update(minmax)
+		for name, sketches in s_dw_sketches.items():
+			dataset._datasetwriters[name]._sketches.update(sketches)
 	g.update_top_status("Waiting for all slices to finish cleanup")
 	for p in children:
 		p.join()
 	if preserve_result:
-		res_seq = ResultIterMagic(slices, reuse_msg="analysis_res is an iterator, don't re-use it")
+		res_seq = ResultIterMagic(len(pieces) if pieces else slices, reuse_msg="analysis_res is an iterator, don't re-use it", shm_res=shm_res)
 	else:
 		res_seq = None
 	return [v - t for k, v in sorted(per_slice)], temp_files, res_seq
@@ -217,6 +280,7 @@ def execute_process(workdir, jobid, slices, result_directory, common_directory,
 	g.params = params = job_params()
 	method_ref = import_module(params.package+'.a_'+params.method)
 	g.sliceno = -1
+	g.rows = None
 
 	g.job = CurrentJob(jobid, params, result_directory, input_directory)
 	g.slices = slices
@@ -241,6 +305,20 @@ def execute_process(workdir, jobid, slices, result_directory, common_directory,
 	synthesis_func = getattr(method_ref, 'synthesis', dummy)
 
 	synthesis_needs_analysis = 'analysis_res' in getarglist(synthesis_func)
+	# Set analysis_res_shm = True in your method to pass analysis results
+	# to synthesis through shared memory instead of temp files (python 3.8+).
+	shm_result = synthesis_needs_analysis and getattr(method_ref, 'analysis_res_shm', False)
+	# Set split_analysis = 'source' (the name of one of your datasets) to
+	# have the slices of that dataset split in pieces which the analysis
+	# processes take as they become free. This evens things out when the
+	# slices are skewed. analysis gets the lines to handle as rows, to pass
+	# on to .iterate, and analysis_res gets one value per piece.
+	split_analysis = getattr(method_ref, 'split_analysis', None)
+	if split_analysis and analysis_func is not dummy and params.datasets[split_analysis]:
+		assert 'rows' in getarglist(analysis_func), "split_analysis needs analysis to take rows"
+		pieces = split_analysis_pieces(params.datasets[split_analysis].lines, slices)
+	else:
+		pieces = None
 
 	fd2pid, names, masters, slaves = iowrapper.setup(slices, prepare_func is not dummy, analysis_func is not dummy)
 	def switch_output():
@@ -295,7 +373,9 @@ def execute_process(workdir, jobid, slices, result_directory, common_directory,
 		g.subjob_cookie = None # subjobs are not allowed from analysis
 		with status.status('Waiting for all slices to finish analysis') as update:
 			g.update_top_status = update
-			prof['per_slice'], files, g.analysis_res = fork_analysis(slices, analysis_func, args_for(analysis_func), synthesis_needs_analysis, slaves)
+			if pieces:
+				assert not dataset._datasetwriters, "split_analysis can't be used when writing datasets in analysis"
+			prof['per_slice'], files, g.analysis_res = fork_analysis(slices, analysis_func, args_for(analysis_func), synthesis_needs_analysis, shm_result, slaves, pieces)
 			del g.update_top_status
 		prof['analysis'] = time() - t
 		saved_files.update(files)
@@ -30,7 +30,7 @@ from accelerator.compat import iteritems, itervalues, first_value
 from accelerator.compat import NoneType, unicode, long
 
 from accelerator.extras import DotDict, OptionString, OptionEnum, OptionDefault, RequiredOption
-from accelerator.runner import new_runners
+from accelerator.runner import new_runners, prune_load_cache
 from accelerator.setupfile import _sorted_set
 
 
@@ -114,6 +114,7 @@ class SubMethods(Methods):
 			failed.extend(f)
 			self.hash.update(h)
 			self.params.update(p)
+		prune_load_cache((val['package'], key) for key, val in iteritems(self.db))
 		for key, params in iteritems(self.params):
 			self.typing[key] = options2typing(key, params.options)
 			params.defaults = params2defaults(params)
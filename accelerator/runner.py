@@ -42,6 +42,8 @@ import resource
 import gc
 from threading import Thread, Lock
 
+# {method: (filename, depend_extra, sigs)}, method.tar.gz is built from
+# these files when a job is launched (before it is started).
 archives = {}
 
 def mod2filename(mod):
@@ -65,19 +67,34 @@ def path_prefix(paths):
 	prefix = prefix.rsplit('/', 1)[0] + '/'
 	return prefix
 
-def load_methods(all_packages, data):
-	from accelerator.compat import str_types, iteritems
+def file_sig(filename):
+	st = os.stat(filename)
+	return (filename, st.st_mtime, st.st_size, st.st_ino,)
+
+def sigs_digest(sigs):
+	# The daemon might be another python version, so it only gets a digest
+	# (the filenames could be non-ascii py2 strs).
+	return hashlib.sha1(repr(sigs).encode('utf-8')).hexdigest()
+
+# The runner is restarted on every reload, so this cache is kept in the
+# daemon and passed along with the load request. It is
+# {(package, key): (sigs_digest, hashes, warnings)}, where the digest is
+# of a file_sig for each file that went into the hash.
+_load_cache = {}
+
+def prune_load_cache(keep):
+	"""Forget cached methods that are not in keep (of (package, key))."""
+	for k in set(_load_cache) - set(keep):
+		del _load_cache[k]
+
+def load_methods(all_packages, data, cache={}):
+	from accelerator.compat import str_types
 	from accelerator.extras import DotDict
 	res_warnings = []
 	res_failed = []
 	res_hashes = {}
 	res_params = {}
-	def tar_add(name, data):
-		assert name.startswith(dep_prefix)
-		info = tarfile.TarInfo()
-		info.name = name[len(dep_prefix):]
-		info.size = len(data)
-		tar_o.addfile(info, io.BytesIO(data))
+	res_cache = {}
 	all_prefixes = set()
 	for package in all_packages:
 		all_prefixes.add(get_mod(package)[2])
@@ -95,73 +112,113 @@ def load_methods(all_packages, data):
 					depend_extra.append(dep)
 				else:
 					raise Exception('Bad depend_extra in %s.a_%s: %r' % (package, key, dep,))
-			dep_prefix = os.path.commonprefix(depend_extra + [filename])
-			# commonprefix works per character (and commonpath is v3.5+)
-			dep_prefix = dep_prefix.rsplit('/', 1)[0] + '/'
-			with open(filename, 'rb') as fh:
-				src = fh.read()
-			tar_fh = io.BytesIO()
-			tar_o = tarfile.open(mode='w:gz', fileobj=tar_fh, compresslevel=1)
-			tar_add(filename, src)
-			h = hashlib.sha1(src)
-			hash = int(h.hexdigest(), 16)
 			likely_deps = set()
 			dep_names = {}
 			for k in dir(mod):
 				v = getattr(mod, k)
 				if isinstance(v, ModuleType):
-					filename = mod2filename(v)
-					if filename:
+					dep_filename = mod2filename(v)
+					if dep_filename:
 						for cand_prefix in all_prefixes:
-							if filename.startswith(cand_prefix):
-								likely_deps.add(filename)
-								dep_names[filename] = v.__name__
+							if dep_filename.startswith(cand_prefix):
+								likely_deps.add(dep_filename)
+								dep_names[dep_filename] = v.__name__
 								break
-			hash_extra = 0
-			for dep in depend_extra:
-				with open(dep, 'rb') as fh:
-					data = fh.read()
-				hash_extra ^= int(hashlib.sha1(data).hexdigest(), 16)
-				tar_add(dep, data)
 			for dep in (likely_deps - set(depend_extra)):
 				res_warnings.append('%s.a_%s should probably depend_extra on %s' % (package, key, dep_names[dep],))
-			res_hashes[key] = ("%040x" % (hash ^ hash_extra,),)
+			# Stat before reading, so a file that changes while we read it
+			# gets a new signature (and is rebuilt) on the next reload.
+			sigs = tuple(file_sig(fn) for fn in [filename] + depend_extra)
+			digest = sigs_digest(sigs)
+			cached = cache.get((package, key))
+			if not cached or cached[0] != digest:
+				hashes, hash_warnings = _hash(package, key, mod, filename, depend_extra)
+				cached = (digest, hashes, hash_warnings,)
+			_, res_hashes[key], hash_warnings = cached
+			archives[key] = (filename, depend_extra, sigs,)
+			res_warnings.extend(hash_warnings)
+			res_cache[(package, key)] = cached
 			res_params[key] = params = DotDict()
 			for name, default in (('options', {},), ('datasets', (),), ('jobs', (),),):
 				params[name] = getattr(mod, name, default)
-			equivalent_hashes = getattr(mod, 'equivalent_hashes', ())
-			if equivalent_hashes:
-				assert isinstance(equivalent_hashes, dict), 'Read the docs about equivalent_hashes'
-				assert len(equivalent_hashes) == 1, 'Read the docs about equivalent_hashes'
-				k, v = next(iteritems(equivalent_hashes))
-				assert isinstance(k, str), 'Read the docs about equivalent_hashes'
-				assert isinstance(v, tuple), 'Read the docs about equivalent_hashes'
-				for v in v:
-					assert isinstance(v, str), 'Read the docs about equivalent_hashes'
-				start = src.index(b'equivalent_hashes')
-				end   = src.index(b'}', start)
-				h = hashlib.sha1(src[:start])
-				h.update(src[end:])
-				verifier = "%040x" % (int(h.hexdigest(), 16) ^ hash_extra,)
-				if verifier in equivalent_hashes:
-					res_hashes[key] += equivalent_hashes[verifier]
-				else:
-					res_warnings.append('%s.a_%s has equivalent_hashes, but missing verifier %s' % (package, key, verifier,))
-			tar_o.close()
-			tar_fh.seek(0)
-			archives[key] = tar_fh.read()
 		except Exception:
 			print_exc()
 			res_failed.append(modname)
 			continue
-	return res_warnings, res_failed, res_hashes, res_params
+	return res_warnings, res_failed, res_hashes, res_params, res_cache
+
+def _hash(package, key, mod, filename, depend_extra):
+	from accelerator.compat import iteritems
+	res_warnings = []
+	with open(filename, 'rb') as fh:
+		src = fh.read()
+	h = hashlib.sha1(src)
+	hash = int(h.hexdigest(), 16)
+	hash_extra = 0
+	for dep in depend_extra:
+		with open(dep, 'rb') as fh:
+			data = fh.read()
+		hash_extra ^= int(hashlib.sha1(data).hexdigest(), 16)
+	hashes = ("%040x" % (hash ^ hash_extra,),)
+	equivalent_hashes = getattr(mod, 'equivalent_hashes', ())
+	if equivalent_hashes:
+		assert isinstance(equivalent_hashes, dict), 'Read the docs about equivalent_hashes'
+		assert len(equivalent_hashes) == 1, 'Read the docs about equivalent_hashes'
+		k, v = next(iteritems(equivalent_hashes))
+		assert isinstance(k, str), 'Read the docs about equivalent_hashes'
+		assert isinstance(v, tuple), 'Read the docs about equivalent_hashes'
+		for v in v:
+			assert isinstance(v, str), 'Read the docs about equivalent_hashes'
+		start = src.index(b'equivalent_hashes')
+		end   = src.index(b'}', start)
+		h = hashlib.sha1(src[:start])
+		h.update(src[end:])
+		verifier = "%040x" % (int(h.hexdigest(), 16) ^ hash_extra,)
+		if verifier in equivalent_hashes:
+			hashes += equivalent_hashes[verifier]
+		else:
+			res_warnings.append('%s.a_%s has equivalent_hashes, but missing verifier %s' % (package, key, verifier,))
+	return hashes, res_warnings
+
+def _archive(method):
+	"""method.tar.gz contents, from the files the hash was computed from"""
+	filename, depend_extra, sigs = archives[method]
+	def tar_add(name):
+		assert name.startswith(dep_prefix)
+		with open(name, 'rb') as fh:
+			data = fh.read()
+		info = tarfile.TarInfo()
+		info.name = name[len(dep_prefix):]
+		info.size = len(data)
+		tar_o.addfile(info, io.BytesIO(data))
+	if tuple(file_sig(fn) for fn in [filename] + depend_extra) != sigs:
+		raise Exception('Source of %s changed since the methods were loaded' % (method,))
+	dep_prefix = os.path.commonprefix(depend_extra + [filename])
+	# commonprefix works per character (and commonpath is v3.5+)
+	dep_prefix = dep_prefix.rsplit('/', 1)[0] + '/'
+	tar_fh = io.BytesIO()
+	tar_o = tarfile.open(mode='w:gz', fileobj=tar_fh, compresslevel=1)
+	for name in [filename] + depend_extra:
+		tar_add(name)
+	tar_o.close()
+	return tar_fh.getvalue()
 
 def launch_start(data):
+	"""Returns (child, prof_r), or (None, why) if the job was not started."""
 	from accelerator.launch import run
-	from accelerator.compat import PY2
+	from accelerator.compat import PY2, uni
 	from accelerator.dispatch import close_fds
 	if PY2:
 		data = {k: v.encode('utf-8') if isinstance(v, unicode) else v for k, v in data.items()}
+	method = data.pop('method')
+	try:
+		archive = _archive(method)
+	except Exception as e:
+		return None, uni(str(e))
+	arc_name = os.path.join(data['workdir'], data['jobid'], 'method.tar.gz')
+	with open(arc_name, 'wb') as fh:
+		fh.write(archive)
+	del archive
 	prof_r, prof_w = os.pipe()
 	# Disable the GC here, leaving it disabled in the child (the method).
 	# The idea is that most methods do not actually benefit from the GC, but
@@ -169,8 +226,9 @@ def launch_start(data):
 	# Additionally, as seen in https://bugs.python.org/issue31558
 	# the GC sometimes causes considerable extra COW after fork.
 	# (If prepare_res is something GC-tracked.)
-	# Once gc.freeze is available we will probably want to call that before
-	# splitting the analysis processes if the method has re-enabled gc.
+	# (launch.fork_analysis also does gc.freeze where available, for
+	# methods that re-enable the GC.)
+	# For really big lookup tables in prepare_res, see extras.SharedDict.
 	try:
 		gc.disable()
 		child = os.fork()
@@ -207,10 +265,7 @@ def launch_finish(cookie, data):
 	status = {'launcher': '[invalid data] (probably killed)'}
 	result = None
 	try:
-		child, prof_r, workdir, jobid, method = data
-		arc_name = os.path.join(workdir, jobid, 'method.tar.gz')
-		with open(arc_name, 'wb') as fh:
-			fh.write(archives[method])
+		child, prof_r, workdir, jobid = data
 		# We have closed prof_w. When child exits we get eof.
 		prof = []
 		while True:
@@ -316,13 +371,16 @@ class Runner(object):
 		return res
 
 	def load_methods(self, all_packages, data):
-		return self._do(b'm', (all_packages, data))
+		cache = {k: _load_cache[k] for k in map(tuple, data) if k in _load_cache}
+		w, f, h, p, c = self._do(b'm', (all_packages, data, cache))
+		_load_cache.update(c)
+		return w, f, h, p
 
 	def launch_start(self, data):
 		return self._do(b's', data)
 
-	def launch_finish(self, child, prof_r, workdir, jobid, method):
-		return self._do(b'f', (child, prof_r, workdir, jobid, method))
+	def launch_finish(self, child, prof_r, workdir, jobid):
+		return self._do(b'f', (child, prof_r, workdir, jobid))
 
 	def launch_waitpid(self, child):
 		return self._do(b'w', child)
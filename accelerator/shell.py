@@ -117,6 +117,11 @@ def setup(config_fn=None, debug_cmd=False):
 		# as working directory.
 		chdir(cfg['project_directory'])
 
+def cmd_dscat(argv):
+	from accelerator.dscat import main
+	return main(argv)
+cmd_dscat.help = '''Print (some columns of) one or more datasets'''
+
 def cmd_dsgrep(argv):
 	from accelerator.dsgrep import main
 	return main(argv)
@@ -188,9 +193,10 @@ def cmd_curl(argv):
 	print(output)
 cmd_curl.help = '''http request (with curl) to urd or the daemon'''
 
-DEBUG_COMMANDS = {'dsgrep', 'dsinfo',}
+DEBUG_COMMANDS = {'dscat', 'dsgrep', 'dsinfo',}
 
 COMMANDS = dict(
+	dscat=cmd_dscat,
 	dsgrep=cmd_dsgrep,
 	dsinfo=cmd_dsinfo,
 	run=cmd_run,
@@ -0,0 +1,132 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+# Approximate column statistics, optionally collected by the writers
+# (DatasetWriter(sketches=True)) and stored with the dataset.
+#
+# The writers give (hll registers, sample or None, sample_seen) per
+# column and slice. hll is a HyperLogLog over the same hash used for
+# slicing (so equal values in int and float columns count as the same),
+# sample is a reservoir sample of numeric values. None values are not
+# included in either.
+#
+# Use ds.sketch(column) or chain.sketch(column) to get a Sketch.
+
+from __future__ import print_function
+from __future__ import division
+
+from math import log
+from bisect import bisect_left
+
+HLL_M = 4096
+SAMPLE_Z = 1024
+_alpha = 0.7213 / (1 + 1.079 / HLL_M)
+
+class Sketch(object):
+	"""Mergeable approximate distinct count and quantiles.
+	a.merge(b) (or a | b) gives the sketch for both together."""
+
+	def __init__(self, hll, sample=None, seen=0):
+		self.hll = bytearray(hll)
+		assert len(self.hll) == HLL_M, "Bad HyperLogLog size %d" % (len(self.hll),)
+		if sample is None:
+			self.sample = None
+			self.seen = 0
+		else:
+			# Sorted [(value, weight)]
+			if sample and not isinstance(sample[0], tuple):
+				w = seen / len(sample)
+				sample = [(v, w) for v in sample]
+			self.sample = sorted(sample)
+			self.seen = seen
+
+	@classmethod
+	def from_raw(cls, raw):
+		"""From what a writer .sketch() returns (and is stored)"""
+		return cls(*raw)
+
+	def distinct(self):
+		"""Approximate number of distinct values (about 2% error)"""
+		z = sum(2.0 ** -r for r in self.hll)
+		e = _alpha * HLL_M * HLL_M / z
+		if e <= 2.5 * HLL_M:
+			zeros = self.hll.count(0)
+			if zeros:
+				e = HLL_M * log(HLL_M / zeros)
+		return int(round(e))
+
+	def quantile(self, q):
+		"""Approximate q quantile (0 <= q <= 1) or None if there are
+		no (numeric) values."""
+		if not self.sample:
+			return None
+		assert 0 <= q <= 1, "Quantile must be between 0 and 1"
+		want = q * sum(w for _, w in self.sample)
+		acc = 0
+		for v, w in self.sample:
+			acc += w
+			if acc >= want:
+				return v
+		return self.sample[-1][0]
+
+	def quantiles(self, n):
+		"""n + 1 values splitting the data into n parts of about the same size,
+		e.g. for picking sort splitters. Includes the sampled min and max."""
+		return [self.quantile(ix / n) for ix in range(n + 1)]
+
+	def merge(self, other):
+		hll = bytearray(max(a, b) for a, b in zip(self.hll, other.hll))
+		if self.sample is None or other.sample is None:
+			sample = self.sample if other.sample is None else other.sample
+			seen = self.seen if other.sample is None else other.seen
+		else:
+			sample = _compact(self.sample + other.sample)
+			seen = self.seen + other.seen
+		return Sketch(hll, sample, seen)
+	__or__ = merge
+
+	def __repr__(self):
+		return '<Sketch ~%d distinct, %d values seen>' % (self.distinct(), self.seen,)
+
+def _compact(sample):
+	"""Reduce a weighted sample to at most SAMPLE_Z items by picking evenly
+	spaced (by weight) values, each representing an equal share."""
+	sample = sorted(sample)
+	if len(sample) <= SAMPLE_Z:
+		return sample
+	total = 0
+	cumulative = []
+	for _, w in sample:
+		total += w
+		cumulative.append(total)
+	step = total / SAMPLE_Z
+	res = []
+	for ix in range(SAMPLE_Z):
+		pos = bisect_left(cumulative, (ix + 0.5) * step)
+		res.append((sample[min(pos, len(sample) - 1)][0], step))
+	return res
+
+def merge_raw(raws):
+	"""Merge a sequence of stored sketches (None if any are missing)"""
+	res = None
+	for raw in raws:
+		if raw is None:
+			return None
+		s = Sketch.from_raw(raw)
+		res = s if res is None else res.merge(s)
+	return res
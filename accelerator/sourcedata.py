@@ -22,7 +22,7 @@ from __future__ import division
 
 from accelerator import gzutil
 
-assert gzutil.version >= (2, 11, 0) and gzutil.version[0] == 2, gzutil.version
+assert gzutil.version >= (2, 19, 0) and gzutil.version[0] == 2, gzutil.version
 
 from accelerator.compat import PY3
 
@@ -53,6 +53,10 @@ class GzJson(object):
 	def __next__(self):
 		return loads(next(self.fh))
 	next = __next__
+	def skip(self, count):
+		return self.fh.skip(count)
+	def take(self, mask):
+		return [loads(v) for v in gzutil.take(self.fh, mask)]
 	def close(self):
 		self.fh.close()
 	def __iter__(self):
@@ -20,17 +20,33 @@
 from __future__ import division
 from __future__ import absolute_import
 
+description = r'''
+Export one or more datasets (or chains) to a csv file.
+
+The lines are formatted in C (see gzutil.csv_format), with the same
+text Python would give: repr for floats and numbers, str for the other
+types and json for json.
+
+Unless sliced each slice is written to a separate file (a complete gzip
+stream for .gz, and concatenated gzip streams are a valid gzip file)
+which are then appended to the final file in the kernel where possible
+(copy_file_range, which may share the blocks instead of copying them on
+filesystems that support that, or sendfile).
+'''
+
+import os
+import errno
 from shutil import copyfileobj
 from os import unlink
 from contextlib import contextmanager
 from ujson import dumps
 
-from accelerator.compat import PY3, PY2, izip, imap
+from accelerator.compat import imap
 
 from accelerator.extras import OptionString, job_params
 from accelerator.status import status
 
-from accelerator.gzutil import GzWriteUnicodeLines, GzWriteBytesLines
+from accelerator.gzutil import GzWrite, csv_format
 
 options = dict(
 	filename          = OptionString, # .csv or .gz
@@ -46,27 +62,23 @@ datasets = (['source'],) # normally just one, but you can specify several
 
 jobs = ('previous',)
 
+# These give a function to write bytes (complete lines) to the file.
+
 @contextmanager
 def mkwrite_gz(filename):
-	w = GzWriteUnicodeLines if PY3 else GzWriteBytesLines
-	with w(filename) as fh:
+	with GzWrite(filename) as fh:
 		yield fh.write
 
 @contextmanager
 def mkwrite_uncompressed(filename):
-	if PY2:
-		fh = open(filename, 'wb')
-	else:
-		fh = open(filename, 'w', encoding='utf-8')
-	with fh:
-		def write(s):
-			fh.write(s + '\n')
-		yield write
+	with open(filename, 'wb') as fh:
+		yield fh.write
 
-if PY3:
-	enc = str
-else:
-	enc = lambda s: s.encode('utf-8')
+def column_iterator(d, sliceno, label):
+	it = d._column_iterator(sliceno, label)
+	if d.columns[label].type == 'json':
+		it = imap(dumps, it)
+	return it
 
 def csvexport(sliceno, filename, labelsonfirstline):
 	assert len(options.separator) == 1
@@ -86,42 +98,28 @@ def csvexport(sliceno, filename, labelsonfirstline):
 		datasets.source = lst
 	if filename.lower().endswith('.gz'):
 		mkwrite = mkwrite_gz
+		# Refuse the same lines as GzWrite*Lines did.
+		check_lines = True
 	elif filename.lower().endswith('.csv'):
 		mkwrite = mkwrite_uncompressed
+		check_lines = False
 	else:
 		raise Exception("Filename should end with .gz for compressed or .csv for uncompressed")
-	iters = []
-	first = True
-	for label in options.labels:
-		it = d.iterate_list(sliceno, label, datasets.source, status_reporting=first)
-		first = False
-		t = d.columns[label].type
-		if t == 'unicode' and PY2:
-			it = imap(enc, it)
-		elif t == 'bytes' and PY3:
-			it = imap(lambda s: s.decode('utf-8', errors='backslashreplace'), it)
-		elif t in ('float32', 'float64', 'number'):
-			it = imap(repr, it)
-		elif t == 'json':
-			it = imap(dumps, it)
-		elif t not in ('unicode', 'ascii', 'bytes'):
-			it = imap(str, it)
-		iters.append(it)
-	it = izip(*iters)
+	q = options.quote_fields
+	sep = options.separator
 	with mkwrite(filename) as write:
-		q = options.quote_fields
-		sep = options.separator
-		if q:
-			qq = q + q
-			if labelsonfirstline:
-				write(enc(sep.join(q + n.replace(q, qq) + q for n in options.labels)))
-			for data in it:
-				write(sep.join(q + n.replace(q, qq) + q for n in data))
-		else:
-			if labelsonfirstline:
-				write(enc(sep.join(options.labels)))
-			for data in it:
-				write(sep.join(data))
+		if labelsonfirstline:
+			write(csv_format([iter([n]) for n in options.labels], sep, q, check_lines))
+		for d in datasets.source:
+			if not d.lines[sliceno]:
+				continue
+			with status('Exporting %s:%d' % (d, sliceno,)):
+				columns = [column_iterator(d, sliceno, label) for label in options.labels]
+				while True:
+					data = csv_format(columns, sep, q, check_lines)
+					if not data:
+						break
+					write(data)
 
 def analysis(sliceno):
 	if options.sliced:
@@ -131,12 +129,42 @@ def analysis(sliceno):
 		filename = '%d.gz' if options.filename.lower().endswith('.gz') else '%d.csv'
 		csvexport(sliceno, filename % (sliceno,), labelsonfirstline)
 
+# Ways to copy count bytes from in_fd to out_fd without going through
+# userspace, best first. Both return how much was copied.
+kernel_copies = []
+if hasattr(os, 'copy_file_range'):
+	kernel_copies.append(lambda in_fd, out_fd, count: os.copy_file_range(in_fd, out_fd, count))
+if hasattr(os, 'sendfile'):
+	kernel_copies.append(lambda in_fd, out_fd, count: os.sendfile(out_fd, in_fd, None, count))
+# What these can fail with when the files don't support them.
+unsupported_errnos = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK}
+
+def append_file(infh, outfh):
+	"""Append all of infh to outfh (both unbuffered)"""
+	in_fd = infh.fileno()
+	out_fd = outfh.fileno()
+	left = os.fstat(in_fd).st_size
+	for copy in kernel_copies:
+		copied = False
+		try:
+			while left:
+				done = copy(in_fd, out_fd, left)
+				if not done:
+					break
+				copied = True
+				left -= done
+			return
+		except OSError as e:
+			if copied or e.errno not in unsupported_errnos:
+				raise
+	copyfileobj(infh, outfh)
+
 def synthesis(params):
 	if not options.sliced:
 		filename = '%d.gz' if options.filename.lower().endswith('.gz') else '%d.csv'
-		with open(options.filename, "wb") as outfh:
+		with open(options.filename, "wb", buffering=0) as outfh:
 			for sliceno in range(params.slices):
 				with status("Assembling %s (%d/%d)" % (options.filename, sliceno, params.slices)):
-					with open(filename % sliceno, "rb") as infh:
-						copyfileobj(infh, outfh)
+					with open(filename % sliceno, "rb", buffering=0) as infh:
+						append_file(infh, outfh)
 					unlink(filename % sliceno)
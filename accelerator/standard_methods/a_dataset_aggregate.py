@@ -0,0 +1,228 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import division
+from __future__ import absolute_import
+
+description = r'''
+Group by one or more columns and aggregate other columns.
+
+aggregations is {output column name: "function column"}, where
+function is one of sum, count, min, max, mean and count_distinct.
+count can be used without a column (to count lines).
+None values are ignored (except by count without a column), so
+min, max and mean are None for groups with no other values.
+
+If the dataset is hashed on one of the group_by columns all groups are
+within a slice and are aggregated directly in analysis. Otherwise a
+subjob (with partial=True) aggregates what each slice has, partitioning
+the partial results on the (hashed) first group_by column, and then
+slice N here merges and writes partition N from all of them.
+
+The result is hashed on the dataset hashlabel in the first case and on
+the first group_by column in the second.
+'''
+
+from accelerator.extras import OptionString
+from accelerator.dataset import DatasetWriter
+from accelerator.gzwrite import typed_writer
+from accelerator import blob
+from accelerator import subjobs
+
+options = {
+	'group_by'               : [OptionString],
+	'aggregations'           : {}, # {name: "function column"}
+	'partial'                : False, # internal, only save partial results per slice (for the job that built this)
+}
+
+datasets = ('source', 'previous',)
+
+
+# function: (initial state, update code, merge functions, finish function)
+# (Update code gets the state slots as {s0} (and {s1}) and the value as {v}.)
+def _add(a, b):
+	return a + b
+def _min(a, b):
+	return b if a is None or (b is not None and b < a) else a
+def _max(a, b):
+	return b if a is None or (b is not None and b > a) else a
+def _union(a, b):
+	a.update(b)
+	return a
+def _same(s):
+	return s
+aggregators = {
+	'count'          : ('0', ['if {v} is not None: {s0} += 1'], [_add], _same),
+	'sum'            : ('0', ['if {v} is not None: {s0} += {v}'], [_add], _same),
+	'min'            : ('None', ['if {v} is not None and ({s0} is None or {v} < {s0}): {s0} = {v}'], [_min], _same),
+	'max'            : ('None', ['if {v} is not None and ({s0} is None or {v} > {s0}): {s0} = {v}'], [_max], _same),
+	'mean'           : ('0, 0', ['if {v} is not None:', ' {s0} += {v}', ' {s1} += 1'], [_add, _add], lambda s, c: s / c if c else None),
+	'count_distinct' : ('set()', ['if {v} is not None: {s0}.add({v})'], [_union], len),
+}
+# how many state slots each uses
+slots = {k: len(v[2]) for k, v in aggregators.items()}
+
+def result_type(func, coltype):
+	if func in ('count', 'count_distinct',):
+		return 'int64', False
+	if func == 'mean':
+		assert coltype in ('float64', 'float32', 'number', 'int64', 'int32', 'bool',), "Can't take the mean of %s" % (coltype,)
+		return 'float64', True
+	if func == 'sum':
+		if coltype in ('float64', 'float32',):
+			return 'float64', False
+		assert coltype in ('number', 'int64', 'int32', 'bool',), "Can't sum %s" % (coltype,)
+		return 'number', False
+	# min and max
+	assert coltype not in ('json',) and not coltype.startswith('bits'), "Can't take %s of %s" % (func, coltype,)
+	return coltype, True
+
+
+def parse_aggregations():
+	res = []
+	for name in sorted(options.aggregations):
+		spec = options.aggregations[name].split()
+		assert 1 <= len(spec) <= 2, "Bad aggregation %r for %s" % (options.aggregations[name], name,)
+		func = spec[0]
+		assert func in aggregators, "Unknown aggregation function %r for %s" % (func, name,)
+		if len(spec) == 2:
+			column = spec[1]
+			assert column in datasets.source.columns, "%s has no column %s" % (datasets.source, column,)
+		else:
+			assert func == 'count', "%s needs a column (for %s)" % (func, name,)
+			column = None
+		res.append((name, func, column,))
+	return res
+
+
+def mkupdate(aggregations):
+	"""Generate a function that iterates over (group_by..., values...)
+	tuples and updates groups ({key: state list}) with them. One function
+	per job means no per value dispatch on the aggregation functions."""
+	value_columns = sorted(set(column for _, _, column in aggregations if column))
+	k_names = ['k%d' % (ix,) for ix in range(len(options.group_by))]
+	v_names = {column: 'v%d' % (ix,) for ix, column in enumerate(value_columns)}
+	f = ['def update(it, groups):']
+	f.append(' for %s, in it:' % (', '.join(k_names + [v_names[c] for c in value_columns]),))
+	if len(k_names) == 1:
+		f.append('  key = k0')
+	else:
+		f.append('  key = (%s,)' % (', '.join(k_names),))
+	f.append('  s = groups.get(key)')
+	f.append('  if s is None:')
+	f.append('   s = groups[key] = [%s]' % (', '.join(aggregators[func][0] for _, func, _ in aggregations),))
+	ix = 0
+	for _, func, column in aggregations:
+		if column:
+			code = aggregators[func][1]
+		else: # count lines
+			code = ['{s0} += 1']
+		for line in code:
+			f.append('  ' + line.format(v=v_names.get(column), s0='s[%d]' % (ix,), s1='s[%d]' % (ix + 1,)))
+		ix += slots[func]
+	g = {}
+	eval(compile('\n'.join(f), '<dataset_aggregate generated update>', 'exec'), g)
+	return g['update'], list(options.group_by) + value_columns
+
+
+def merge(groups, other, aggregations):
+	mergers = [m for _, func, _ in aggregations for m in aggregators[func][2]]
+	for key, s in other.items():
+		mine = groups.get(key)
+		if mine is None:
+			groups[key] = s
+		else:
+			for ix, m in enumerate(mergers):
+				mine[ix] = m(mine[ix], s[ix])
+
+
+def finish(key, s, aggregations):
+	res = list(key) if len(options.group_by) > 1 else [key]
+	ix = 0
+	for _, func, _ in aggregations:
+		res.append(aggregators[func][3](*s[ix:ix + slots[func]]))
+		ix += slots[func]
+	return res
+
+
+def prepare():
+	source = datasets.source
+	assert options.group_by, "Specify at least one group_by column"
+	assert options.aggregations, "Specify at least one aggregation"
+	for column in options.group_by:
+		assert column in source.columns, "%s has no column %s" % (source, column,)
+	aggregations = parse_aggregations()
+	for name, _, _ in aggregations:
+		assert name not in options.group_by, "Aggregation %s has the same name as a group_by column" % (name,)
+	if options.partial:
+		return None, aggregations, None
+	slice_local = source.hashlabel in options.group_by
+	if slice_local:
+		partials = None
+	else:
+		partials = subjobs.build('dataset_aggregate', options=dict(
+			group_by=options.group_by,
+			aggregations=options.aggregations,
+			partial=True,
+		), datasets=dict(source=source))
+	dw = DatasetWriter(
+		hashlabel=source.hashlabel if slice_local else options.group_by[0],
+		caption='%s grouped by %s' % (source.caption, ', '.join(options.group_by),),
+		previous=datasets.previous,
+	)
+	for column in options.group_by:
+		c = source.columns[column]
+		dw.add(column, c.type, none_support=c.none_support)
+	for name, func, column in aggregations:
+		coltype, none_support = result_type(func, column and source.columns[column].type)
+		dw.add(name, coltype, none_support=none_support)
+	return dw, aggregations, partials
+
+
+def analysis(sliceno, slices, prepare_res):
+	dw, aggregations, partials = prepare_res
+	groups = {}
+	if partials:
+		# Our partition from every slice of the partials job.
+		for partial_sliceno in range(slices):
+			merge(groups, blob.load('partial.%d' % (sliceno,), jobid=partials, sliceno=partial_sliceno), aggregations)
+	else:
+		update, columns = mkupdate(aggregations)
+		update(datasets.source.iterate(sliceno, columns), groups)
+		if options.partial:
+			save_partitions(sliceno, slices, groups)
+			return
+	write = dw.write_list
+	for key, s in groups.items():
+		write(finish(key, s, aggregations))
+
+
+def save_partitions(sliceno, slices, groups):
+	# Partition for the slice the output will be in.
+	hashfunc = typed_writer(datasets.source.columns[options.group_by[0]].type).hash
+	if len(options.group_by) > 1:
+		partof = lambda key: hashfunc(key[0]) % slices
+	else:
+		partof = lambda key: hashfunc(key) % slices
+	partitions = [{} for _ in range(slices)]
+	for key, s in groups.items():
+		partitions[partof(key)][key] = s
+	del groups
+	for partno, part in enumerate(partitions):
+		# Not temp, the job that built this reads them.
+		blob.save(part, 'partial.%d' % (partno,), sliceno=sliceno)
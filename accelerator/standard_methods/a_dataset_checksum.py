@@ -34,17 +34,27 @@ options.columns defaults to all columns in the source dataset.
 
 Note that this uses about 64 bytes of RAM per line, so you can't sum huge
 datasets. (So one GB per 20M lines or so.)
+
+If you set options.streaming=True memory use is constant instead. Each
+line is then hashed to 128 bits (from the same value hashes as slicing
+uses, so a number column with 1 and 1.0 compares equal) and these are
+summed, so the order and slicing never matters (options.sort is ignored).
+This is also about twice as fast, but gives a different sum than the
+other modes.
 '''
 
 from hashlib import md5
 from itertools import chain
+from struct import Struct
 
-from accelerator.extras import DotDict
+from accelerator.extras import DotDict, json_encode
 from accelerator.compat import PY2
+from accelerator.gzwrite import typed_writer
 
 options = dict(
 	columns      = set(),
 	sort         = True,
+	streaming    = False,
 )
 
 datasets = ('source',)
@@ -52,20 +62,65 @@ datasets = ('source',)
 def prepare():
 	return sorted(options.columns or datasets.source.columns)
 
-def analysis(sliceno, prepare_res):
-	columns = prepare_res
+# Stands in for None, which the typed hashes give the same value as 0.
+NONE_HASH = 0x9e3779b97f4a7c15
+
+def value_hasher(column):
+	if column.type == 'json':
+		hashbytes = typed_writer('bytes').hash
+		h = lambda v: hashbytes(json_encode(v))
+	else:
+		h = typed_writer(column.type).hash
+	if column.none_support:
+		return lambda v: NONE_HASH if v is None else h(v)
+	return h
+
+def streaming_sum(source, sliceno, columns):
+	"""Sum of 128 bit line hashes, mod 2**128. The per line function is
+	generated to avoid looping over the columns for each line."""
+	v_names = ['v%d' % (ix,) for ix in range(len(columns))]
+	h_names = ['h%d' % (ix,) for ix in range(len(columns))]
+	f = ['def linesum(it, pack, hashbytes, %s):' % (', '.join(h_names),)]
+	f.append(' total = 0')
+	f.append(' for %s, in it:' % (', '.join(v_names),))
+	f.append('  p = pack(%s)' % (', '.join('%s(%s)' % hv for hv in zip(h_names, v_names)),))
+	f.append('  total += (hashbytes(p) << 64) | hashbytes(b"\\x01" + p)')
+	f.append(' return total')
+	g = {}
+	eval(compile('\n'.join(f), '<dataset_checksum generated linesum>', 'exec'), g)
+	hashers = [value_hasher(source.columns[name]) for name in columns]
+	pack = Struct('<%dQ' % (len(columns),)).pack
+	total = g['linesum'](source.iterate(sliceno, columns), pack, typed_writer('bytes').hash, *hashers)
+	return total & ((1 << 128) - 1)
+
+def line_digests(source, sliceno, columns):
 	if len(columns) == 1:
 		columns = columns[0]
-	src = datasets.source.iterate(sliceno, columns)
+	src = source.iterate(sliceno, columns)
 	if PY2:
 		return [md5(repr(line)).digest() for line in src]
 	else:
 		return [md5(repr(line).encode("utf-8")).digest() for line in src]
 
-def synthesis(prepare_res, analysis_res):
-	all = chain.from_iterable(analysis_res)
-	if options.sort:
+def checksum_slice(source, sliceno, columns, streaming):
+	if streaming:
+		return streaming_sum(source, sliceno, columns)
+	else:
+		return line_digests(source, sliceno, columns)
+
+def combine(per_slice, sort, streaming):
+	"""The sum from what checksum_slice returned for each slice"""
+	if streaming:
+		return sum(per_slice) & ((1 << 128) - 1)
+	all = chain.from_iterable(per_slice)
+	if sort:
 		all = sorted(all)
-	res = md5(b''.join(all)).hexdigest()
-	print("%s: %s" % (datasets.source, res,))
-	return DotDict(sum=int(res, 16), sort=options.sort, columns=prepare_res, source=datasets.source)
+	return int(md5(b''.join(all)).hexdigest(), 16)
+
+def analysis(sliceno, prepare_res):
+	return checksum_slice(datasets.source, sliceno, prepare_res, options.streaming)
+
+def synthesis(prepare_res, analysis_res):
+	res = combine(analysis_res, options.sort, options.streaming)
+	print("%s: %032x" % (datasets.source, res,))
+	return DotDict(sum=res, sort=options.sort, streaming=options.streaming, columns=prepare_res, source=datasets.source)
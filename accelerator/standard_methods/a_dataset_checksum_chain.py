@@ -29,26 +29,69 @@ datasets.source is mandatory, datasets.stop is optional.
 options.chain_length defaults to -1.
 
 Sort does not sort across datasets.
+
+By default this builds a dataset_checksum job per dataset. With
+options.single_job=True all datasets are instead checksummed in parallel
+in this job's analysis, which avoids a job launch per dataset. The sum is
+the same either way. Without streaming the line digests are saved per
+dataset, so like with separate jobs only one dataset is in memory at a
+time.
 '''
 
 from accelerator.subjobs import build
 from accelerator.extras import DotDict
 from accelerator import blob
 
+from . import a_dataset_checksum
+
+depend_extra = (a_dataset_checksum,)
+
 options = dict(
 	chain_length = -1,
 	columns      = set(),
 	sort         = True,
+	streaming    = False,
+	single_job   = False,
 )
 
 datasets = ('source', 'stop',)
 
-def synthesis():
-	sum = 0
+def prepare():
 	jobs = datasets.source.chain(length=options.chain_length, stop_ds=datasets.stop)
-	for src in jobs:
-		jid = build('dataset_checksum', options=dict(columns=options.columns, sort=options.sort), datasets=dict(source=src))
-		data = blob.load(jobid=jid)
-		sum ^= data.sum
+	return [(src, sorted(options.columns or src.columns)) for src in jobs]
+
+def analysis(sliceno, prepare_res):
+	if not options.single_job:
+		return
+	if options.streaming:
+		return [
+			a_dataset_checksum.streaming_sum(src, sliceno, columns)
+			for src, columns in prepare_res
+		]
+	for dsno, (src, columns) in enumerate(prepare_res):
+		digests = a_dataset_checksum.line_digests(src, sliceno, columns)
+		blob.save(digests, 'digests.%d' % (dsno,), sliceno=sliceno, temp=True)
+
+def synthesis(prepare_res, analysis_res, slices):
+	sum = 0
+	jobs = [src for src, _ in prepare_res]
+	if options.single_job:
+		if options.streaming:
+			per_ds = zip(*analysis_res) if jobs else ()
+		else:
+			per_ds = (
+				(blob.load('digests.%d' % (dsno,), sliceno=sliceno) for sliceno in range(slices))
+				for dsno in range(len(jobs))
+			)
+		for (src, columns), per_slice in zip(prepare_res, per_ds):
+			ds_sum = a_dataset_checksum.combine(per_slice, options.sort, options.streaming)
+			print("%s: %032x" % (src, ds_sum,))
+			sum ^= ds_sum
+		data = DotDict(columns=prepare_res[-1][1] if prepare_res else sorted(options.columns))
+	else:
+		for src in jobs:
+			jid = build('dataset_checksum', options=dict(columns=options.columns, sort=options.sort, streaming=options.streaming), datasets=dict(source=src))
+			data = blob.load(jobid=jid)
+			sum ^= data.sum
 	print("Total: %016x" % (sum,))
-	return DotDict(sum=sum, columns=data.columns, sort=options.sort, sources=jobs)
+	return DotDict(sum=sum, columns=data.columns, sort=options.sort, streaming=options.streaming, sources=jobs)
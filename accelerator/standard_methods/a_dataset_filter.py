@@ -0,0 +1,196 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import division
+from __future__ import absolute_import
+
+description = r'''
+Rewrite a dataset (or chain to previous) with only the lines matching
+all the conditions in filter.
+
+Each condition is [column, op, value], where op is one of
+    ==  !=  <  <=  >  >=    compare to value
+    in  not in              value is a list
+    is None  is not None    (no value)
+None never matches the comparisons or in/not in. Values for date, datetime
+and time columns can be given as text ("2019-04-10 12:00:00", like dscat).
+A range is two conditions on the same column.
+
+Datasets where the conditions can not match (going by the min/max of the
+columns) are skipped without being read. In the others the filter
+columns are read first, and the other columns only copy the matching
+lines, without decoding anything that can be copied as it is stored.
+
+You get one dataset per (not skipped) dataset in the source chain, the
+last one is "default".
+'''
+
+from functools import partial
+
+from accelerator.compat import str_types
+from accelerator.dataset import parse_value, writers_like, column_copier
+from accelerator import gzutil
+
+options = {
+	'filter'                    : [], # [[column, op, value], ...]
+	'length'                    : -1, # Go back at most this many datasets. You almost always want -1 (which goes until previous.source)
+}
+
+datasets = ('source', 'previous',)
+
+# How many lines to look at at a time.
+MASK_SIZE = 1024 * 1024
+
+COMPARISONS = ('==', '!=', '<', '<=', '>', '>=',)
+NONE_CHECKS = ('is None', 'is not None',)
+# Types where min/max says something about the values
+MINMAX_TYPES = ('number', 'float64', 'float32', 'int64', 'int32', 'bits64', 'bits32', 'bool', 'datetime', 'date', 'time',)
+
+def parse_conditions(chain):
+	conditions = []
+	for cond in options.filter:
+		if isinstance(cond, str_types) or len(cond) not in (2, 3):
+			raise Exception('Bad condition %r, should be [column, op, value]' % (cond,))
+		column, op = cond[:2]
+		value = cond[2] if len(cond) == 3 else None
+		for ds in chain:
+			if column not in ds.columns:
+				raise Exception('Column %r not in %s' % (column, ds,))
+			if ds.columns[column].type == 'json':
+				raise Exception("Can't filter on json column %r" % (column,))
+		coltype = chain[-1].columns[column].type
+		def parse(v):
+			if isinstance(v, str_types) and coltype in ('datetime', 'date', 'time',):
+				return parse_value(coltype, v)
+			return v
+		if op in COMPARISONS:
+			value = parse(value)
+		elif op in ('in', 'not in',):
+			if isinstance(value, str_types) or not isinstance(value, (list, tuple, set)):
+				raise Exception('Condition %r needs a list of values' % (cond,))
+			value = frozenset(parse(v) for v in value)
+		elif op in NONE_CHECKS:
+			value = None
+		else:
+			raise Exception('Unknown op %r in %r' % (op, cond,))
+		conditions.append((column, op, value,))
+	return conditions
+
+def check(ds, column, op, value):
+	"""False if no line in ds can match, True if all lines do, otherwise None."""
+	c = ds.columns[column]
+	if op == 'is None' and not c.none_support:
+		return False
+	if op == 'is not None' and not c.none_support:
+		return True
+	if c.type not in MINMAX_TYPES or c.min is None:
+		return None
+	# Floats can have NaNs that are not in min/max, so those are only ever pruned.
+	# (Except by "!=" and "not in", which NaN always matches, like None never does.)
+	exact = not c.none_support and not c.type.startswith('float') and c.type != 'number'
+	try:
+		if op in ('in', 'not in',):
+			outside = all(v is None or v < c.min or v > c.max for v in value)
+			if outside:
+				if op == 'in':
+					return False
+				return None if c.none_support else True
+			return None
+		if value is None:
+			return None
+		if op == '==':
+			if value < c.min or value > c.max:
+				return False
+			if exact and c.min == c.max == value:
+				return True
+		elif op == '!=':
+			if not c.none_support and (value < c.min or value > c.max):
+				return True
+		elif op == '<':
+			if c.min >= value:
+				return False
+			if exact and c.max < value:
+				return True
+		elif op == '<=':
+			if c.min > value:
+				return False
+			if exact and c.max <= value:
+				return True
+		elif op == '>':
+			if c.max <= value:
+				return False
+			if exact and c.min > value:
+				return True
+		elif op == '>=':
+			if c.max < value:
+				return False
+			if exact and c.min >= value:
+				return True
+	except TypeError:
+		# Not comparable, let gzutil.where complain about it later
+		pass
+	return None
+
+def prepare(params):
+	if datasets.previous:
+		stop_ds = {datasets.previous.job: 'source'}
+	else:
+		stop_ds = None
+	chain = datasets.source.chain(stop_ds=stop_ds, length=options.length)
+	conditions = parse_conditions(chain)
+	todo = []
+	for ds in chain:
+		if not sum(ds.lines):
+			continue
+		checked = [check(ds, *cond) for cond in conditions]
+		if False not in checked:
+			todo.append((ds, [cond for cond, res in zip(conditions, checked) if res is not True]))
+	if not todo and chain:
+		# Nothing can match, but you still get an empty dataset.
+		todo = [(chain[-1], conditions)]
+	return todo, writers_like([ds for ds, _ in todo], params.jobid, datasets.previous)
+
+def open_copier(ds, dw, sliceno, name, start):
+	"""(reader, function to copy the lines in a mask) for name, from line start"""
+	mkreader, copy = column_copier(ds, dw, name)
+	reader = mkreader(sliceno, rows=(start, None))
+	return reader, partial(copy, reader)
+
+def analysis(sliceno, prepare_res):
+	todo, dws = prepare_res
+	for (ds, conditions), dw in zip(todo, dws):
+		lines = ds.lines[sliceno]
+		filters = [(ds._column_iterator(sliceno, column), op, value) for column, op, value in conditions]
+		copiers = None
+		for start in range(0, lines, MASK_SIZE):
+			mask = bytearray(b'\x01') * min(MASK_SIZE, lines - start)
+			left = len(mask)
+			for reader, op, value in filters:
+				# Lines that have already failed are skipped, not looked at.
+				left = gzutil.where(reader, mask, op, value)
+			if not left:
+				continue
+			if copiers is None:
+				# The other columns are only opened once something matches.
+				copiers = [open_copier(ds, dw, sliceno, name, start) for name in ds.columns]
+			else:
+				for reader, _ in copiers:
+					reader.skip(start - pos)
+			for _, copy in copiers:
+				copy(mask)
+			pos = start + len(mask)
@@ -0,0 +1,186 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import division
+from __future__ import absolute_import
+
+description = r'''
+Hash join two datasets on a column.
+
+how=inner gives one line per matching pair of lines, how=left also
+keeps left lines with no match (with None in the right columns) and
+how=semi gives the left lines that have at least one match (once each).
+None never matches anything.
+
+If both datasets are hashed on the join column the join is done slice
+by slice without moving any data, otherwise the datasets are rehashed
+during iteration. The result is hashed on the join column.
+
+The right side is kept in memory (per slice). If a slice has more than
+max_build_lines lines both sides are first spilled to disk in
+partitions that are joined one at a time.
+
+Column names from the right side get right_prefix prepended, you need
+to set it (or select columns) if the names would otherwise collide.
+
+bits32 and bits64 columns can't have None, so with how=left those right
+columns become int64 and number.
+'''
+
+import os
+from collections import defaultdict
+
+from accelerator.compat import pickle
+from accelerator.extras import OptionEnum, OptionString
+from accelerator.dataset import DatasetWriter
+
+HowEnum = OptionEnum('inner left semi')
+
+options = {
+	'column'                 : OptionString, # join on this column
+	'right_column'           : '', # if it has a different name in the right dataset
+	'how'                    : HowEnum.inner,
+	'left_columns'           : [], # default all
+	'right_columns'          : [], # default all (except the join column)
+	'right_prefix'           : '',
+	'max_build_lines'        : 10000000, # per slice, 0 for no limit
+}
+
+datasets = ('left', 'right', 'previous',)
+
+# Types that can hold all values of types without None support.
+NONE_TYPES = {
+	'bits32': 'int64',
+	'bits64': 'number',
+}
+
+
+def prepare():
+	left, right = datasets.left, datasets.right
+	left_key = options.column
+	right_key = options.right_column or left_key
+	assert left_key in left.columns, "%s has no column %s" % (left, left_key,)
+	assert right_key in right.columns, "%s has no column %s" % (right, right_key,)
+	lt, rt = left.columns[left_key].type, right.columns[right_key].type
+	# Otherwise equal values can hash to different slices.
+	assert lt == rt, "Join column has type %s in %s but %s in %s" % (lt, left, rt, right,)
+	left_columns = [left_key] + [n for n in (options.left_columns or sorted(left.columns)) if n != left_key]
+	if options.how == 'semi':
+		right_columns = []
+	else:
+		right_columns = [n for n in (options.right_columns or sorted(right.columns)) if n != right_key]
+	out_names = left_columns + [options.right_prefix + n for n in right_columns]
+	assert len(set(out_names)) == len(out_names), "Column names collide, set right_prefix or select columns: %r" % (out_names,)
+	dw = DatasetWriter(
+		hashlabel=left_key,
+		caption='%s %s join %s on %s' % (left.caption, options.how, right.caption, left_key,),
+		previous=datasets.previous,
+	)
+	for n in left_columns:
+		c = left.columns[n]
+		dw.add(n, c.type, none_support=c.none_support)
+	for n in right_columns:
+		c = right.columns[n]
+		if options.how == 'left':
+			# Lines without a match get None in the right columns.
+			dw.add(options.right_prefix + n, NONE_TYPES.get(c.type, c.type), none_support=True)
+		else:
+			dw.add(options.right_prefix + n, c.type, none_support=c.none_support)
+	return dw, left_columns, right_key, right_columns
+
+
+def build_lines(sliceno, slices, right_key):
+	right = datasets.right
+	if right.hashlabel == right_key:
+		return right.lines[sliceno]
+	else:
+		return sum(right.lines) // slices # about, after rehashing
+
+
+def join(left_it, right_it, write, nomatch):
+	# Both iterators give the join column first.
+	how = options.how
+	if how == 'semi':
+		keys = set(v[0] for v in right_it)
+		keys.discard(None)
+		for v in left_it:
+			if v[0] in keys:
+				write(v)
+		return
+	table = defaultdict(list)
+	for v in right_it:
+		if v[0] is not None:
+			table[v[0]].append(v[1:])
+	table = dict(table) # so .get doesn't add keys
+	for v in left_it:
+		matches = table.get(v[0])
+		if matches:
+			for r in matches:
+				write(v + r)
+		elif how == 'left':
+			write(v + nomatch)
+
+
+def spill(it, name, partitions, batch_size=1000):
+	"""Write everything in it to partitions files, partitioned on the
+	first value. Returns the filenames."""
+	filenames = ['%s.%d' % (name, ix,) for ix in range(partitions)]
+	fhs = [open(fn, 'wb') for fn in filenames]
+	batches = [[] for _ in range(partitions)]
+	for v in it:
+		batch = batches[hash(v[0]) % partitions]
+		batch.append(v)
+		if len(batch) == batch_size:
+			pickle.dump(batch, fhs[hash(v[0]) % partitions], pickle.HIGHEST_PROTOCOL)
+			del batch[:]
+	for batch, fh in zip(batches, fhs):
+		if batch:
+			pickle.dump(batch, fh, pickle.HIGHEST_PROTOCOL)
+		fh.close()
+	return filenames
+
+
+def unspill(filename):
+	with open(filename, 'rb') as fh:
+		try:
+			while True:
+				for v in pickle.load(fh):
+					yield v
+		except EOFError:
+			pass
+	os.unlink(filename)
+
+
+def analysis(sliceno, slices, prepare_res):
+	dw, left_columns, right_key, right_columns = prepare_res
+	right_columns = [right_key] + right_columns
+	def left_it():
+		return datasets.left.iterate(sliceno, left_columns, hashlabel=left_columns[0], rehash=True)
+	def right_it():
+		return datasets.right.iterate(sliceno, right_columns, hashlabel=right_key, rehash=True)
+	write = dw.write_list
+	nomatch = (None,) * (len(right_columns) - 1)
+	lines = build_lines(sliceno, slices, right_key)
+	if options.max_build_lines and lines > options.max_build_lines:
+		partitions = -(-lines // options.max_build_lines)
+		right_fns = spill(right_it(), 'join.right.%d' % (sliceno,), partitions)
+		left_fns = spill(left_it(), 'join.left.%d' % (sliceno,), partitions)
+		for left_fn, right_fn in zip(left_fns, right_fns):
+			join(unspill(left_fn), unspill(right_fn), write, nomatch)
+	else:
+		join(left_it(), right_it(), write, nomatch)
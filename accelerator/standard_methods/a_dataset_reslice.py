@@ -0,0 +1,86 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import division
+from __future__ import absolute_import
+
+description = r'''
+Rewrite a dataset (or chain) with another number of slices, normally one
+from a workdir with a different slice count than this one.
+
+Hashed datasets stay hashed on the same column (so lines move to the
+slice given by the hash modulo the new slice count). Other datasets keep
+their roundrobin order, so iterating them with sliceno="roundrobin"
+gives the same lines in the same order as before.
+
+The values are copied as they are stored, not decoded and encoded again
+(except for number columns and the hashlabel).
+
+source is "jobid/name" (or just "jobid") and not a dataset input, since
+datasets in workdirs with another slice count can not be inputs. If the
+workdir of source is not in the config, give it in source_workdirs
+({workdir name: path}).
+'''
+
+from itertools import islice
+
+from accelerator.extras import OptionString
+from accelerator.dataset import Dataset, writers_like, column_copier
+from accelerator.job import WORKDIRS
+
+options = {
+	'source'                    : OptionString,
+	'source_workdirs'           : {},
+	'length'                    : -1, # Go back at most this many datasets. -1 goes until previous.source (or the start of the chain)
+}
+
+datasets = ('previous',)
+
+# How many lines of a hashed dataset to look at at a time.
+MASK_SIZE = 1024 * 1024
+
+def prepare(params):
+	WORKDIRS.update(options.source_workdirs)
+	if datasets.previous:
+		stop_ds = datasets.previous.job.params.options.source
+	else:
+		stop_ds = None
+	chain = Dataset(options.source).chain(length=options.length, stop_ds=stop_ds)
+	return chain, writers_like(chain, params.jobid, datasets.previous)
+
+def analysis(sliceno, prepare_res, slices):
+	chain, dws = prepare_res
+	for ds, dw in zip(chain, dws):
+		copiers = [column_copier(ds, dw, n) for n in sorted(ds.columns)]
+		source_slices = [ix for ix, lines in enumerate(ds.lines) if lines]
+		if ds.hashlabel:
+			for source_sliceno in source_slices:
+				readers = [mkreader(source_sliceno) for mkreader, _ in copiers]
+				masks = ds._column_iterator(source_sliceno, ds.hashlabel, hashfilter=(sliceno, slices))
+				while True:
+					mask = bytearray(islice(masks, MASK_SIZE))
+					if not mask:
+						break
+					counts = set(copy(reader, mask) for reader, (_, copy) in zip(readers, copiers))
+					assert counts == {sum(mask)}, "%s: bad copy in slice %d: %r" % (ds, source_sliceno, counts,)
+		else:
+			# Line number N in roundrobin order goes to slice N % slices.
+			mask = bytearray(slices)
+			mask[sliceno] = 1
+			for mkreader, copy in copiers:
+				copy([mkreader(ix) for ix in source_slices], mask, cyclic=True)
@@ -0,0 +1,42 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2020 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test passing analysis_res to synthesis through shared memory.
+(Falls back to files on python < 3.8, like all other methods use.)
+'''
+
+from array import array
+from collections import Counter
+
+analysis_res_shm = True
+
+def analysis(sliceno):
+	return sliceno, Counter({sliceno: 1, 'all': 1}), array('d', [sliceno] * 1000)
+
+def synthesis(params, analysis_res):
+	it = iter(analysis_res)
+	for sliceno in range(params.slices):
+		got_sliceno, c, a = next(it)
+		assert got_sliceno == sliceno
+		assert c == Counter({sliceno: 1, 'all': 1}), c
+		assert a == array('d', [sliceno] * 1000)
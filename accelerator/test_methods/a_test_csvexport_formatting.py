@@ -0,0 +1,134 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test that csvexport gives exactly what formatting the values in Python
+(str, repr for floats and numbers, json for json) would, for all types,
+with and without quoting, compressed or not, sliced or not.
+'''
+
+import gzip
+from ujson import dumps
+
+from accelerator.dataset import DatasetWriter
+from accelerator.compat import PY2, PY3
+from accelerator import subjobs
+from . import test_data
+
+depend_extra = (test_data,)
+
+text_types = ('ascii', 'bytes', 'unicode',)
+odd_text = {
+	'ascii': 'with "quotes" and \'apostrophes\'',
+	'bytes': b'not utf-8: \xff\xfe "',
+	'unicode': 'r\xe4ksm\xf6rg\xe5s \'"',
+}
+
+def rows(sliceno):
+	names = sorted(test_data.data)
+	for ix in range(test_data.value_cnt):
+		yield [test_data.data[k][(ix + sliceno) % test_data.value_cnt] for k in names]
+	# A line of Nones, except where that is not possible.
+	yield [
+		odd_text[k] if k in text_types
+		else test_data.data[k][0] if k in test_data.not_none_capable
+		else None
+		for k in names
+	]
+
+def prepare():
+	a = DatasetWriter(name='a', columns=test_data.columns)
+	b = DatasetWriter(name='b', columns=test_data.columns, previous=a)
+	return a, b
+
+def analysis(sliceno, prepare_res):
+	a, b = prepare_res
+	for row in rows(sliceno):
+		a.write_list(row)
+	if sliceno % 2:
+		b.write_list(row)
+
+def fmt(t, v):
+	if t == 'unicode' and PY2:
+		return v.encode('utf-8')
+	if t == 'bytes' and PY3:
+		return v.decode('utf-8', errors='backslashreplace')
+	if t in ('float32', 'float64', 'number',):
+		return repr(v)
+	if t == 'json':
+		return dumps(v)
+	if t not in text_types:
+		return str(v)
+	return v
+
+def expected(chain, labels, sep, q, slices, sliced):
+	def line(values):
+		if q:
+			values = [q + v.replace(q, q + q) + q for v in values]
+		return sep.join(values) + '\n'
+	res = []
+	for sliceno in range(slices):
+		lines = []
+		if sliceno == 0 or sliced:
+			lines.append(line(labels))
+		for ds in chain:
+			for values in ds.iterate(sliceno, labels):
+				lines.append(line([fmt(ds.columns[n].type, v) for n, v in zip(labels, values)]))
+		res.append(''.join(lines).encode('utf-8') if PY3 else ''.join(lines))
+	return res
+
+def read(filename):
+	if filename.endswith('.gz'):
+		with gzip.open(filename, 'rb') as fh:
+			return fh.read()
+	else:
+		with open(filename, 'rb') as fh:
+			return fh.read()
+
+def synthesis(prepare_res, slices):
+	a, b = prepare_res
+	a = a.finish()
+	b = b.finish()
+	all_labels = sorted(test_data.data)
+	for filename, sep, q, labels, sliced in (
+		('out.csv', ',', '', [], False),
+		('out.gz', ',', '', [], False),
+		('out.csv', '\t', '"', [], False),
+		('out.gz', ';', "'", [], False),
+		('out.gz', '\xa7', '"', ['unicode', 'float64', 'bytes'], False),
+		('out.%d.csv', ',', '"', [], True),
+	):
+		jid = subjobs.build('csvexport', datasets=dict(source=b), options=dict(
+			filename=filename,
+			separator=sep,
+			quote_fields=q,
+			labels=labels,
+			sliced=sliced,
+			chain_source=True,
+		))
+		want = expected([a, b], labels or all_labels, sep, q, slices, sliced)
+		if sliced:
+			got = [read(jid.filename(filename % (sliceno,))) for sliceno in range(slices)]
+		else:
+			got = [read(jid.filename(filename))]
+			want = [b''.join(want)]
+		assert got == want, 'csvexport to %s with separator %r and quote %r gave %r, expected %r' % (filename, sep, q, got, want,)
@@ -0,0 +1,104 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test dataset_aggregate, both slice local and with partial aggregation.
+'''
+
+from accelerator.dataset import DatasetWriter, Dataset
+from accelerator import subjobs
+
+data = [
+	('abcde'[ix % 5], ix % 3, None if ix % 7 == 0 else ix % 10, ix * 0.25)
+	for ix in range(500)
+]
+
+aggregations = dict(
+	lines='count',
+	n_count='count n',
+	n_sum='sum n',
+	x_sum='sum x',
+	n_min='min n',
+	n_max='max n',
+	n_mean='mean n',
+	n_distinct='count_distinct n',
+	g1_max='max g1',
+)
+
+def prepare():
+	columns = dict(g1='unicode', g2='int32', x='float64', n=('int64', True))
+	a = DatasetWriter(name='a', columns=columns)
+	b = DatasetWriter(name='b', columns=columns, hashlabel='g1')
+	return a, b
+
+def analysis(sliceno, slices, prepare_res):
+	a, b = prepare_res
+	b.enable_hash_discard()
+	for ix, v in enumerate(data):
+		if ix % slices == sliceno:
+			a.write(*v)
+		b.write(*v)
+
+def expected(group_by):
+	groups = {}
+	for v in data:
+		row = dict(zip(('g1', 'g2', 'n', 'x',), v))
+		key = tuple(row[k] for k in group_by)
+		groups.setdefault(key, []).append(row)
+	res = set()
+	for key, rows in groups.items():
+		n = [row['n'] for row in rows if row['n'] is not None]
+		x = [row['x'] for row in rows]
+		res.add(key + (
+			max(row['g1'] for row in rows),
+			len(rows),
+			len(n),
+			len(set(n)),
+			max(n) if n else None,
+			sum(n) / len(n) if n else None,
+			min(n) if n else None,
+			sum(n),
+			sum(x),
+		))
+	return res
+
+def synthesis(prepare_res):
+	a, b = prepare_res
+	a = a.finish()
+	b = b.finish()
+	for group_by in (['g1'], ['g2'], ['g2', 'g1'],):
+		want = expected(group_by)
+		for source in (a, b,):
+			jid = subjobs.build('dataset_aggregate', datasets=dict(source=source), options=dict(
+				group_by=group_by,
+				aggregations=aggregations,
+			))
+			ds = Dataset(jid)
+			if source.hashlabel in group_by:
+				assert ds.hashlabel == source.hashlabel
+			else:
+				assert ds.hashlabel == group_by[0]
+			assert ds.columns['n_sum'].type == 'number'
+			assert ds.columns['x_sum'].type == 'float64'
+			assert ds.columns['g1_max'].type == 'unicode'
+			got = set(ds.iterate(None, group_by + sorted(aggregations)))
+			assert got == want, 'Grouping %s by %r gave %r, expected %r' % (source, group_by, got, want,)
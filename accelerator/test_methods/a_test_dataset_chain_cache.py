@@ -0,0 +1,88 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test that resolving a long chain only loads the datasets that have a
+cache of the previous ones, that the loaded datasets are kept in a
+bounded cache and that a changed dataset.pickle is loaded again.
+'''
+
+import os
+
+from accelerator.dataset import Dataset, DatasetWriter
+from accelerator import dataset
+from accelerator import blob
+
+def synthesis(job):
+	prev = None
+	for ix in range(200):
+		dw = DatasetWriter(name="ds%d" % (ix,), previous=prev)
+		dw.add("ix", "number")
+		dw.get_split_write()(ix)
+		prev = dw.finish()
+
+	loaded = []
+	def counting_load(fn, *a, **kw):
+		loaded.append(fn)
+		return org_load(fn, *a, **kw)
+	org_load = blob.load
+	blob.load = counting_load
+	try:
+		dataset._ds_cache.clear()
+		chain = Dataset(job, "ds199").chain()
+		# The cache points are every 64 datasets (ds63, ds127, ds191),
+		# so ds199 down to ds191 and then ds127 and ds63 are loaded.
+		want = ["ds%d/dataset.pickle" % (ix,) for ix in list(range(199, 190, -1)) + [127, 63]]
+		assert loaded == [job.filename(fn) for fn in want], loaded
+		# .previous on the chain members should not load anything either.
+		assert [ds.previous for ds in chain[1:]] == chain[:-1]
+		assert len(loaded) == 11, loaded
+		assert chain == [Dataset(job, "ds%d" % (ix,)) for ix in range(200)]
+		for ix, ds in enumerate(chain):
+			assert ds.lines == Dataset(job, "ds%d" % (ix,)).lines
+			assert ds.columns == Dataset(job, "ds%d" % (ix,)).columns
+		assert list(Dataset(job, "ds199").iterate_chain(None, "ix")) == list(range(200))
+		assert Dataset(job, "ds199").chain(length=3) == chain[-3:]
+		assert Dataset(job, "ds199").chain(stop_ds=Dataset(job, "ds100")) == chain[101:]
+
+		# Loading things again uses the cache, unless the file has changed.
+		del loaded[:]
+		Dataset(job, "ds10")
+		assert loaded == []
+		fn = job.filename("ds10/dataset.pickle")
+		st = os.stat(fn)
+		os.utime(fn, (st.st_atime, st.st_mtime + 10))
+		Dataset(job, "ds10")
+		assert loaded == [fn], loaded
+
+		# The cache is bounded
+		org_size = dataset._ds_cache_size
+		dataset._ds_cache_size = 5
+		try:
+			for ix in range(20):
+				Dataset(job, "ds%d" % (ix,))
+			assert len(dataset._ds_cache) == 5
+			assert list(dataset._ds_cache) == [job.filename("ds%d/dataset.pickle" % (ix,)) for ix in range(15, 20)]
+		finally:
+			dataset._ds_cache_size = org_size
+	finally:
+		blob.load = org_load
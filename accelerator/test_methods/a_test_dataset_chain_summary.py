@@ -0,0 +1,103 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test the chain summaries in datasets: DatasetChain gives the same
+answers with them as without, and iterate_chain with a range stops
+loading datasets when no earlier dataset can have lines in range.
+'''
+
+from datetime import date
+
+from accelerator.dataset import Dataset, DatasetWriter, DatasetChain
+from accelerator import dataset
+from accelerator import blob
+
+def synthesis(job, slices):
+	prev = None
+	for ix in range(10):
+		dw = DatasetWriter(name="ds%d" % (ix,), previous=prev)
+		dw.add("ix", "int32")
+		dw.add("f", "float64", none_support=(ix == 3))
+		if ix % 3 == 0:
+			dw.add("sometimes", "ascii")
+		if ix in (4, 5):
+			dw.add("mixed", "int64" if ix == 4 else "date")
+		write = dw.get_split_write()
+		if ix != 6: # leave one empty
+			for v in range(ix * 100, ix * 100 + 10 + ix):
+				values = [v, v / 3]
+				if ix % 3 == 0:
+					values.append("a")
+				if ix in (4, 5):
+					values.append(v if ix == 4 else date(2000, 1, 1 + ix))
+				write(*values)
+		prev = dw.finish()
+
+	chain = Dataset(job, "ds9").chain()
+	assert chain._summary(), "No summary on a whole chain"
+	assert not Dataset(job, "ds9").chain(length=3)._summary()
+	assert not Dataset(job, "ds9").chain(stop_ds=Dataset(job, "ds2"))._summary()
+	plain = DatasetChain(list(chain))
+	assert not plain._summary()
+	for col in ("ix", "f", "sometimes", "nonexistent"):
+		assert chain.min(col) == plain.min(col), col
+		assert chain.max(col) == plain.max(col), col
+		assert chain.none_support(col) == plain.none_support(col), col
+		assert chain.column_count(col) == plain.column_count(col), col
+	assert chain.min("ix") == 0 and chain.max("ix") == 918
+	assert chain.none_support("f") and not chain.none_support("ix")
+	assert chain.column_count("sometimes") == 4
+	assert chain.column_counts() == plain.column_counts()
+	for sliceno in (None,) + tuple(range(slices)):
+		assert chain.lines(sliceno) == plain.lines(sliceno)
+	assert chain.lines() == sum(10 + ix for ix in range(10) if ix != 6)
+	# The mixed column can't be summarised, so this is an error as before.
+	for c in (chain, plain):
+		try:
+			c.min("mixed")
+			raise Exception("min over int64 and date did not fail")
+		except TypeError:
+			pass
+	# A changed chain is no longer summarised
+	chain.pop()
+	assert not chain._summary()
+	assert chain.lines() == plain.lines() - 19
+
+	loaded = []
+	def counting_load(fn, *a, **kw):
+		loaded.append(fn)
+		return org_load(fn, *a, **kw)
+	org_load = blob.load
+	blob.load = counting_load
+	try:
+		dataset._ds_cache.clear()
+		got = list(Dataset(job, "ds9").iterate_chain(None, "ix", range={"ix": (705, None)}))
+		# ds9, ds8, and ds7 (which has ix >= 705), but nothing before ds7.
+		assert len(loaded) == 3, loaded
+		assert got == list(plain.iterate(None, "ix", range={"ix": (705, None)}))
+		del loaded[:]
+		got = list(Dataset(job, "ds9").iterate_chain(None, "ix", range={"ix": (None, 705)}, sloppy_range=True))
+		assert got == list(plain.iterate(None, "ix", range={"ix": (None, 705)}, sloppy_range=True))
+		assert len(loaded) == 7, loaded # nothing can be pruned going backwards here
+	finally:
+		blob.load = org_load
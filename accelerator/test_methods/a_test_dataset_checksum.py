@@ -45,10 +45,14 @@ def prepare():
 	a = DatasetWriter(name="a", columns=columns)
 	b = DatasetWriter(name="b", columns=columns, previous=a)
 	c = DatasetWriter(name="c", columns=columns)
-	return a, b, c
+	d = DatasetWriter(name="d", columns=dict(int=("int64", True)))
+	e = DatasetWriter(name="e", columns=dict(int=("int64", True)))
+	return a, b, c, d, e
 
 def analysis(sliceno, prepare_res):
-	a, b, c = prepare_res
+	a, b, c, d, e = prepare_res
+	d.write(None)
+	e.write(0)
 	if sliceno == 0:
 		for data in test_data[:2]:
 			a.write_list(data)
@@ -69,10 +73,12 @@ def ck(jid, method="dataset_checksum", **kw):
 	return blob.load(jobid=jid).sum
 
 def synthesis(prepare_res):
-	a, b, c = prepare_res
+	a, b, c, d, e = prepare_res
 	a = a.finish()
 	b = b.finish()
 	c = c.finish()
+	d = d.finish()
+	e = e.finish()
 	a_sum = ck(a)
 	b_sum = ck(b)
 	c_sum = ck(c)
@@ -87,3 +93,19 @@ def synthesis(prepare_res):
 	a_uns_sum = ck(a, sort=False)
 	b_uns_sum = ck(b, sort=False)
 	assert a_uns_sum != b_uns_sum # they are not the same order
+	a_str_sum = ck(a, streaming=True)
+	b_str_sum = ck(b, streaming=True, sort=False)
+	c_str_sum = ck(c, streaming=True)
+	assert a_str_sum == b_str_sum # streaming never depends on order
+	assert a_str_sum != c_str_sum
+	assert a_str_sum not in (a_sum, a_uns_sum,)
+	assert ck(b, "dataset_checksum_chain", streaming=True) == 0
+	assert ck(c, "dataset_checksum_chain", streaming=True) == c_str_sum
+	assert ck(a, streaming=True, columns={"int"}) != ck(a, streaming=True, columns={"float"})
+	assert ck(d, streaming=True) != ck(e, streaming=True) # None and 0 differ
+	# single_job gives the same sums as building a job per dataset
+	for kw in (dict(), dict(sort=False), dict(streaming=True), dict(columns={"int", "json"})):
+		for ds in (b, c):
+			want = ck(ds, "dataset_checksum_chain", **kw)
+			got = ck(ds, "dataset_checksum_chain", single_job=True, **kw)
+			assert want == got, "%s with %r: single_job gave %x, expected %x" % (ds, kw, got, want,)
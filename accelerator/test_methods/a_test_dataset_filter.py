@@ -0,0 +1,133 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test dataset_filter against filtering in python, including skipping
+datasets by min/max and keeping the slices of hashed datasets.
+'''
+
+import operator
+from datetime import datetime
+
+from accelerator import subjobs
+from accelerator.dataset import Dataset
+
+from . import test_data
+
+depend_extra = (test_data,)
+
+ops = {
+	"==": operator.eq, "!=": operator.ne,
+	"<": operator.lt, "<=": operator.le,
+	">": operator.gt, ">=": operator.ge,
+	"in": lambda v, values: v in values,
+	"not in": lambda v, values: v not in values,
+}
+
+def matches(row, cond):
+	column, op = cond[:2]
+	v = row[column]
+	if op == "is None":
+		return v is None
+	if op == "is not None":
+		return v is not None
+	if v is None:
+		return False
+	value = cond[2]
+	if column in ("d", "dt"):
+		value = [parse(column, x) for x in value] if isinstance(value, list) else parse(column, value)
+	return ops[op](v, value)
+
+def parse(column, text):
+	if column == "d":
+		return datetime.strptime(text, "%Y-%m-%d").date()
+	return datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
+
+def nan_free(row):
+	# NaN is not equal to itself, so it would never compare equal.
+	return {k: "NaN" if v != v else v for k, v in row.items()}
+
+def verify(source, conditions, slices, previous=None, want_datasets=None):
+	jid = subjobs.build("dataset_filter", datasets=dict(source=source, previous=previous), options=dict(filter=conditions))
+	ds = Dataset(jid)
+	names = sorted(test_data.numbered_columns)
+	chain = ds.chain(stop_ds=previous)
+	if want_datasets is not None:
+		assert len(chain) == want_datasets, "%s: %d datasets, expected %d" % (ds, len(chain), want_datasets,)
+	src_chain = Dataset(source).chain(stop_ds={previous.job: "source"} if previous else None)
+	for sliceno in range(slices):
+		want = [nan_free(row) for d in src_chain for row in (dict(zip(names, t)) for t in d.iterate(sliceno, names)) if all(matches(row, c) for c in conditions)]
+		got = [nan_free(dict(zip(names, t))) for t in Dataset.iterate_list(sliceno, names, chain)]
+		assert got == want, "%s slice %d: %r != %r (%r)" % (ds, sliceno, got[:5], want[:5], conditions,)
+	return ds
+
+def synthesis(slices):
+	a = test_data.write_numbered("a", 0, 500)
+	b = test_data.write_numbered("b", 500, 1000, previous=a)
+	c = test_data.write_numbered("c", 1000, 1500, previous=b)
+	h = test_data.write_numbered("h", 0, 700, hashlabel="i")
+	for conditions, want_datasets in (
+		([], 3),
+		([["i", ">=", 600]], 2),
+		([["i", ">=", 600], ["i", "<", 700]], 1),
+		([["i", "<", 600], ["f", ">", 100.5]], 2),
+		([["i", "==", 2000]], 1), # no match, but still a dataset
+		([["i", "in", [1, 2, 1400, 1800]]], 2),
+		([["i", "in", [5000, -1]]], 1), # all pruned, but still a dataset
+		([["i", "not in", [5000, -1]]], 3),
+		# Outside min/max, but None still doesn't match "not in".
+		([["i32", "not in", [5000, 1]]], 3),
+		([["f", "not in", [5000.5, -1.5]]], 3),
+		([["n", "not in", [5000]]], 3),
+		# NaN matches "!=" and "not in" (like in python), but nothing else.
+		([["g", "not in", [0.25, 2]]], 3),
+		([["g", "!=", 0.25]], 3),
+		([["g", "==", 0.25]], 1),
+		([["g", "not in", [5000.5, -1.5]]], 3),
+		([["g", "!=", -1.5]], 3),
+		([["g", ">", -1.5]], 3),
+		([["i", "not in", [1, 2, 1400]], ["n", "is not None"]], 3),
+		([["u", "in", ["\xe53", "\xe54"]]], 3),
+		([["u", ">=", "\xe55"], ["a", "!=", "a3"]], 3),
+		([["u", "is None"]], 3),
+		([["f", "is None"], ["i", ">", 1200]], 1),
+		([["i", "==", 2.5]], 1),
+		([["n", "<", 10.5]], 1),
+		([["d", ">=", "2005-01-10"]], 2),
+		([["d", "in", ["2001-01-03", "2014-01-01"]]], 2),
+		([["dt", "<", "2019-01-01 03:00:00"]], 3),
+	):
+		verify(c, conditions, slices, want_datasets=want_datasets)
+	# Chaining to a previous filter only filters the new datasets.
+	first = verify(a, [["i", ">", 300]], slices)
+	second = verify(c, [["i", ">", 300]], slices, previous=first, want_datasets=2)
+	assert second.chain() == [first] + second.chain(stop_ds=first)
+	# Hashed datasets stay hashed (and in the right slices).
+	ds = verify(h, [["i", "<", 300], ["a", "in", ["a1", "a2"]]], slices)
+	assert ds.hashlabel == "i"
+	# Bad conditions
+	for conditions in ([["nonexistent", "==", 1]], [["j", "is None"]], [["i", "=", 1]], [["i", "in", 1]]):
+		try:
+			subjobs.build("dataset_filter", datasets=dict(source=c), options=dict(filter=conditions))
+			raise Exception("%r was accepted" % (conditions,))
+		except subjobs.JobError:
+			pass
@@ -0,0 +1,108 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test iterating with filters and range, where the filter and range columns
+are read first and the other columns only decode the selected lines.
+Compares to filtering the full iteration in python, with chunks both
+larger and smaller than the slices. Filters must only be called for
+lines that are still selected.
+'''
+
+from accelerator import dataset
+from accelerator.dataset import Dataset
+
+from . import test_data
+
+depend_extra = (test_data,)
+
+names = ["b", "f", "i", "j", "n", "u"]
+
+def write(name, start, stop, previous=None):
+	return test_data.write_numbered(name, start, stop, names, previous=previous)
+
+def reference(sliceno, chain, filters={}, translators={}, range=None, rows=None):
+	res = []
+	for d in chain:
+		for line in d.iterate(sliceno, names, rows=rows):
+			line = dict(zip(names, line))
+			if range:
+				k, (bottom, top) = next(iter(range.items()))
+				if (bottom is not None and line[k] < bottom) or (top is not None and line[k] >= top):
+					continue
+			for k, trans in translators.items():
+				line[k] = (trans if callable(trans) else trans.get)(line[k])
+			if all((f or bool)(line[k]) for k, f in filters.items()):
+				res.append(tuple(line[k] for k in names))
+	return res
+
+def only_in_range(v):
+	assert v is None or 10 <= v < 20, v
+	return True
+
+def mostly_in_range(v):
+	assert 5 <= v < 1090, v
+	return v % 10
+
+def check(chain, slices, **kw):
+	for sliceno in range(slices):
+		want = reference(sliceno, chain, **kw)
+		got = list(Dataset.iterate_list(sliceno, names, chain, **kw))
+		assert got == want, "slice %d with %r: %r != %r" % (sliceno, kw, got[:5], want[:5],)
+
+def synthesis(slices):
+	a = write("a", 0, 300)
+	b = write("b", 300, 1000, a)
+	c = write("c", 1000, 1100, b)
+	chain = c.chain()
+	for chunk in (dataset._SELECT_CHUNK, 7, 1):
+		dataset._SELECT_CHUNK = chunk
+		check(chain, slices, filters={"i": lambda v: v % 10 == 0})
+		check(chain, slices, filters={"u": None})
+		check(chain, slices, filters={"n": lambda v: v is not None and v < 100, "u": "\xe52".__eq__})
+		check(chain, slices, filters={"b": b"".__eq__}, translators={"i": str, "n": {1: "one"}})
+		check(chain, slices, filters={"n": None}, translators={"n": {1: "one", 5: "five"}})
+		check(chain, slices, filters={"i": lambda v: False})
+		check(chain, slices, range={"i": (100, 350)})
+		check(chain, slices, range={"i": (3, 905)}, translators={"i": str})
+		check(chain, slices, range={"i": (None, 720)}, filters={"i": lambda v: v % 3}, translators={"i": (1).__add__})
+		check(chain, slices, range={"i": (60, 120)}, filters={"j": lambda v: v[1]["x"] == 1})
+		check([b], slices, filters={"i": lambda v: v % 2}, rows=(17, 150))
+		# Filters are only called for lines the range and the filters
+		# before them (in column order) have not already rejected.
+		check(chain, slices, filters={"f": None, "u": lambda v: v.endswith("1")})
+		check(chain, slices, range={"i": (30, 60)}, filters={"f": only_in_range})
+		check(chain, slices, range={"i": (30, 60)}, filters={"i": lambda v: 30 <= v < 60})
+		check([b], slices, range={"i": (500, 800)}, rows=(40, None))
+		# These keep most lines, so after the first chunk the rest is
+		# filtered after reading all columns.
+		check(chain, slices, filters={"i": lambda v: v % 10, "f": None})
+		check(chain, slices, range={"i": (5, 1090)}, filters={"i": mostly_in_range, "f": None})
+	# A callable filter together with a range.
+	got = list(Dataset.iterate_list(0, ["i", "u"], c, range={"i": (1010, 1080)}, filters=lambda t: t[0] % 2))
+	assert got == [t for t in c.iterate(0, ["i", "u"]) if 1010 <= t[0] < 1080 and t[0] % 2], got
+	# Lines are still yielded as tuples when only selecting columns are wanted.
+	got = list(c.iterate(0, ["i"], filters={"i": lambda v: v % 2}))
+	assert got == [(v,) for v in c.iterate(0, "i") if v % 2], got
+	# And the single column case is not affected.
+	got = list(c.iterate(0, "i", filters={"i": lambda v: v % 2}))
+	assert got == [v for v in c.iterate(0, "i") if v % 2], got
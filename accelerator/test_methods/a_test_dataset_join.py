@@ -0,0 +1,101 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test dataset_join, hashed and unhashed, with and without spilling.
+Right bits columns become number in left joins.
+'''
+
+from collections import Counter
+
+from accelerator.dataset import DatasetWriter, Dataset
+from accelerator import subjobs
+
+left_data = [(k % 17 if k % 11 else None, 'left %d' % (k,)) for k in range(200)]
+right_data = [(k % 23 if k % 13 else None, k * 1.5, 2 ** 63 + k) for k in range(150)]
+fields = dict(left=('key', 'value',), right=('id', 'value', 'bits',))
+
+def prepare():
+	res = {}
+	for name, data, hashlabel in (
+		('left', left_data, None),
+		('left_hashed', left_data, 'key'),
+		('right', right_data, None),
+		('right_hashed', right_data, 'id'),
+	):
+		if name.startswith('left'):
+			columns = dict(key=('int32', True), value='unicode')
+		else:
+			columns = dict(id=('int32', True), value='float64', bits='bits64')
+		dw = DatasetWriter(name=name, columns=columns, hashlabel=hashlabel)
+		res[name] = dw
+	return res
+
+def analysis(sliceno, prepare_res):
+	for name, data in (('left', left_data), ('right', right_data)):
+		for dw in (prepare_res[name], prepare_res[name + '_hashed']):
+			if dw.hashlabel:
+				dw.enable_hash_discard()
+				for v in data:
+					dw.write_dict(dict(zip(fields[name], v)))
+			elif sliceno == 0:
+				for v in data:
+					dw.write_dict(dict(zip(fields[name], v)))
+
+def expected(how):
+	res = []
+	for k, lv in left_data:
+		matches = [r[1:] for r in right_data if k is not None and r[0] == k]
+		if how == 'semi':
+			if matches:
+				res.append((k, lv,))
+		elif matches:
+			res.extend((k, lv,) + rv for rv in matches)
+		elif how == 'left':
+			res.append((k, lv, None, None,))
+	return Counter(res)
+
+def synthesis(prepare_res):
+	dss = {name: dw.finish() for name, dw in prepare_res.items()}
+	for how in ('inner', 'left', 'semi',):
+		want = expected(how)
+		for left in ('left', 'left_hashed',):
+			for right in ('right', 'right_hashed',):
+				for max_build_lines in (0, 7,):
+					jid = subjobs.build('dataset_join', datasets=dict(left=dss[left], right=dss[right]), options=dict(
+						column='key',
+						right_column='id',
+						how=how,
+						right_prefix='right_',
+						max_build_lines=max_build_lines,
+					))
+					ds = Dataset(jid)
+					assert ds.hashlabel == 'key'
+					if how == 'semi':
+						assert sorted(ds.columns) == ['key', 'value']
+						columns = ['key', 'value']
+					else:
+						assert sorted(ds.columns) == ['key', 'right_bits', 'right_value', 'value']
+						columns = ['key', 'value', 'right_value', 'right_bits']
+						assert ds.columns['right_bits'].type == ('number' if how == 'left' else 'bits64')
+					got = Counter(ds.iterate(None, columns))
+					assert got == want, '%s join of %s and %s (max_build_lines=%d) gave wrong result' % (how, left, right, max_build_lines,)
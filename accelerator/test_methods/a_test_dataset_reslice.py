@@ -0,0 +1,112 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test dataset_reslice, from datasets written with more and fewer slices
+than we have. Unhashed datasets must keep their roundrobin order, hashed
+ones must end up in the right slices.
+'''
+
+import os
+import shutil
+
+from accelerator import subjobs
+from accelerator import g
+from accelerator.dataset import Dataset, DatasetWriter
+from accelerator.gzwrite import typed_writer
+from accelerator.job import WORKDIRS
+
+from . import test_data
+
+depend_extra = (test_data,)
+
+# Not g, as NaN would not compare equal.
+columns = {n: c for n, c in test_data.numbered_columns.items() if n != "g"}
+
+def with_slices(slices, f, *a):
+	"""Run f as if there were this many slices"""
+	org_slices = g.slices
+	g.slices = slices
+	try:
+		return f(*a)
+	finally:
+		g.slices = org_slices
+
+def write(name, slices, start, lens, previous=None, hashlabel=None):
+	dw = DatasetWriter(name=name, columns=columns, previous=previous, hashlabel=hashlabel, sketches=["i", "u"])
+	v = start
+	for sliceno in range(slices):
+		dw.set_slice(sliceno)
+		if hashlabel:
+			dw.enable_hash_discard()
+		for _ in range(lens[sliceno]):
+			line = test_data.numbered_line(v)
+			dw.write_dict({n: line[n] for n in columns})
+			v += 1
+	return dw.finish()
+
+def contents(ds, slices):
+	"""[values in roundrobin order] for each dataset in the chain"""
+	return [list(with_slices(slices, d.iterate, "roundrobin", sorted(columns))) for d in ds.chain()]
+
+def verify(source, source_slices, slices, previous=None, **options):
+	ds = Dataset(subjobs.build("dataset_reslice", options=dict(source=source, **options), datasets=dict(previous=previous)))
+	want = contents(Dataset(source), source_slices)
+	got = contents(ds, slices)
+	for dsno, (s, d) in enumerate(zip(ds.chain(), Dataset(source).chain())):
+		assert len(s.lines) == slices, s
+		assert s.hashlabel == d.hashlabel, s
+		for n, c in d.columns.items():
+			assert s.columns[n].type == c.type, (s, n)
+			assert (s.columns[n].min, s.columns[n].max) == (c.min, c.max), (s, n)
+		assert s.sketch("i").distinct() == d.sketch("i").distinct(), s
+		if d.hashlabel:
+			assert sorted(got[dsno]) == sorted(want[dsno]), s
+			h = typed_writer(columns[d.hashlabel][0]).hash
+			for sliceno in range(slices):
+				for v in s.iterate(sliceno, d.hashlabel):
+					assert h(v) % slices == sliceno, "%s: %r in slice %d" % (s, v, sliceno,)
+		else:
+			assert got[dsno] == want[dsno], s
+	assert len(got) == len(want), ds
+	return ds
+
+def synthesis(job, slices):
+	many = slices + 2
+	# Not sorted by length, to verify the order is kept anyway.
+	a = with_slices(many, write, "a", many, 0, [20, 3, 40, 0] + [9] * (many - 4))
+	b = with_slices(many, write, "b", many, 1000, [300] * many, a, "i")
+	one = with_slices(1, write, "one", 1, 2000, [1000])
+	verify(a, many, slices)
+	verify(one, 1, slices)
+	both = verify(b, many, slices)
+	assert len(both.chain()) == 2
+	# Continuing a resliced chain only takes the new part.
+	first = verify(a, many, slices)
+	second = verify(b, many, slices, previous=first)
+	assert second.chain() == [first, second]
+	# A dataset from a workdir that is not in our config.
+	fakewd = job.filename("fakewd")
+	os.makedirs(os.path.join(fakewd, "fakewd-0", "a"))
+	shutil.copy(a.job.filename("a/dataset.pickle"), os.path.join(fakewd, "fakewd-0", "a"))
+	WORKDIRS["fakewd"] = fakewd # so we can read it here too
+	verify("fakewd-0/a", many, slices, source_workdirs=dict(fakewd=fakewd))
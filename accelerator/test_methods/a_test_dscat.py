@@ -0,0 +1,59 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test dscat --range on number and text columns, compared to selecting the
+same lines in python.
+'''
+
+import os
+import sys
+import subprocess
+
+from . import test_data
+
+depend_extra = (test_data,)
+
+def dscat(*args):
+	cmd = [sys.executable, "-c", "import sys; from accelerator.dscat import main; sys.exit(main(sys.argv[1:]))", "dscat"]
+	cmd.extend(a.encode("utf-8") if sys.version_info[0] == 2 else a for a in args)
+	env = dict(os.environ, PYTHONUTF8="1") # so non-ascii arguments work in the C locale
+	return subprocess.check_output(cmd, env=env).decode("utf-8")
+
+def check(ds, column, bottom, top):
+	fmt = lambda v: "" if v is None else v.decode("ascii") if isinstance(v, bytes) else "%s" % (v,)
+	path = ds.job.filename(ds.name)
+	got = dscat("-r", "%s=%s:%s" % (column, fmt(bottom), fmt(top)), path, "i")
+	got = sorted(int(v) for v in got.split())
+	values = ds.iterate(None, ["i", column])
+	want = sorted(i for i, v in values if v is not None and (bottom is None or v >= bottom) and (top is None or v < top))
+	assert got == want, "%s %s=%r:%r: %r != %r" % (ds, column, bottom, top, got, want,)
+	return got
+
+def synthesis():
+	ds = test_data.write_numbered("numbered", 0, 300, ["i", "u", "a", "b"])
+	assert check(ds, "i", 10, 20) == list(range(10, 20))
+	assert check(ds, "u", "\xe51", "\xe53")
+	assert check(ds, "u", None, "\xe52")
+	assert check(ds, "a", "a1", "a2")
+	assert check(ds, "a", "a25", None)
+	assert check(ds, "b", b"xx", b"xxxxx")
@@ -0,0 +1,65 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2020 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test analysis_res.merge_auto, sequential and parallel.
+Both should give the same result.
+'''
+
+from collections import Counter, defaultdict
+
+from accelerator import subjobs
+
+options = dict(
+	parallel=None,
+)
+
+def analysis(sliceno):
+	if options.parallel is None:
+		return
+	c = Counter({sliceno: sliceno, 'common': 1})
+	d = defaultdict(set)
+	d['common'].add(sliceno)
+	d[sliceno].add('x')
+	over = {'over': sliceno}
+	empty = {} if sliceno % 2 else {'nonempty': {'a': sliceno}}
+	# Only the first slice shows the depth, the rest have empty values.
+	# (Slice 2 first in a pair would look like it has an empty value.)
+	deep = {'a': {'x': {sliceno}}} if sliceno == 0 else {sliceno: {}}
+	return sliceno, c, dict(d), over, empty, [sliceno], deep
+
+def synthesis(params, analysis_res):
+	if options.parallel is None:
+		seq = subjobs.build('test_merge_auto', options=dict(parallel=False)).load()
+		par = subjobs.build('test_merge_auto', options=dict(parallel=True)).load()
+		assert seq == par, '%r != %r' % (seq, par,)
+		slices = params.slices
+		assert seq[0] == sum(range(slices))
+		assert seq[1]['common'] == slices
+		assert seq[2]['common'] == set(range(slices))
+		assert seq[3] == {'over': slices - 1}
+		assert seq[5] == list(range(slices))
+		want = {sliceno: {} for sliceno in range(1, slices)}
+		want['a'] = {'x': {0}}
+		assert seq[6] == want
+	else:
+		return tuple(analysis_res.merge_auto(parallel=options.parallel))
@@ -0,0 +1,63 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2020 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test SharedDict as prepare_res (with GC enabled in analysis).
+'''
+
+import gc
+
+from accelerator.extras import SharedDict
+from accelerator.compat import pickle
+
+def mkdict():
+	d = {ix: 'value %d' % (ix,) for ix in range(10000)}
+	d['none'] = None
+	d[('a', 'tuple')] = [1, 2, 3]
+	d[2.5] = {'nested': 'dict'}
+	return d
+
+def prepare():
+	return SharedDict(mkdict())
+
+def analysis(sliceno, prepare_res):
+	gc.enable()
+	gc.collect()
+	want = mkdict()
+	assert len(prepare_res) == len(want)
+	assert dict(prepare_res.items()) == want
+	assert set(prepare_res) == set(want)
+	for k, v in want.items():
+		assert prepare_res[k] == v, k
+	assert 7.0 in prepare_res # same as 7
+	assert prepare_res['none'] is None
+	assert prepare_res.get('missing', sliceno) == sliceno
+	assert 10000 not in prepare_res
+	try:
+		prepare_res[-1]
+		raise Exception("SharedDict has a -1 key")
+	except KeyError:
+		pass
+
+def synthesis(prepare_res):
+	assert pickle.loads(pickle.dumps(prepare_res)) == mkdict()
+	assert SharedDict() == {}
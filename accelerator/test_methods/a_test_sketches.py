@@ -0,0 +1,84 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2019 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test distinct count and quantile sketches in datasets.
+'''
+
+from accelerator.dataset import DatasetWriter
+
+def close_to(got, want, margin):
+	return abs(got - want) <= want * margin
+
+def prepare():
+	columns = dict(i='int64', f=('float64', True), u='unicode', j='json')
+	a = DatasetWriter(name='a', columns=columns, sketches=True)
+	b = DatasetWriter(name='b', columns=columns, previous=a, sketches=['i', 'f'])
+	c = DatasetWriter(name='c', columns=columns, previous=b)
+	return a, b, c
+
+def analysis(sliceno, slices, prepare_res):
+	a, b, c = prepare_res
+	# (columns are written in sorted order: f, i, j, u)
+	for ix in range(sliceno, 30000, slices):
+		a.write(ix / 10 if ix % 5 else None, ix % 3000, ix, 'u%d' % (ix % 1000,))
+		b.write(ix / 10 + 3000, ix % 3000 + 3000, None, 'x')
+		c.write(0.0, ix, None, 'x')
+
+def synthesis(prepare_res, slices):
+	a, b, c = prepare_res
+	a = a.finish()
+	b = b.finish()
+	c = c.finish()
+
+	s = a.sketch('i')
+	assert close_to(s.distinct(), 3000, 0.05), s
+	assert s.seen == 30000
+	assert close_to(s.quantile(0.5), 1500, 0.1), s.quantile(0.5)
+	assert s.quantiles(2)[0] <= 30 and s.quantiles(2)[2] >= 2970, s.quantiles(2)
+	for sliceno in range(slices):
+		ss = a.sketch('i', sliceno)
+		assert ss.seen == a.lines[sliceno]
+	s = a.sketch('f')
+	assert s.seen == 24000, "None values should not be counted"
+	assert close_to(s.distinct(), 24000, 0.05), s
+	assert close_to(s.quantile(0.25), 750, 0.1), s.quantile(0.25)
+	s = a.sketch('u')
+	assert close_to(s.distinct(), 1000, 0.05), s
+	assert s.quantile(0.5) is None, "Only numeric columns have quantiles"
+	assert a.sketch('j') is None, "json does not have sketches"
+	# The sketches are in a separate file, so they don't end up in the
+	# caches of later datasets.
+	assert set(a._data.sketches.values()) == {'%s/a/dataset.sketches' % (a.job,)}, a._data.sketches
+
+	assert b.sketch('u') is None
+	chain = b.chain()
+	s = chain.sketch('i')
+	assert close_to(s.distinct(), 6000, 0.05), s
+	assert close_to(s.quantile(0.5), 3000, 0.1), s.quantile(0.5)
+	assert chain.sketch('f').seen == 54000
+	assert c.chain().sketch('i') is None, "c has no sketches, so the chain doesn't either"
+
+	# Filtering columns keeps the sketches for the remaining columns.
+	d = a.link_to_here('d', column_filter=['i'])
+	assert close_to(d.sketch('i').distinct(), 3000, 0.05)
+	assert d.sketch('f') is None
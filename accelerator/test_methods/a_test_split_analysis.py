@@ -0,0 +1,70 @@
+############################################################################
+#                                                                          #
+# Copyright (c) 2020 Carl Drougge                                          #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#  http://www.apache.org/licenses/LICENSE-2.0                              #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+#                                                                          #
+############################################################################
+
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+
+description = r'''
+Test split_analysis on a skewed dataset.
+Without a source this builds one (almost everything in slice 0)
+and then runs itself as a subjob on it.
+'''
+
+from accelerator.dataset import DatasetWriter, Dataset
+from accelerator import subjobs
+
+datasets = ('source',)
+
+split_analysis = 'source'
+
+def prepare(params):
+	if datasets.source:
+		return
+	dw = DatasetWriter()
+	dw.add('a', 'int64')
+	dw.add('b', 'ascii')
+	dw.add('c', 'number')
+	for sliceno, count in enumerate([20000, 3] + [0] * (params.slices - 2)):
+		dw.set_slice(sliceno)
+		for ix in range(count):
+			dw.write(ix, 'x' * (ix % 300), ix * 1.5 if ix % 3 else ix)
+
+def analysis(sliceno, rows):
+	if datasets.source:
+		return sliceno, rows, list(datasets.source.iterate(sliceno, rows=rows))
+	else:
+		assert rows is None
+
+def synthesis(params, analysis_res):
+	if not datasets.source:
+		subjobs.build('test_split_analysis', datasets=dict(source=Dataset(params.jobid)))
+		return
+	analysis_res = list(analysis_res)
+	assert len(analysis_res) > params.slices, "Slices were not split"
+	pos = [0] * params.slices
+	got = [[] for _ in range(params.slices)]
+	for sliceno, (start, stop), values in analysis_res:
+		assert start == pos[sliceno]
+		assert len(values) == stop - start
+		pos[sliceno] = stop
+		got[sliceno].extend(values)
+	for sliceno in range(params.slices):
+		assert pos[sliceno] == datasets.source.lines[sliceno]
+		want = list(datasets.source.iterate(sliceno))
+		assert got[sliceno] == want, "Slice %d differs" % (sliceno,)
@@ -97,6 +97,16 @@ def main(urd):
 	dep_jl = list(urd.peek("tests_urd", 1000000000).deps.values())[0].joblist
 	assert dep_jl == [job]
 	assert urd.peek("tests_urd", ('2017-06-27 17:00:00', 42)).timestamp == '2017-06-27T17:00:00+42'
+	lookups = [("tests_urd", 2), ("tests_urd", "latest"), ("tests_urd", "first"), ("tests_urd", "<1978-01-01+1"), ("tests_urd", ">=2018-01"), ("tests_urd", 3)]
+	bulk = urd.peek_many(lookups)
+	assert bulk == [urd.peek(path, ts) for path, ts in lookups], bulk
+	assert [r.timestamp for r in bulk] == ['2', '2019-12+3', '1', '1978-01-01+0', '2019-12+3', '0']
+	assert not bulk[-1]
+	urd.begin("tests_urd_bulk")
+	bulk = urd.get_many([("tests_urd", "latest"), ("tests_urd_nonexistent", "first")])
+	assert bulk[0].timestamp == '2019-12+3' and not bulk[1]
+	assert list(urd._deps) == [urd._path("tests_urd")]
+	urd.abort()
 	while ordered_ts:
 		urd.truncate("tests_urd", ordered_ts.pop())
 		assert urd.since("tests_urd", 0) == ordered_ts, ordered_ts
@@ -124,6 +134,7 @@ def main(urd):
 	reimp_csv_quoted = urd.build("csvimport", filename=csv_quoted.filename(csvname), quotes=True)
 	urd.build("test_compare_datasets", a=reimp_csv, b=reimp_csv_uncompressed)
 	urd.build("test_compare_datasets", a=reimp_csv, b=reimp_csv_quoted)
+	urd.build("test_csvexport_formatting")
 	urd.build("test_dataset_column_names")
 	urd.build("test_dataset_merge")
 
@@ -154,6 +165,8 @@ def main(urd):
 	print("Testing dataset chaining, filtering, callbacks and rechaining")
 	selfchain = urd.build("test_selfchain")
 	urd.build("test_rechain", jobs=dict(selfchain=selfchain))
+	urd.build("test_dataset_chain_cache")
+	urd.build("test_dataset_chain_summary")
 
 	print()
 	print("Testing dataset sorting and rehashing (with subjobs again)")
@@ -161,6 +174,10 @@ def main(urd):
 	urd.build("test_sort_stability")
 	urd.build("test_sort_chaining")
 	urd.build("test_rehash")
+	urd.build("test_dataset_reslice")
+	urd.build("test_dataset_filter")
+	urd.build("test_dataset_iterate_selected")
+	urd.build("test_dscat")
 	urd.build("test_dataset_type_hashing")
 	urd.build("test_dataset_type_chaining")
 
@@ -193,3 +210,28 @@ def main(urd):
 	urd.build("test_optionenum")
 	urd.build("test_json")
 	urd.build("test_jobwithfile")
+
+	print()
+	print("Test passing analysis_res to synthesis")
+	urd.build("test_analysis_res")
+	urd.build("test_merge_auto")
+
+	print()
+	print("Test split_analysis")
+	urd.build("test_split_analysis")
+
+	print()
+	print("Test SharedDict as prepare_res")
+	urd.build("test_shared_dict")
+
+	print()
+	print("Test dataset_join")
+	urd.build("test_dataset_join")
+
+	print()
+	print("Test dataset_aggregate")
+	urd.build("test_dataset_aggregate")
+
+	print()
+	print("Test dataset sketches")
+	urd.build("test_sketches")
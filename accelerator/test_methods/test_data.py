@@ -101,3 +101,58 @@ def sort_data_for_slice(sliceno):
 	yield tuple(res)
 	for offset in range(sliceno, 128):
 		yield add(offset)
+
+# Numbered lines, for tests that compare what a method (or iterate) gives
+# with doing the same thing in python. Line v has i=v, f=v/3 and so on,
+# with None in the columns that support it on every seventh line and NaN
+# in g on (another) every seventh line. Use a subset of the columns if
+# you compare lines, as NaN is not equal to itself.
+numbered_columns = {
+	"i": ("int64", False),
+	"i32": ("int32", True),
+	"f": ("float64", True),
+	"g": ("float64", False),
+	"f32": ("float32", False),
+	"bits": ("bits32", False),
+	"bo": ("bool", True),
+	"n": ("number", True),
+	"a": ("ascii", False),
+	"b": ("bytes", True),
+	"u": ("unicode", True),
+	"j": ("json", False),
+	"d": ("date", False),
+	"dt": ("datetime", True),
+	"t": ("time", False),
+}
+
+def numbered_line(v):
+	none = (v % 7 == 3)
+	return dict(
+		i=v,
+		i32=None if none else -v,
+		f=None if none else v / 3,
+		g=float("nan") if v % 7 == 6 else v / 4,
+		f32=v * 2.5,
+		bits=v * 3,
+		bo=None if none else bool(v % 2),
+		n=None if none else (v * 10000000000 if v % 2 else v / 8),
+		a="a%d" % (v,),
+		b=None if none else b"x" * (v % 300),
+		u=None if none else "\xe5%d" % (v % 17,) * (v % 5),
+		j=[v, {"x": v % 3}],
+		d=date(2000 + v // 100, 1, 1 + v % 28),
+		dt=None if none else datetime(2019, 1, 1, v % 24, v % 60, 0, v),
+		t=time(v % 24, 0, v % 60),
+	)
+
+def write_numbered(name, start, stop, columns=numbered_columns, **kw):
+	"""A dataset with numbered_line(start) to numbered_line(stop - 1),
+	split over the slices. Only the named columns, other arguments are
+	passed to DatasetWriter."""
+	from accelerator.dataset import DatasetWriter
+	dw = DatasetWriter(name=name, columns={n: numbered_columns[n] for n in columns}, **kw)
+	write = dw.get_split_write_dict()
+	for v in range(start, stop):
+		line = numbered_line(v)
+		write({n: line[n] for n in columns})
+	return dw.finish()
@@ -20,16 +20,22 @@
 from __future__ import print_function
 from __future__ import division
 
-from accelerator.compat import PY3, unquote_plus
+from accelerator.compat import PY3, unquote_plus, Request, HTTPError, URLError
 
 if PY3:
 	from urllib.request import install_opener, build_opener, AbstractHTTPHandler
-	from http.client import HTTPConnection
+	from urllib.parse import urlsplit
+	from http.client import HTTPConnection, HTTPSConnection, HTTPException, BadStatusLine, RemoteDisconnected
 else:
 	from urllib2 import install_opener, build_opener, AbstractHTTPHandler
-	from httplib import HTTPConnection
+	from urlparse import urlsplit
+	from httplib import HTTPConnection, HTTPSConnection, HTTPException, BadStatusLine
 
+import os
+import errno
 import socket
+import threading
+from io import BytesIO
 
 class UnixHTTPConnection(HTTPConnection):
 	def __init__(self, host, *a, **kw):
@@ -50,6 +56,100 @@ class UnixHTTPHandler(AbstractHTTPHandler):
 install_opener(build_opener(UnixHTTPHandler))
 
 
+# Kept-alive connections, per process, thread and (scheme, netloc).
+_pool = threading.local()
+_connection_classes = {
+	'http': HTTPConnection,
+	'https': HTTPSConnection,
+	'unixhttp': UnixHTTPConnection,
+}
+
+class PooledResponse(object):
+	"""The parts of what urlopen returns that we use."""
+
+	def __init__(self, url, code, body):
+		self.url = url
+		self.code = code
+		self._body = body
+
+	def getcode(self):
+		return self.code
+
+	def read(self):
+		return self._body
+
+	def close(self):
+		pass
+
+def _unanswered(e):
+	"""True if e means the server closed the connection before reading
+	the request, i.e. before sending anything back."""
+	if isinstance(e, BadStatusLine):
+		# Closed before the status line, which is "''" on py2.
+		if PY3:
+			return isinstance(e, RemoteDisconnected)
+		return e.line == "''"
+	return getattr(e, 'errno', None) in (errno.EPIPE, errno.ECONNRESET,)
+
+def pooled_urlopen(url, data=None, headers={}):
+	"""Like urlopen (for http, https and unixhttp), but keeps the
+	connection open for the next call (to the same place, from the same
+	thread) if the server allows it. The whole response is read before
+	this returns. Raises HTTPError for error codes (except on unixhttp),
+	like urlopen."""
+	if isinstance(url, Request):
+		data = url.data if PY3 else url.get_data()
+		headers = dict(url.header_items())
+		url = url.get_full_url()
+	parts = urlsplit(url)
+	assert parts.scheme in _connection_classes, 'Unsupported URL scheme in %s' % (url,)
+	path = parts.path or '/'
+	if parts.query:
+		path += '?' + parts.query
+	headers = dict(headers)
+	if data is None:
+		method = 'GET'
+	else:
+		method = 'POST'
+		if not any(k.lower() == 'content-type' for k in headers):
+			headers['Content-Type'] = 'application/x-www-form-urlencoded'
+	if getattr(_pool, 'pid', None) != os.getpid():
+		# New thread, or we have forked. Connections from before a fork
+		# are shared with the parent, so they can't be used here.
+		_pool.connections = {}
+		_pool.pid = os.getpid()
+	key = (parts.scheme, parts.netloc,)
+	while True:
+		conn = _pool.connections.pop(key, None)
+		reused = conn is not None
+		if not reused:
+			conn = _connection_classes[parts.scheme](parts.netloc)
+		try:
+			try:
+				conn.request(method, path, data, headers)
+				resp = conn.getresponse()
+			except (HTTPException, socket.error) as e:
+				if reused and _unanswered(e):
+					# The server closed it while it was idle, so it
+					# has not seen this request and we can try again.
+					conn.close()
+					continue
+				raise
+			body = resp.read()
+		except (HTTPException, socket.error) as e:
+			conn.close()
+			raise URLError(e)
+		if resp.will_close:
+			conn.close()
+		else:
+			_pool.connections[key] = conn
+		if resp.status >= 400 and parts.scheme != 'unixhttp':
+			# urlopen doesn't raise for unixhttp, and the daemon
+			# client relies on that to see the errors it sends.
+			raise HTTPError(url, resp.status, resp.reason, resp.msg, BytesIO(body))
+		return PooledResponse(url, resp.status, body)
+
+
 from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
 if PY3:
 	from socketserver import UnixStreamServer
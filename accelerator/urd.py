@@ -22,27 +22,90 @@ from __future__ import print_function
 from __future__ import division
 
 from glob import glob
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from bisect import bisect_left, bisect_right
 from bottle import route, request, auth_basic, abort
 import bottle
-from threading import Lock
+from threading import Lock, Condition, local, Thread
+from contextlib import contextmanager
 import ujson
 import re
 from datetime import datetime
 import operator
 from argparse import ArgumentParser
 import os.path
+from wsgiref.simple_server import WSGIServer
 
-from accelerator.compat import iteritems, itervalues, unicode
+from accelerator.compat import PY3, iteritems, itervalues, unicode, pickle
 from accelerator.extras import DotDict
+from accelerator.unixhttp import WSGIUnixServer
+
+if PY3:
+	from socketserver import ThreadingMixIn
+else:
+	from SocketServer import ThreadingMixIn
 
 LOGFILEVERSION = '3'
+SNAPSHOTVERSION = 1
+SNAPSHOTNAME = 'urd.snapshot'
+
+class RWLock(object):
+	"""Any number of readers or a single writer.
+	Waiting writers go before new readers, so writes don't starve.
+	Reading is reentrant within a thread, writing is not."""
+
+	def __init__(self):
+		self._cond = Condition(Lock())
+		self._readers = 0
+		self._writing = False
+		self._writers_waiting = 0
+		self._local = local()
+
+	@contextmanager
+	def read(self):
+		depth = getattr(self._local, 'depth', 0)
+		if not depth:
+			with self._cond:
+				while self._writing or self._writers_waiting:
+					self._cond.wait()
+				self._readers += 1
+		self._local.depth = depth + 1
+		try:
+			yield
+		finally:
+			self._local.depth = depth
+			if not depth:
+				with self._cond:
+					self._readers -= 1
+					if not self._readers:
+						self._cond.notify_all()
+
+	@contextmanager
+	def write(self):
+		with self._cond:
+			self._writers_waiting += 1
+			while self._writing or self._readers:
+				self._cond.wait()
+			self._writers_waiting -= 1
+			self._writing = True
+		try:
+			yield
+		finally:
+			with self._cond:
+				self._writing = False
+				self._cond.notify_all()
 
-lock = Lock()
+lock = RWLock()
 
 def locked(func):
 	def inner(*a, **kw):
-		with lock:
+		with lock.write():
+			return func(*a, **kw)
+	return inner
+
+def readlocked(func):
+	def inner(*a, **kw):
+		with lock.read():
 			return func(*a, **kw)
 	return inner
 
@@ -134,35 +197,264 @@ class TimeStamp(str):
 		return not self <= other
 
 
+class TimeStampDict(dict):
+	"""A dict {TimeStamp: data} that also keeps its keys in a sorted list,
+	so ordered lookups don't have to look at every key."""
+
+	def __init__(self):
+		dict.__init__(self)
+		self.order = []
+
+	def __setitem__(self, ts, data):
+		if ts not in self:
+			order = self.order
+			if not order or order[-1] < ts:
+				order.append(ts) # the common case
+			else:
+				order.insert(bisect_left(order, ts), ts)
+		dict.__setitem__(self, ts, data)
+
+	def __delitem__(self, ts):
+		dict.__delitem__(self, ts)
+		order = self.order
+		del order[bisect_left(order, ts)]
+
+	def since(self, ts):
+		return self.order[bisect_right(self.order, ts):]
+
+	def truncate(self, ts):
+		"""Remove all entries >= ts, returns [(ts, data)] of them."""
+		ix = bisect_left(self.order, ts)
+		removed = [(k, dict.pop(self, k)) for k in self.order[ix:]]
+		del self.order[ix:]
+		return removed
+
+	def endpoint(self, want):
+		"""Find the first (or last if want is a "<" condition) key for which
+		want(key) is True. want must be False for the first N keys and
+		True for the rest, (or the reverse for "<" conditions), which
+		is the case for all the comparisons urd does."""
+		order = self.order
+		lo, hi = 0, len(order)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if want(order[mid]):
+				hi = mid
+			else:
+				lo = mid + 1
+		return lo
+
+
+class LogWriter(object):
+	"""Appends lines to the log files, keeping (some of) them open.
+
+	durability decides what happens after each line:
+	'buffered' - it is handed to the OS (survives urd crashing, but not
+	             the machine crashing). This is the default.
+	'batch'    - as buffered, and sync() fsyncs everything written so far.
+	             Writers that sync at the same time share fsyncs (group
+	             commit), so this is much cheaper than 'fsync' under load.
+	'fsync'    - it is fsynced right away.
+	"""
+
+	max_open = 256
+
+	def __init__(self, path, durability='buffered'):
+		assert durability in ('buffered', 'batch', 'fsync',), 'Unknown durability %r' % (durability,)
+		self.path = path
+		self.durability = durability
+		self._files = OrderedDict()
+		self._cond = Condition(Lock())
+		self._written = 0
+		self._synced = 0
+		self._syncing = False
+		self._dirty = set()
+
+	def _open(self, user, build):
+		key = (user, build,)
+		fh = self._files.pop(key, None)
+		if not fh:
+			path = os.path.join(self.path, user)
+			if not os.path.isdir(path):
+				os.makedirs(path)
+			fh = open(os.path.join(path, build + '.urd'), 'a')
+			if len(self._files) >= self.max_open:
+				# Make sure nothing is (or will be) fsyncing it first.
+				self.sync()
+				_, old_fh = self._files.popitem(last=False)
+				old_fh.close()
+		self._files[key] = fh # (re)insert last, for LRU
+		return fh
+
+	def write(self, user, build, line):
+		fh = self._open(user, build)
+		fh.write(line)
+		fh.flush()
+		if self.durability == 'fsync':
+			os.fsync(fh.fileno())
+		elif self.durability == 'batch':
+			with self._cond:
+				self._written += 1
+				self._dirty.add(fh)
+
+	def sync(self):
+		"""Wait until everything written before this call is fsynced.
+		(Only does anything with durability='batch'.)"""
+		if self.durability != 'batch':
+			return
+		with self._cond:
+			want = self._written
+			while self._synced < want:
+				if self._syncing:
+					# Someone else is syncing, maybe our line too.
+					self._cond.wait()
+					continue
+				self._syncing = True
+				target = self._written
+				dirty, self._dirty = self._dirty, set()
+				self._cond.release()
+				try:
+					for fh in dirty:
+						os.fsync(fh.fileno())
+				except Exception:
+					self._cond.acquire()
+					self._dirty.update(dirty)
+					self._syncing = False
+					self._cond.notify_all()
+					raise
+				self._cond.acquire()
+				self._synced = target
+				self._syncing = False
+				self._cond.notify_all()
+
+	def close(self):
+		for fh in itervalues(self._files):
+			fh.close()
+		self._files.clear()
+
+
 class DB:
-	def __init__(self, path, verbose=True):
+	def __init__(self, path, verbose=True, snapshot_interval=10000, durability='buffered'):
 		self._initialised = False
 		self.path = path
-		self.db = defaultdict(dict)
+		self._logwriter = LogWriter(path, durability)
+		self.db = defaultdict(TimeStampDict)
 		self.ghost_db = defaultdict(lambda: defaultdict(list))
+		# {(key, timestamp): {(key, timestamp), ...}} of active entries
+		# with a dependency, so ghosting only looks where it might matter.
+		self.rdeps = defaultdict(set)
+		# Write a snapshot every snapshot_interval log lines (0 for never).
+		self.snapshot_interval = snapshot_interval
+		self._since_snapshot = 0
+		self._snapshot_writer = None
+		self._linecounts = {}
 		if os.path.isdir(path):
 			files = glob(os.path.join(path, '*/*.urd'))
+			snapshot_files = self._load_snapshot(files)
 			self._parsed = {}
-			stat = {}
 			for fn in files:
+				key = fn[len(path) + 1:-len('.urd')]
+				_, offset, ix = snapshot_files.get(key, (None, 0, 0))
 				with open(fn) as fh:
-					ix = 0
+					# Only the lines written after the snapshot are replayed.
+					fh.seek(offset)
 					for line in fh:
 						self._parse(line)
 						ix += 1
-					stat[fn[len(path) + 1:-len('.urd')]] = ix
+				self._linecounts[key] = ix
+			replayed = len(self._parsed)
 			self._playback_parsed()
 			if verbose:
+				if snapshot_files:
+					print("Loaded snapshot, replayed %d log lines after it." % (replayed,))
 				print("urd-list                          lines     ghosts     active")
-				for key, val in sorted(stat.items()):
+				for key, val in sorted(self._linecounts.items()):
 					print("%-30s  %7d    %7d    %7d" % (key, val, len(self.ghost_db[key]), len(self.db[key]),))
 				print()
+			if replayed and self.snapshot_interval:
+				self._save_snapshot(self._snapshot_state())
 		else:
 			print("Creating directory \"%s\"." % (path,))
 			os.makedirs(path)
 		self._lasttime = None
 		self._initialised = True
 
+	def _load_snapshot(self, files):
+		"""Load state from the snapshot if there is a usable one.
+		Returns {key: (inode, offset, linecount)} for the log files
+		it covers, or {} if it wasn't used."""
+		fn = os.path.join(self.path, SNAPSHOTNAME)
+		if not os.path.exists(fn):
+			return {}
+		try:
+			with open(fn, 'rb') as fh:
+				snapshot = pickle.load(fh)
+			assert snapshot['version'] == SNAPSHOTVERSION
+		except Exception as e:
+			print("Ignoring unreadable snapshot %s (%s)." % (fn, e,))
+			return {}
+		present = {fn[len(self.path) + 1:-len('.urd')]: fn for fn in files}
+		for key, (inode, offset, _) in iteritems(snapshot['files']):
+			# A log that was replaced (by compaction) or shrunk makes the
+			# snapshot useless. New logs are fine, they are just replayed.
+			if key not in present:
+				break
+			st = os.stat(present[key])
+			if st.st_ino != inode or st.st_size < offset:
+				break
+		else:
+			for key, entries in iteritems(snapshot['db']):
+				for ts in sorted(entries):
+					self._activate(key, entries[ts])
+			for key, ghosts in iteritems(snapshot['ghost_db']):
+				self.ghost_db[key].update(ghosts)
+			return snapshot['files']
+		print("Ignoring snapshot %s, the logs have changed." % (fn,))
+		return {}
+
+	def _snapshot_state(self):
+		"""The current state, with how far into each log file it goes, so
+		that a restart only needs to replay what comes after.
+		This only copies the containers (the entries are not modified
+		once added), so it's cheap enough to do while holding the lock."""
+		files = {}
+		for key, linecount in iteritems(self._linecounts):
+			st = os.stat(os.path.join(self.path, key + '.urd'))
+			files[key] = (st.st_ino, st.st_size, linecount,)
+		self._since_snapshot = 0
+		return dict(
+			version=SNAPSHOTVERSION,
+			files=files,
+			db={key: dict(db) for key, db in iteritems(self.db) if db},
+			ghost_db={key: {ts: list(v) for ts, v in iteritems(ghosts)} for key, ghosts in iteritems(self.ghost_db) if ghosts},
+		)
+
+	def _save_snapshot(self, snapshot):
+		fn = os.path.join(self.path, SNAPSHOTNAME)
+		with open(fn + '.tmp', 'wb') as fh:
+			pickle.dump(snapshot, fh, pickle.HIGHEST_PROTOCOL)
+		os.rename(fn + '.tmp', fn)
+
+	def _maybe_snapshot(self):
+		if self._initialised and self.snapshot_interval and self._since_snapshot >= self.snapshot_interval:
+			if self._snapshot_writer and self._snapshot_writer.is_alive():
+				# Still writing the last one, try again after the next line.
+				return
+			# Pickling everything takes a while, so that is done without
+			# the lock (and without holding up the request).
+			self._snapshot_writer = Thread(
+				target=self._save_snapshot,
+				args=(self._snapshot_state(),),
+				name='urd snapshot',
+			)
+			self._snapshot_writer.daemon = True
+			self._snapshot_writer.start()
+
+	def wait_for_snapshot(self):
+		"""Wait until a snapshot being written in the background is done."""
+		if self._snapshot_writer:
+			self._snapshot_writer.join()
+
 	def _parse(self, line):
 		line = line.rstrip('\n').split('|')
 		logfileversion, writets = line[:2]
@@ -215,7 +507,7 @@ class DB:
 		assert isinstance(data.caption, unicode)
 		data.timestamp = TimeStamp(data.timestamp)
 
-	def _serialise(self, action, data):
+	def _serialise(self, action, data, now=None):
 		if action == 'add':
 			self._validate_data(data)
 			json_deps = ujson.dumps(data.deps, escape_forward_slashes=False)
@@ -231,13 +523,31 @@ class DB:
 		else:
 			assert "can't happen"
 		data.timestamp = TimeStamp(data.timestamp)
-		while True: # paranoia
-			now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
-			if now != self._lasttime: break
-		self._lasttime = now
+		if not now:
+			while True: # paranoia
+				now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+				if now != self._lasttime: break
+			self._lasttime = now
 		s = '|'.join([LOGFILEVERSION, now, action, data.timestamp, key,] + logdata)
 		return s
 
+	def _deps_of(self, data):
+		return [(key, TimeStamp(dep['timestamp'])) for key, dep in iteritems(data.deps)]
+
+	def _activate(self, key, data):
+		self.db[key][data.timestamp] = data
+		for dep in self._deps_of(data):
+			self.rdeps[dep].add((key, data.timestamp))
+
+	def _deactivate(self, key, data):
+		"""Forget the deps of data, the caller is responsible for actually
+		moving it out of self.db[key]."""
+		for dep in self._deps_of(data):
+			users = self.rdeps[dep]
+			users.discard((key, data.timestamp))
+			if not users:
+				del self.rdeps[dep]
+
 	def _is_ghost(self, data):
 		for key, data in iteritems(data.deps):
 			db = self.db[key]
@@ -287,53 +597,53 @@ class DB:
 			else:
 				if changed:
 					ghost_data = db[data.timestamp]
+					self._deactivate(key, ghost_data)
 					self.ghost_db[key][data.timestamp].append(ghost_data)
-				db[data.timestamp] = data
+				self._activate(key, data)
 				if changed:
-					ghosted = self._update_ghosts()
+					ghosted = self._update_ghosts([(key, data.timestamp)])
 		res = dict(new=new, changed=changed, is_ghost=is_ghost)
 		if changed:
 			res['deps'] = ghosted
+		self._maybe_snapshot()
 		return res
 
-	def _update_ghosts(self):
-		def inner():
-			count = 0
-			for key, db in iteritems(self.db):
-				for ts, data in sorted(db.items()):
-					if self._is_ghost(data):
-						count += 1
-						del db[ts]
-						self.ghost_db[key][ts].append(data)
-			return count
-		res = 0
-		while True:
-			count = inner()
-			if not count:
-				break
-			res += count
-		return res
+	def _update_ghosts(self, changed):
+		"""Ghost everything that depended on the (key, timestamp)s in
+		changed and no longer matches, and then everything that depended
+		on those, and so on."""
+		count = 0
+		todo = list(changed)
+		while todo:
+			candidates = set()
+			for dep in todo:
+				candidates.update(self.rdeps.get(dep, ()))
+			todo = []
+			for key, ts in sorted(candidates):
+				db = self.db[key]
+				data = db.get(ts)
+				if data is not None and self._is_ghost(data):
+					count += 1
+					self._deactivate(key, data)
+					del db[ts]
+					self.ghost_db[key][ts].append(data)
+					todo.append((key, ts))
+		return count
 
 	@locked
 	def truncate(self, key, timestamp):
-		old = self.db[key]
-		new = {}
-		ghost = {}
 		timestamp = TimeStamp(timestamp)
-		for ts, data in iteritems(old):
-			if ts < timestamp:
-				new[ts] = data
-			else:
-				ghost[ts] = data
 		self.log('truncate', DotDict(key=key, timestamp=timestamp))
-		self.db[key] = new
+		ghost = self.db[key].truncate(timestamp)
 		ghost_db = self.ghost_db[key]
-		for ts, data in iteritems(ghost):
+		for ts, data in ghost:
+			self._deactivate(key, data)
 			ghost_db[ts].append(data)
 		if ghost:
-			deps = self._update_ghosts()
+			deps = self._update_ghosts([(key, ts) for ts, _ in ghost])
 		else:
 			deps = 0
+		self._maybe_snapshot()
 		return {'count': len(ghost), 'deps': deps}
 
 	def log(self, action, data):
@@ -344,45 +654,111 @@ class DB:
 				user, build = data.user, data.build
 			assert '/' not in user
 			assert '/' not in build
-			path = os.path.join(self.path, user)
-			if not os.path.isdir(path):
-				os.makedirs(path)
-			with open(os.path.join(path, build + '.urd'), 'a') as fh:
-				fh.write(self._serialise(action, data) + '\n')
-
-	@locked
+			self._logwriter.write(user, build, self._serialise(action, data) + '\n')
+			key = user + '/' + build
+			self._linecounts[key] = self._linecounts.get(key, 0) + 1
+			self._since_snapshot += 1
+
+	def sync(self):
+		"""Call this (without holding the lock) before acknowledging
+		a write, to get the configured durability."""
+		self._logwriter.sync()
+
+	def compact(self):
+		"""Rewrite all logs with only the active entries (no ghosts, no
+		truncated or updated away entries), in dependency order.
+		The old logs are kept as .urd.precompact files.
+		Only do this while urd is not running."""
+		from datetime import timedelta
+		old = glob(os.path.join(self.path, '*/*.urd.precompact'))
+		if old:
+			# Renaming again would replace the logs saved last time.
+			raise Exception('%s has logs from an earlier compaction (%s), move them away first.' % (self.path, old[0],))
+		# Dependencies must be added before what depends on them.
+		order = []
+		seen = set()
+		for key in sorted(self.db):
+			for ts in self.db[key].order:
+				stack = [(key, ts, False)]
+				while stack:
+					k, t, deps_done = stack.pop()
+					if deps_done:
+						order.append((k, t))
+						continue
+					if (k, t) in seen:
+						continue
+					seen.add((k, t))
+					stack.append((k, t, True))
+					for dep in self._deps_of(self.db[k][t]):
+						stack.append(dep + (False,))
+		# Write timestamps before any real ones, in the same order.
+		writets = datetime(1970, 1, 1)
+		lines = defaultdict(list)
+		for key, ts in order:
+			data = DotDict(self.db[key][ts])
+			data.flags = []
+			now = writets.strftime("%Y-%m-%dT%H:%M:%S.%f")
+			writets += timedelta(microseconds=1)
+			lines[key].append(self._serialise('add', data, now) + '\n')
+		self._logwriter.close()
+		for fn in glob(os.path.join(self.path, '*/*.urd')):
+			os.rename(fn, fn + '.precompact')
+		for key, key_lines in iteritems(lines):
+			fn = os.path.join(self.path, key + '.urd')
+			with open(fn + '.tmp', 'w') as fh:
+				fh.writelines(key_lines)
+			os.rename(fn + '.tmp', fn)
+		snapshot_fn = os.path.join(self.path, SNAPSHOTNAME)
+		if os.path.exists(snapshot_fn):
+			os.unlink(snapshot_fn)
+		return len(order)
+
+	def _read_db(self, key):
+		# Readers run concurrently, so they must not create keys.
+		return self.db.get(key, _empty_db)
+
+	@readlocked
 	def get(self, key, timestamp):
-		db = self.db[key]
+		db = self._read_db(key)
 		return db.get(TimeStamp(timestamp))
 
-	@locked
+	@readlocked
 	def since(self, key, timestamp):
 		timestamp = TimeStamp(timestamp)
-		return sorted(k for k in self.db[key] if k > timestamp)
+		return self._read_db(key).since(timestamp)
 
-	@locked
+	@readlocked
 	def limited_endpoint(self, key, timestamp, cmpfunc, minmaxfunc):
-		db = self.db[key]
-		try:
-			k = minmaxfunc(k for k in db if cmpfunc(k, timestamp))
-		except ValueError: # empty sequence
-			return None
-		return db[k]
+		db = self._read_db(key)
+		if minmaxfunc is max:
+			# cmpfunc is True up to some point, we want the last of those.
+			ix = db.endpoint(lambda k: not cmpfunc(k, timestamp)) - 1
+			if ix < 0:
+				return None
+		else:
+			# cmpfunc is True from some point, we want the first of those.
+			ix = db.endpoint(lambda k: cmpfunc(k, timestamp))
+			if ix == len(db.order):
+				return None
+		return db[db.order[ix]]
 
-	@locked
+	@readlocked
 	def latest(self, key):
-		db = self.db[key]
+		db = self._read_db(key)
 		if db:
-			return db[max(db)]
+			return db[db.order[-1]]
 
-	@locked
+	@readlocked
 	def first(self, key):
-		db = self.db[key]
+		db = self._read_db(key)
 		if db:
-			return db[min(db)]
+			return db[db.order[0]]
 
+	@readlocked
 	def keys(self):
-		return filter(self.db.get, self.db)
+		return [key for key, db in iteritems(self.db) if db]
+
+_empty_db = TimeStampDict()
 
 
 def auth(user, passphrase):
@@ -402,7 +778,13 @@ def first(user, build):
 
 @route('/<user>/<build>/<timestamp>')
 def single(user, build, timestamp):
-	key = user + '/' + build
+	return lookup(user + '/' + build, timestamp)
+
+def lookup(key, timestamp):
+	if timestamp == 'latest':
+		return db.latest(key)
+	if timestamp == 'first':
+		return db.first(key)
 	if len(timestamp) > 1 and timestamp[0] in '<>':
 		if timestamp[0] == '<':
 			minmaxfunc = max
@@ -432,6 +814,17 @@ def single(user, build, timestamp):
 		return db.get(key, timestamp)
 
 
+@route('/bulk', method='POST')
+def bulk():
+	"""Many lookups in one request (with a consistent view of the db).
+	Takes a list of [user/build, timestamp] where timestamp is anything
+	you can use in a single lookup (including latest and first).
+	Returns a list of the results."""
+	lookups = ujson.load(request.body)
+	with lock.read():
+		return [lookup(key, timestamp) for key, timestamp in lookups]
+
+
 @route('/add', method='POST')
 @auth_basic(auth)
 def add():
@@ -439,6 +832,7 @@ def add():
 	if data.user != request.auth[0]:
 		abort(401, "Error:  user does not match authentication!")
 	result = db.add(data)
+	db.sync()
 	return result
 
 
@@ -447,7 +841,9 @@ def add():
 def truncate(user, build, timestamp):
 	if user != request.auth[0]:
 		abort(401, "Error:  user does not match authentication!")
-	return db.truncate(user + '/' + build, timestamp)
+	result = db.truncate(user + '/' + build, timestamp)
+	db.sync()
+	return result
 
 
 @route('/test/<user>', method='POST')
@@ -485,6 +881,14 @@ def jsonify(callback):
 	return func
 
 
+# Threaded servers so that reads can run concurrently.
+class ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
+	daemon_threads = True
+
+class ThreadedWSGIUnixServer(ThreadingMixIn, WSGIUnixServer):
+	daemon_threads = True
+
+
 def main(argv, cfg):
 	global authdict, allow_passwordless, db
 
@@ -494,18 +898,31 @@ def main(argv, cfg):
 	)
 	parser.add_argument('--allow-passwordless', action='store_true', help='accept any pass for users not in passwd.')
 	parser.add_argument('--quiet', action='store_true', help='less chatty.')
+	parser.add_argument('--snapshot-interval', type=int, default=10000, metavar='LINES',
+		help='save a snapshot every LINES log lines, for faster restarts. 0 to disable. (default: 10000)',
+	)
+	parser.add_argument('--durability', choices=('buffered', 'batch', 'fsync'), default='buffered',
+		help='buffered: writes go to the OS right away. batch: fsync before answering, sharing fsyncs between concurrent writers. fsync: fsync every write. (default: buffered)',
+	)
+	parser.add_argument('--compact', action='store_true', help='rewrite the logs with only the active entries and exit. (don\'t do this while urd is running.)')
 	args = parser.parse_args(argv)
 	if not args.quiet:
 		print('-'*79)
 		print(args)
 		print()
 
+	if args.compact:
+		db = DB(args.path, not args.quiet, snapshot_interval=0)
+		count = db.compact()
+		print('Compacted %s to %d entries (old logs are in *.urd.precompact).' % (args.path, count,))
+		return
+
 	auth_fn = os.path.join(args.path, 'passwd')
 	authdict = readauth(auth_fn)
 	allow_passwordless = args.allow_passwordless
 	if not authdict and not args.allow_passwordless:
 		raise Exception('No users in %r and --allow-passwordless not specified.' % (auth_fn,))
-	db = DB(args.path, not args.quiet)
+	db = DB(args.path, not args.quiet, args.snapshot_interval, args.durability)
 
 	bottle.install(jsonify)
 
@@ -513,13 +930,14 @@ def main(argv, cfg):
 	listen = cfg.urd_listen
 	if isinstance(listen, tuple):
 		kw['host'], kw['port'] = listen
+		kw['server_class'] = ThreadedWSGIServer
 	else:
-		from accelerator.unixhttp import WSGIUnixServer, WSGIUnixRequestHandler
+		from accelerator.unixhttp import WSGIUnixRequestHandler
 		from accelerator.daemon import check_socket
 		if listen == 'local':
 			listen = '.socket.dir/urd'
 		check_socket(listen)
-		kw['server_class'] = WSGIUnixServer
+		kw['server_class'] = ThreadedWSGIUnixServer
 		kw['handler_class'] = WSGIUnixRequestHandler
 		kw['host'] = listen
 		kw['port'] = 0
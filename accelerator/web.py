@@ -34,13 +34,14 @@ import cgi
 from traceback import print_exc
 
 class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
-	pass
+	daemon_threads = True # kept-alive connections shouldn't stop us exiting
 
 class ForkedHTTPServer(ForkingMixIn, HTTPServer):
 	pass
 
 class ThreadedUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
-	pass # allow_reuse_address = True doesn't work for unix sockets
+	# allow_reuse_address = True doesn't work for unix sockets
+	daemon_threads = True # kept-alive connections shouldn't stop us exiting
 
 class BaseWebHandler(BaseHTTPRequestHandler):
 	"""What I usually do in my web servers.
@@ -54,10 +55,19 @@ class BaseWebHandler(BaseHTTPRequestHandler):
 	
 	unicode_args = False
 	
+	# Keep connections open between requests (all responses from
+	# do_response have a Content-Length, which this needs).
+	protocol_version = "HTTP/1.1"
+	
 	# Stop it from doing name lookups for logging
 	def address_string(self):
 		return self.client_address[0]
 	
+	def handle_one_request(self):
+		# Every request on a kept-alive connection gets a response.
+		self.responded = False
+		BaseHTTPRequestHandler.handle_one_request(self)
+	
 	def do_GET(self):
 		self.is_head = False
 		self._do_req()
@@ -130,6 +140,11 @@ class BaseWebHandler(BaseHTTPRequestHandler):
 		return body.encode("utf-8")
 	
 	def do_response(self, code, content_type, body, extra_headers = []):
+		if self.responded:
+			# Only one response per request, anything more would be
+			# read as the response to the next request on this connection.
+			return
+		self.responded = True
 		try:
 			body = self.encode_body(body)
 			self.send_response(code)
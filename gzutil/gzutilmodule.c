@@ -25,6 +25,7 @@
 #include <unistd.h>
 #include <string.h>
 #include <stdint.h>
+#include <inttypes.h>
 #include <limits.h>
 #include <math.h>
 #include <sys/types.h>
@@ -789,10 +790,173 @@ static PyObject *gzany_exit(PyObject *self, PyObject *args)
 	Py_RETURN_NONE;
 }
 
+// More stupid forward declarations
+static PyTypeObject GzBytes_Type;
+static PyTypeObject GzAscii_Type;
+static PyTypeObject GzUnicode_Type;
+static PyTypeObject GzFloat64_Type;
+static PyTypeObject GzInt64_Type;
+static PyTypeObject GzBits64_Type;
+
+// Get one raw byte, returns 1 at EOF (or error).
+static inline int gzread_byte_(GzRead *self, uint8_t *res)
+{
+	if (self->error || self->pos >= self->len) {
+		if (gzread_read_(self, 1)) return 1;
+	}
+	*res = ((uint8_t *)self->buf)[self->pos++];
+	return 0;
+}
+
+// Skip len raw bytes, returns 1 at EOF (or error).
+static int gzread_skipbytes_(GzRead *self, PY_LONG_LONG len)
+{
+	while (len) {
+		if (self->error || self->pos >= self->len) {
+			if (gzread_read_(self, 1)) return 1;
+		}
+		PY_LONG_LONG avail = self->len - self->pos;
+		if (avail > len) avail = len;
+		self->pos += avail;
+		len -= avail;
+	}
+	return 0;
+}
+
+static int gzread_skipline_(GzRead *self)
+{
+	int partial = 0;
+	while (1) {
+		if (self->error || self->pos >= self->len) {
+			if (gzread_read_(self, SIZE_Bytes)) {
+				// A last line without \n is still a line.
+				return self->error || !partial;
+			}
+		}
+		char *ptr = self->buf + self->pos;
+		char *end = memchr(ptr, '\n', self->len - self->pos);
+		if (end) {
+			self->pos = end - self->buf + 1;
+			return 0;
+		}
+		self->pos = self->len;
+		partial = 1;
+	}
+}
+
+static int gzread_skipblob_(GzRead *self)
+{
+	uint8_t c;
+	if (gzread_byte_(self, &c)) return 1;
+	uint32_t size = c;
+	if (size == 255) {
+		uint8_t *size_ptr = (uint8_t *)&size;
+		for (int i = 0; i < 4; i++) {
+			if (gzread_byte_(self, size_ptr + i)) goto fferror;
+		}
+	}
+	if (gzread_skipbytes_(self, size)) goto fferror;
+	return 0;
+fferror:
+	self->error = 1;
+	return 1;
+}
+
+static int gzread_skipnumber_(GzRead *self)
+{
+	uint8_t len;
+	if (gzread_byte_(self, &len)) return 1;
+	if (len == 1) len = 8;
+	if (len && gzread_skipbytes_(self, len)) {
+		self->error = 1;
+		return 1;
+	}
+	return 0;
+}
+
+// Skip up to count items without creating any objects.
+// Returns the number of items skipped.
+static PY_LONG_LONG gzread_skip_(GzRead *self, PY_LONG_LONG count)
+{
+	PyTypeObject *type = Py_TYPE(self);
+	int (*skip_one)(GzRead *) = 0;
+	int itemsize = 0;
+	if (type == &GzBytesLines_Type || type == &GzAsciiLines_Type || type == &GzUnicodeLines_Type) {
+		skip_one = gzread_skipline_;
+	} else if (type == &GzBytes_Type || type == &GzAscii_Type || type == &GzUnicode_Type) {
+		skip_one = gzread_skipblob_;
+	} else if (type == &GzNumber_Type) {
+		skip_one = gzread_skipnumber_;
+	} else if (type == &GzBool_Type) {
+		itemsize = 1;
+	} else if (type == &GzDateTime_Type || type == &GzTime_Type || type == &GzFloat64_Type || type == &GzInt64_Type || type == &GzBits64_Type) {
+		itemsize = 8;
+	} else {
+		// Date, Float32, Int32 and Bits32
+		itemsize = 4;
+	}
+	if (itemsize) {
+		// Buffers always hold whole items for these types
+		PY_LONG_LONG done = 0;
+		while (done < count) {
+			if (self->error || self->pos >= self->len) {
+				if (gzread_read_(self, itemsize)) break;
+			}
+			PY_LONG_LONG avail = (self->len - self->pos) / itemsize;
+			if (avail > count - done) avail = count - done;
+			self->pos += avail * itemsize;
+			done += avail;
+		}
+		return done;
+	}
+	PY_LONG_LONG done;
+	for (done = 0; done < count; done++) {
+		if (skip_one(self)) break;
+	}
+	return done;
+}
+
+static PyObject *gzread_skip(GzRead *self, PyObject *arg)
+{
+	PY_LONG_LONG count = PyLong_AsLongLong(arg);
+	if (count == -1 && PyErr_Occurred()) return 0;
+	if (count < 0) {
+		PyErr_SetString(PyExc_ValueError, "Can't skip backwards");
+		return 0;
+	}
+	if (!self->fh) return err_closed();
+	PY_LONG_LONG skipped = 0;
+	while (skipped < count) {
+		if (self->count == self->break_count) {
+			if (self->count == self->max_count) break;
+			if (do_callback(self)) {
+				if (PyErr_Occurred()) return 0;
+				break;
+			}
+		}
+		PY_LONG_LONG todo = count - skipped;
+		if (self->break_count >= 0 && todo > self->break_count - self->count) {
+			todo = self->break_count - self->count;
+		}
+		PY_LONG_LONG done = gzread_skip_(self, todo);
+		self->count += done;
+		skipped += done;
+		if (done < todo) {
+			if (self->error) {
+				PyErr_SetString(PyExc_ValueError, "File format error");
+				return 0;
+			}
+			break;
+		}
+	}
+	return PyLong_FromLongLong(skipped);
+}
+
 static PyMethodDef gzread_methods[] = {
 	{"__enter__", (PyCFunction)gzread_self, METH_NOARGS,  NULL},
 	{"__exit__",  (PyCFunction)gzany_exit, METH_VARARGS, NULL},
 	{"close",     (PyCFunction)gzread_close, METH_NOARGS,  NULL},
+	{"skip",      (PyCFunction)gzread_skip, METH_O, "skip(count) - Skip count items (without decoding them). Returns how many were skipped."},
 	{NULL, NULL, 0, NULL}
 };
 
@@ -897,9 +1061,44 @@ typedef struct gzwrite {
 	unsigned int slices;
 	int none_support;
 	int len;
+	uint8_t *hll;
+	double *sample;
+	uint64_t sample_seen;
+	uint64_t rng;
 	char buf[Z];
 } GzWrite;
 
+// Optional per writer sketches (see enable_sketch):
+// A HyperLogLog with HLL_M registers for distinct counts and a
+// reservoir sample of SAMPLE_Z values (for numeric types) for quantiles.
+#define HLL_BITS 12
+#define HLL_M    (1 << HLL_BITS)
+#define SAMPLE_Z 1024
+
+static inline void sketch_hash(GzWrite *self, const uint64_t h)
+{
+	const unsigned int ix = h >> (64 - HLL_BITS);
+	const uint64_t w = (h << HLL_BITS) | ((uint64_t)1 << (HLL_BITS - 1));
+	const uint8_t rank = __builtin_clzll(w) + 1;
+	if (rank > self->hll[ix]) self->hll[ix] = rank;
+}
+
+static inline void sketch_sample(GzWrite *self, const double value)
+{
+	if (!self->sample || isnan(value)) return;
+	const uint64_t n = self->sample_seen++;
+	if (n < SAMPLE_Z) {
+		self->sample[n] = value;
+	} else {
+		// xorshift64*, deterministic so the same data gives the same sample.
+		self->rng ^= self->rng >> 12;
+		self->rng ^= self->rng << 25;
+		self->rng ^= self->rng >> 27;
+		const uint64_t j = (self->rng * 2685821657736338717ULL) % (n + 1);
+		if (j < SAMPLE_Z) self->sample[j] = value;
+	}
+}
+
 static int gzwrite_flush_(GzWrite *self)
 {
 	if (!self->len) return 0;
@@ -930,6 +1129,8 @@ static int gzwrite_close_(GzWrite *self)
 	Py_CLEAR(self->default_obj);
 	Py_CLEAR(self->min_obj);
 	Py_CLEAR(self->max_obj);
+	FREE(self->hll);
+	FREE(self->sample);
 	if (self->fh) {
 		int err = gzwrite_flush_(self);
 		err |= gzclose(self->fh);
@@ -1157,6 +1358,7 @@ static PyObject *gzwrite_write_GzWrite(GzWrite *self, PyObject *obj)
 		cleanup;                                                              	\
 		Py_RETURN_TRUE;                                                       	\
 	}                                                                             	\
+	if (self->hll) sketch_hash(self, hash(data, len));                            	\
 	PyObject *ret = gzwrite_write_(self, data, len);                              	\
 	cleanup;                                                                      	\
 	if (!ret) return 0;                                                           	\
@@ -1308,6 +1510,7 @@ MKWLINE(Unicode);
 		cleanup;                                                              	\
 		Py_RETURN_TRUE;                                                       	\
 	}                                                                             	\
+	if (self->hll) sketch_hash(self, hash(data, len));                            	\
 	PyObject *ret;                                                                	\
 	if (len < 255) {                                                              	\
 		uint8_t short_len = len;                                              	\
@@ -1416,7 +1619,7 @@ MK_MINMAX_SET(DateTime, unfmt_datetime((*(uint64_t *)cmp_value) >> 32, *(uint64_
 MK_MINMAX_SET(Date    , unfmt_date(*(uint32_t *)cmp_value));
 MK_MINMAX_SET(Time    , unfmt_time((*(uint64_t *)cmp_value) >> 32, *(uint64_t *)cmp_value));
 
-#define MKWRITER(tname, T, HT, conv, withnone, minmax_value, minmax_set, hash)           	\
+#define MKWRITER(tname, T, HT, conv, withnone, minmax_value, minmax_set, hash, quantiles)	\
 	static int gzwrite_init_ ## tname(PyObject *self_, PyObject *args, PyObject *kwds)	\
 	{                                                                                	\
 		static char *kwlist[] = {"name", "mode", "default", "hashfilter", "none_support", 0}; \
@@ -1497,6 +1700,11 @@ is_none:
 		if (!self->max_obj || (cmp_value > self->max_u.as_ ## T)) {              	\
 			minmax_set(&self->max_obj, obj, &self->max_u, &cmp_value, sizeof(cmp_value));	\
 		}                                                                        	\
+		if (self->hll) {                                                         	\
+			const HT h_value = value;                                        	\
+			sketch_hash(self, hash(&h_value));                               	\
+			if (quantiles) sketch_sample(self, (double)value);               	\
+		}                                                                        	\
 		self->count++;                                                           	\
 		return gzwrite_write_(self, (char *)&value, sizeof(value));              	\
 	}                                                                                	\
@@ -1601,13 +1809,13 @@ static uint8_t pyLong_AsBool(PyObject *l)
 	return value;
 }
 
-MKWRITER(GzWriteFloat64, double  , double  , PyFloat_AsDouble , 1, , minmax_set_Float64, hash_double );
-MKWRITER(GzWriteFloat32, float   , double  , PyFloat_AsDouble , 1, , minmax_set_Float32, hash_double );
-MKWRITER(GzWriteInt64  , int64_t , int64_t , pyLong_AsS64     , 1, , minmax_set_Int64  , hash_integer);
-MKWRITER(GzWriteInt32  , int32_t , int64_t , pyLong_AsS32     , 1, , minmax_set_Int32  , hash_integer);
-MKWRITER(GzWriteBits64 , uint64_t, uint64_t, pyLong_AsU64     , 0, , minmax_set_Bits64 , hash_integer);
-MKWRITER(GzWriteBits32 , uint32_t, uint64_t, pyLong_AsU32     , 0, , minmax_set_Bits32 , hash_integer);
-MKWRITER(GzWriteBool   , uint8_t , uint8_t , pyLong_AsBool    , 1, , minmax_set_Bool   , hash_bool   );
+MKWRITER(GzWriteFloat64, double  , double  , PyFloat_AsDouble , 1, , minmax_set_Float64, hash_double , 1);
+MKWRITER(GzWriteFloat32, float   , double  , PyFloat_AsDouble , 1, , minmax_set_Float32, hash_double , 1);
+MKWRITER(GzWriteInt64  , int64_t , int64_t , pyLong_AsS64     , 1, , minmax_set_Int64  , hash_integer, 1);
+MKWRITER(GzWriteInt32  , int32_t , int64_t , pyLong_AsS32     , 1, , minmax_set_Int32  , hash_integer, 1);
+MKWRITER(GzWriteBits64 , uint64_t, uint64_t, pyLong_AsU64     , 0, , minmax_set_Bits64 , hash_integer, 0);
+MKWRITER(GzWriteBits32 , uint32_t, uint64_t, pyLong_AsU32     , 0, , minmax_set_Bits32 , hash_integer, 0);
+MKWRITER(GzWriteBool   , uint8_t , uint8_t , pyLong_AsBool    , 1, , minmax_set_Bool   , hash_bool   , 0);
 static uint64_t fmt_datetime(PyObject *dt)
 {
 	if (!PyDateTime_Check(dt)) {
@@ -1652,9 +1860,9 @@ static uint64_t fmt_time(PyObject *dt)
 	r.i.i1 = (M << 26) | (S << 20) | u;
 	return r.res;
 }
-MKWRITER(GzWriteDateTime, uint64_t, uint64_t, fmt_datetime, 1, minmax_value_datetime, minmax_set_DateTime, hash_64bits);
-MKWRITER(GzWriteDate    , uint32_t, uint32_t, fmt_date,     1,                      , minmax_set_Date    , hash_32bits);
-MKWRITER(GzWriteTime    , uint64_t, uint64_t, fmt_time,     1, minmax_value_datetime, minmax_set_Time    , hash_64bits);
+MKWRITER(GzWriteDateTime, uint64_t, uint64_t, fmt_datetime, 1, minmax_value_datetime, minmax_set_DateTime, hash_64bits, 0);
+MKWRITER(GzWriteDate    , uint32_t, uint32_t, fmt_date,     1,                      , minmax_set_Date    , hash_32bits, 0);
+MKWRITER(GzWriteTime    , uint64_t, uint64_t, fmt_time,     1, minmax_value_datetime, minmax_set_Time    , hash_64bits, 0);
 
 static int gzwrite_GzWriteNumber_serialize_Long(PyObject *obj, char *buf, const char *msg)
 {
@@ -1745,6 +1953,10 @@ static PyObject *gzwrite_C_GzWriteNumber(GzWrite *self, PyObject *obj, int actua
 		}
 		if (!actually_write) Py_RETURN_TRUE;
 		gzwrite_obj_minmax(self, obj);
+		if (self->hll) {
+			sketch_hash(self, hash_double(&value));
+			sketch_sample(self, value);
+		}
 		char buf[9];
 		buf[0] = 1;
 		memcpy(buf + 1, &value, 8);
@@ -1767,6 +1979,10 @@ static PyObject *gzwrite_C_GzWriteNumber(GzWrite *self, PyObject *obj, int actua
 		}
 		if (!actually_write) Py_RETURN_TRUE;
 		gzwrite_obj_minmax(self, obj);
+		if (self->hll) {
+			sketch_hash(self, hash_integer(&value));
+			sketch_sample(self, (double)value);
+		}
 		buf[0] = 8;
 		memcpy(buf + 1, &value, 8);
 		self->count++;
@@ -1786,6 +2002,11 @@ static PyObject *gzwrite_C_GzWriteNumber(GzWrite *self, PyObject *obj, int actua
 	}
 	if (!actually_write) Py_RETURN_TRUE;
 	gzwrite_obj_minmax(self, obj);
+	if (self->hll) {
+		sketch_hash(self, hash(buf + 1, buf[0]));
+		sketch_sample(self, PyLong_AsDouble(obj));
+		PyErr_Clear(); // too large for a double, it's not in the sample then
+	}
 	self->count++;
 	return gzwrite_write_(self, buf, buf[0] + 1);
 }
@@ -1893,7 +2114,7 @@ MKPARSEDNUMBERWRAPPER(write, GzWrite)
 MKPARSEDNUMBERWRAPPER(hashcheck, GzWrite)
 MKPARSEDNUMBERWRAPPER(hash, PyObject)
 
-#define MKPARSED(name, T, HT, inner, conv, withnone, minmax_set, hash)	\
+#define MKPARSED(name, T, HT, inner, conv, withnone, minmax_set, hash, quantiles)	\
 	static T parse ## name(PyObject *obj)                        	\
 	{                                                            	\
 		PyObject *parsed = inner(obj);                       	\
@@ -1902,13 +2123,86 @@ MKPARSEDNUMBERWRAPPER(hash, PyObject)
 		Py_DECREF(parsed);                                   	\
 		return res;                                          	\
 	}                                                            	\
-	MKWRITER(GzWriteParsed ## name, T, HT, parse ## name, withnone, , minmax_set, hash)
-MKPARSED(Float64, double  , double  , PyNumber_Float, PyFloat_AsDouble , 1, minmax_set_Float64, hash_double);
-MKPARSED(Float32, float   , double  , PyNumber_Float, PyFloat_AsDouble , 1, minmax_set_Float32, hash_double);
-MKPARSED(Int64  , int64_t , int64_t , PyNumber_Int  , pyLong_AsS64     , 1, minmax_set_Int64  , hash_integer);
-MKPARSED(Int32  , int32_t , int64_t , PyNumber_Int  , pyLong_AsS32     , 1, minmax_set_Int32  , hash_integer);
-MKPARSED(Bits64 , uint64_t, uint64_t, PyNumber_Long , pyLong_AsU64     , 0, minmax_set_Bits64 , hash_integer);
-MKPARSED(Bits32 , uint32_t, uint64_t, PyNumber_Int  , pyLong_AsU32     , 0, minmax_set_Bits32 , hash_integer);
+	MKWRITER(GzWriteParsed ## name, T, HT, parse ## name, withnone, , minmax_set, hash, quantiles)
+MKPARSED(Float64, double  , double  , PyNumber_Float, PyFloat_AsDouble , 1, minmax_set_Float64, hash_double, 1);
+MKPARSED(Float32, float   , double  , PyNumber_Float, PyFloat_AsDouble , 1, minmax_set_Float32, hash_double, 1);
+MKPARSED(Int64  , int64_t , int64_t , PyNumber_Int  , pyLong_AsS64     , 1, minmax_set_Int64  , hash_integer, 1);
+MKPARSED(Int32  , int32_t , int64_t , PyNumber_Int  , pyLong_AsS32     , 1, minmax_set_Int32  , hash_integer, 1);
+MKPARSED(Bits64 , uint64_t, uint64_t, PyNumber_Long , pyLong_AsU64     , 0, minmax_set_Bits64 , hash_integer, 0);
+MKPARSED(Bits32 , uint32_t, uint64_t, PyNumber_Int  , pyLong_AsU32     , 0, minmax_set_Bits32 , hash_integer, 0);
+
+static PyTypeObject GzWriteNumber_Type;
+static PyTypeObject GzWriteFloat64_Type;
+static PyTypeObject GzWriteFloat32_Type;
+static PyTypeObject GzWriteInt64_Type;
+static PyTypeObject GzWriteInt32_Type;
+static PyTypeObject GzWriteParsedNumber_Type;
+static PyTypeObject GzWriteParsedFloat64_Type;
+static PyTypeObject GzWriteParsedFloat32_Type;
+static PyTypeObject GzWriteParsedInt64_Type;
+static PyTypeObject GzWriteParsedInt32_Type;
+static int sketch_has_quantiles(GzWrite *self)
+{
+	PyTypeObject *types[] = {
+		&GzWriteNumber_Type, &GzWriteFloat64_Type, &GzWriteFloat32_Type,
+		&GzWriteInt64_Type, &GzWriteInt32_Type,
+		&GzWriteParsedNumber_Type, &GzWriteParsedFloat64_Type, &GzWriteParsedFloat32_Type,
+		&GzWriteParsedInt64_Type, &GzWriteParsedInt32_Type,
+	};
+	for (size_t i = 0; i < sizeof(types) / sizeof(*types); i++) {
+		if (Py_TYPE(self) == types[i]) return 1;
+	}
+	return 0;
+}
+
+static PyObject *gzwrite_enable_sketch(GzWrite *self)
+{
+	if (!self->fh) return err_closed();
+	if (self->count) {
+		PyErr_SetString(PyExc_ValueError, "Enable sketching before writing anything");
+		return 0;
+	}
+	if (!self->hll) {
+		self->hll = PyMem_Malloc(HLL_M);
+		if (!self->hll) return PyErr_NoMemory();
+		memset(self->hll, 0, HLL_M);
+		if (sketch_has_quantiles(self)) {
+			self->sample = PyMem_Malloc(SAMPLE_Z * sizeof(double));
+			if (!self->sample) return PyErr_NoMemory();
+		}
+		self->sample_seen = 0;
+		self->rng = 0x9e3779b97f4a7c15ULL;
+	}
+	Py_RETURN_NONE;
+}
+
+static PyObject *gzwrite_sketch(GzWrite *self)
+{
+	if (!self->hll) Py_RETURN_NONE;
+	PyObject *hll = PyBytes_FromStringAndSize((char *)self->hll, HLL_M);
+	if (!hll) return 0;
+	PyObject *sample;
+	if (self->sample) {
+		const Py_ssize_t z = self->sample_seen < SAMPLE_Z ? self->sample_seen : SAMPLE_Z;
+		sample = PyList_New(z);
+		if (!sample) goto err;
+		for (Py_ssize_t i = 0; i < z; i++) {
+			PyObject *v = PyFloat_FromDouble(self->sample[i]);
+			if (!v) {
+				Py_DECREF(sample);
+				goto err;
+			}
+			PyList_SET_ITEM(sample, i, v);
+		}
+	} else {
+		sample = Py_None;
+		Py_INCREF(sample);
+	}
+	return Py_BuildValue("(NNK)", hll, sample, (unsigned PY_LONG_LONG)self->sample_seen);
+err:
+	Py_DECREF(hll);
+	return 0;
+}
 
 static PyMemberDef w_default_members[] = {
 	{"name"      , T_STRING   , offsetof(GzWrite, name       ), READONLY},
@@ -1972,6 +2266,8 @@ static PyMemberDef w_default_members[] = {
 		{"close",     (PyCFunction)gzwrite_close, METH_NOARGS, NULL},                 	\
 		{"hashcheck", (PyCFunction)gzwrite_hashcheck_ ## name, METH_O, NULL},         	\
 		{"hash"     , (PyCFunction)gzwrite_hash_## name, METH_STATIC | METH_O, NULL}, 	\
+		{"enable_sketch", (PyCFunction)gzwrite_enable_sketch, METH_NOARGS, NULL},     	\
+		{"sketch"   , (PyCFunction)gzwrite_sketch, METH_NOARGS, NULL},                	\
 		{0}                                                                           	\
 	};                                                                                    	\
 	MKWTYPE_i(name, name ## _methods, w_default_members);
@@ -2043,9 +2339,1451 @@ static PyObject *siphash24(PyObject *dummy, PyObject *args)
 	return pyInt_FromU64(res);
 }
 
+// csv_format, the fast path for csvexport (and format_lines for dscat).
+// Values from the fixed size readers are formatted directly from the
+// file buffers, other readers (and plain iterators of str) go through
+// their objects. Either way the text is what str() (repr() for floats
+// and numbers) would give.
+// With quote == QUOTE_JSON values are formatted as JSON instead.
+
+#define CSV_CHUNK (1024 * 1024)
+#define QUOTE_JSON 256
+
+enum {
+	CSV_ITER, CSV_REPR, CSV_STR, CSV_TEXT, CSV_BYTES, CSV_RAW,
+	CSV_FLOAT64, CSV_FLOAT32, CSV_INT64, CSV_INT32, CSV_BITS64, CSV_BITS32, CSV_BOOL,
+};
+
+typedef struct csvbuf {
+	char *buf;
+	size_t len;
+	size_t size;
+} csvbuf;
+
+static int csvbuf_need(csvbuf *b, size_t need)
+{
+	if (b->len + need <= b->size) return 0;
+	size_t size = b->size ? b->size : Z;
+	while (size < b->len + need) size *= 2;
+	char *tmp = PyMem_Realloc(b->buf, size);
+	if (!tmp) {
+		PyErr_NoMemory();
+		return 1;
+	}
+	b->buf = tmp;
+	b->size = size;
+	return 0;
+}
+
+static int csvbuf_add(csvbuf *b, const char *data, size_t len)
+{
+	if (csvbuf_need(b, len)) return 1;
+	memcpy(b->buf + b->len, data, len);
+	b->len += len;
+	return 0;
+}
+
+// Add text as a JSON string (like json.dumps with ensure_ascii=False).
+static int csvbuf_json(csvbuf *b, const char *data, size_t len)
+{
+	// Worst case is all \u00XX.
+	if (csvbuf_need(b, len * 6 + 2)) return 1;
+	char *ptr = b->buf + b->len;
+	*ptr++ = '"';
+	for (size_t ix = 0; ix < len; ix++) {
+		const unsigned char c = data[ix];
+		if (c >= 0x20 && c != '"' && c != '\\') {
+			*ptr++ = c;
+			continue;
+		}
+		*ptr++ = '\\';
+		switch (c) {
+			case '"':
+			case '\\':
+				*ptr++ = c;
+				break;
+			case '\n': *ptr++ = 'n'; break;
+			case '\r': *ptr++ = 'r'; break;
+			case '\t': *ptr++ = 't'; break;
+			case '\b': *ptr++ = 'b'; break;
+			case '\f': *ptr++ = 'f'; break;
+			default:
+				ptr += sprintf(ptr, "u%04x", c);
+				break;
+		}
+	}
+	*ptr++ = '"';
+	b->len = ptr - b->buf;
+	return 0;
+}
+
+// Add a value, quoted (with quotes inside doubled) if quote is set.
+// (As a JSON string if quote is QUOTE_JSON.)
+static int csvbuf_field(csvbuf *b, const char *data, size_t len, const int quote)
+{
+	if (!quote) return csvbuf_add(b, data, len);
+	if (quote == QUOTE_JSON) return csvbuf_json(b, data, len);
+	// Worst case is all quotes.
+	if (csvbuf_need(b, len * 2 + 2)) return 1;
+	char *ptr = b->buf + b->len;
+	*ptr++ = quote;
+	while (len) {
+		const char *end = memchr(data, quote, len);
+		const size_t copylen = end ? (size_t)(end - data) + 1 : len;
+		memcpy(ptr, data, copylen);
+		ptr += copylen;
+		if (end) *ptr++ = quote;
+		data += copylen;
+		len -= copylen;
+	}
+	*ptr++ = quote;
+	b->len = ptr - b->buf;
+	return 0;
+}
+
+// str (or unicode) as utf-8, bytes as they are.
+static int csvbuf_text(csvbuf *b, PyObject *obj, const int quote)
+{
+	if (PyBytes_Check(obj)) {
+		return csvbuf_field(b, PyBytes_AS_STRING(obj), PyBytes_GET_SIZE(obj), quote);
+	}
+	if (PyUnicode_Check(obj)) {
+#if PY_MAJOR_VERSION < 3
+		PyObject *strobj = PyUnicode_AsUTF8String(obj);
+		if (!strobj) return 1;
+		const int res = csvbuf_field(b, PyBytes_AS_STRING(strobj), PyBytes_GET_SIZE(strobj), quote);
+		Py_DECREF(strobj);
+		return res;
+#else
+		Py_ssize_t len;
+		const char *data = PyUnicode_AsUTF8AndSize(obj, &len);
+		if (!data) return 1;
+		return csvbuf_field(b, data, len, quote);
+#endif
+	}
+	PyErr_Format(PyExc_TypeError, "Can only export " EITHER_NAME " values, not %s", Py_TYPE(obj)->tp_name);
+	return 1;
+}
+
+// Next raw item from a fixed size reader, 0 at the end (or on error).
+static const char *gzread_raw_(GzRead *self, const int size)
+{
+	if (self->count == self->max_count) return 0;
+	if (self->error || self->pos >= self->len) {
+		if (gzread_read_(self, size)) return 0;
+	}
+	self->count++;
+	const char *ptr = self->buf + self->pos;
+	self->pos += size;
+	return ptr;
+}
+
+#define CSV_END() return PyErr_Occurred() ? -1 : 1
+#define CSV_NONE() return csvbuf_word(b, "None", "null", quote)
+#define CSV_FMT(fmt, v) do {                                         	\
+	char tmp[32];                                                	\
+	const int len = snprintf(tmp, sizeof(tmp), fmt, v);          	\
+	return csvbuf_number(b, tmp, len, quote) ? -1 : 0;           	\
+} while (0)
+
+// Numbers are not quoted in JSON.
+static int csvbuf_number(csvbuf *b, const char *data, size_t len, const int quote)
+{
+	return csvbuf_field(b, data, len, quote == QUOTE_JSON ? 0 : quote);
+}
+
+// The python word, or the JSON word.
+static int csvbuf_word(csvbuf *b, const char *py, const char *json, const int quote)
+{
+	if (quote == QUOTE_JSON) return csvbuf_add(b, json, strlen(json)) ? -1 : 0;
+	return csvbuf_field(b, py, strlen(py), quote) ? -1 : 0;
+}
+
+// Format the next value of col, returns 0 for ok, 1 at the end and -1 on error.
+// None in text columns is only accepted with none_ok.
+static int csv_one(csvbuf *b, PyObject *col, const int kind, const int quote, const int none_ok)
+{
+	GzRead *r = (GzRead *)col;
+	const char *ptr;
+	double d;
+	switch (kind) {
+		case CSV_FLOAT64:
+			if (!(ptr = gzread_raw_(r, 8))) CSV_END();
+			if (!memcmp(ptr, noneval_double, 8)) CSV_NONE();
+			memcpy(&d, ptr, 8);
+			goto fmt_double;
+		case CSV_FLOAT32:
+			if (!(ptr = gzread_raw_(r, 4))) CSV_END();
+			if (!memcmp(ptr, noneval_float, 4)) CSV_NONE();
+			float f;
+			memcpy(&f, ptr, 4);
+			d = f;
+			goto fmt_double;
+		case CSV_INT64:
+			if (!(ptr = gzread_raw_(r, 8))) CSV_END();
+			int64_t i64;
+			memcpy(&i64, ptr, 8);
+			if (i64 == noneval_int64_t) CSV_NONE();
+			CSV_FMT("%" PRId64, i64);
+		case CSV_INT32:
+			if (!(ptr = gzread_raw_(r, 4))) CSV_END();
+			int32_t i32;
+			memcpy(&i32, ptr, 4);
+			if (i32 == noneval_int32_t) CSV_NONE();
+			CSV_FMT("%" PRId32, i32);
+		case CSV_BITS64:
+			if (!(ptr = gzread_raw_(r, 8))) CSV_END();
+			uint64_t u64;
+			memcpy(&u64, ptr, 8);
+			CSV_FMT("%" PRIu64, u64);
+		case CSV_BITS32:
+			if (!(ptr = gzread_raw_(r, 4))) CSV_END();
+			uint32_t u32;
+			memcpy(&u32, ptr, 4);
+			CSV_FMT("%" PRIu32, u32);
+		case CSV_BOOL:
+			if (!(ptr = gzread_raw_(r, 1))) CSV_END();
+			if (*(uint8_t *)ptr == noneval_uint8_t) CSV_NONE();
+			if (*ptr) {
+				return csvbuf_word(b, "True", "true", quote);
+			} else {
+				return csvbuf_word(b, "False", "false", quote);
+			}
+	}
+	PyObject *obj;
+	if (kind == CSV_ITER) {
+		obj = PyIter_Next(col);
+	} else {
+		obj = Py_TYPE(col)->tp_iternext(col);
+	}
+	if (!obj) CSV_END();
+	if (obj == Py_None && !none_ok && (kind == CSV_TEXT || kind == CSV_BYTES || kind == CSV_ITER || kind == CSV_RAW)) {
+		Py_DECREF(obj);
+		PyErr_SetString(PyExc_TypeError, "Can't export None as text");
+		return -1;
+	}
+	if (obj == Py_None) {
+		Py_DECREF(obj);
+		CSV_NONE();
+	}
+	if (kind == CSV_REPR && quote == QUOTE_JSON) {
+		// Numbers are ints or floats, and floats need JSON treatment.
+		if (PyFloat_Check(obj)) {
+			d = PyFloat_AS_DOUBLE(obj);
+			Py_DECREF(obj);
+			goto fmt_double;
+		}
+	}
+	PyObject *text;
+	if (kind == CSV_REPR) {
+		text = PyObject_Repr(obj);
+	} else if (kind == CSV_STR) {
+		text = PyObject_Str(obj);
+#if PY_MAJOR_VERSION >= 3
+	} else if (kind == CSV_BYTES) {
+		text = PyUnicode_DecodeUTF8(PyBytes_AS_STRING(obj), PyBytes_GET_SIZE(obj), "backslashreplace");
+#endif
+	} else {
+		text = obj;
+		Py_INCREF(text);
+	}
+	Py_DECREF(obj);
+	if (!text) return -1;
+	int res;
+	if (kind == CSV_RAW) {
+		res = csvbuf_text(b, text, 0);
+	} else if (kind == CSV_REPR) {
+		res = csvbuf_text(b, text, quote == QUOTE_JSON ? 0 : quote);
+	} else {
+		res = csvbuf_text(b, text, quote);
+	}
+	Py_DECREF(text);
+	return -res;
+fmt_double:
+	if (quote == QUOTE_JSON && !isfinite(d)) {
+		// Like the json module.
+		if (isnan(d)) return csvbuf_add(b, "NaN", 3) ? -1 : 0;
+		if (d > 0) return csvbuf_add(b, "Infinity", 8) ? -1 : 0;
+		return csvbuf_add(b, "-Infinity", 9) ? -1 : 0;
+	}
+	// Whole numbers are common and repr gives them as "%d.0" below 1e16.
+	if (d > -1e16 && d < 1e16 && d == (int64_t)d && (d != 0 || !signbit(d))) {
+		CSV_FMT("%" PRId64 ".0", (int64_t)d);
+	}
+	ptr = PyOS_double_to_string(d, 'r', 0, Py_DTSF_ADD_DOT_0, 0);
+	if (!ptr) return -1;
+	const int res2 = csvbuf_number(b, ptr, strlen(ptr), quote);
+	PyMem_Free((char *)ptr);
+	return -res2;
+}
+
+static int csv_kind(PyObject *col)
+{
+	const PyTypeObject *type = Py_TYPE(col);
+	int kind = -1;
+	if (type == &GzFloat64_Type) kind = CSV_FLOAT64;
+	if (type == &GzFloat32_Type) kind = CSV_FLOAT32;
+	if (type == &GzInt64_Type) kind = CSV_INT64;
+	if (type == &GzInt32_Type) kind = CSV_INT32;
+	if (type == &GzBits64_Type) kind = CSV_BITS64;
+	if (type == &GzBits32_Type) kind = CSV_BITS32;
+	if (type == &GzBool_Type) kind = CSV_BOOL;
+	if (type == &GzNumber_Type) kind = CSV_REPR;
+	if (type == &GzDateTime_Type || type == &GzDate_Type || type == &GzTime_Type) kind = CSV_STR;
+	if (type == &GzUnicode_Type || type == &GzAscii_Type || type == &GzUnicodeLines_Type || type == &GzAsciiLines_Type) kind = CSV_TEXT;
+	if (type == &GzBytes_Type || type == &GzBytesLines_Type) kind = CSV_BYTES;
+	if (kind == -1) {
+		if (PyIter_Check(col)) return CSV_ITER;
+		PyErr_Format(PyExc_TypeError, "Columns must be readers or iterators, not %s", type->tp_name);
+		return -1;
+	}
+	GzRead *r = (GzRead *)col;
+	if (!r->fh) {
+		err_closed();
+		return -1;
+	}
+	if (r->callback || r->slices) {
+		PyErr_SetString(PyExc_ValueError, "Readers with callback or hashfilter are not supported");
+		return -1;
+	}
+	return kind;
+}
+
+// The checks GzWriteBytesLines would have done.
+static int csv_checkline(const char *data, const size_t len)
+{
+	if (len == 1 && *data == 0) {
+		PyErr_SetString(PyExc_ValueError, "Line becomes None-marker");
+		return 1;
+	}
+	if (memchr(data, '\n', len)) {
+		PyErr_SetString(PyExc_ValueError, "Line must not contain \\n");
+		return 1;
+	}
+	if (len && data[len - 1] == '\r') {
+		PyErr_SetString(PyExc_ValueError, "Line must not end with \\r");
+		return 1;
+	}
+	return 0;
+}
+
+static PyObject *csv_format(PyObject *dummy, PyObject *args)
+{
+	PyObject *columns;
+	const char *sep;
+	Py_ssize_t sep_len;
+	const char *quote_str = "";
+	Py_ssize_t quote_len = 0;
+	int check_lines = 0;
+	if (!PyArg_ParseTuple(args, "Os#|s#i", &columns, &sep, &sep_len, &quote_str, &quote_len, &check_lines)) return 0;
+	if (quote_len > 1) {
+		PyErr_SetString(PyExc_ValueError, "quote must be at most one character");
+		return 0;
+	}
+	const char quote = quote_len ? *quote_str : 0;
+	PyObject *seq = PySequence_Fast(columns, "columns must be a sequence");
+	if (!seq) return 0;
+	PyObject *res = 0;
+	csvbuf b = {0, 0, 0};
+	const Py_ssize_t ncols = PySequence_Fast_GET_SIZE(seq);
+	PyObject **cols = PySequence_Fast_ITEMS(seq);
+	int *kinds = PyMem_Malloc(sizeof(int) * (ncols + 1));
+	if (!kinds) {
+		PyErr_NoMemory();
+		goto err;
+	}
+	for (Py_ssize_t ix = 0; ix < ncols; ix++) {
+		kinds[ix] = csv_kind(cols[ix]);
+		if (kinds[ix] == -1) goto err;
+	}
+	while (ncols && b.len < CSV_CHUNK) {
+		const size_t line_start = b.len;
+		for (Py_ssize_t ix = 0; ix < ncols; ix++) {
+			if (ix && csvbuf_add(&b, sep, sep_len)) goto err;
+			const int r = csv_one(&b, cols[ix], kinds[ix], quote, 0);
+			if (r < 0) goto err;
+			if (r) {
+				// Like zip, a partial line is dropped.
+				b.len = line_start;
+				goto done;
+			}
+		}
+		if (check_lines && csv_checkline(b.buf + line_start, b.len - line_start)) goto err;
+		if (csvbuf_add(&b, "\n", 1)) goto err;
+	}
+done:
+	res = PyBytes_FromStringAndSize(b.buf, b.len);
+err:
+	PyMem_Free(b.buf);
+	PyMem_Free(kinds);
+	Py_DECREF(seq);
+	return res;
+}
+
+// Next value from a blob reader, without making an object.
+// Returns 0 for a value, 1 at the end and -1 on error. None gives *r_ptr = 0.
+// *r_ptr is valid until the next read, unless *r_free is set in which case
+// the caller owns it (and must free it).
+static int gzread_blob_(GzRead *self, const char **r_ptr, uint32_t *r_size, char **r_free)
+{
+	*r_free = 0;
+	if (self->count == self->max_count) return 1;
+	if (self->error || self->pos >= self->len) {
+		if (gzread_read_(self, SIZE_Bytes)) return PyErr_Occurred() ? -1 : 1;
+	}
+	self->count++;
+	uint32_t size = ((uint8_t *)self->buf)[self->pos];
+	self->pos++;
+	char *ptr = self->buf + self->pos;
+	uint32_t left_in_buf = self->len - self->pos;
+	if (!left_in_buf && size) {
+		if (gzread_read_(self, SIZE_Bytes)) goto fferror;
+		left_in_buf = self->len;
+		ptr = self->buf;
+	}
+	if (size == 255) {
+		if (left_in_buf < 4) {
+			char *size_ptr = (char *)&size;
+			int need_more = 4 - left_in_buf;
+			memcpy(size_ptr, ptr, left_in_buf);
+			size_ptr += left_in_buf;
+			if (gzread_read_(self, SIZE_Bytes)) goto fferror;
+			if (self->len < need_more) goto fferror;
+			memcpy(size_ptr, self->buf, need_more);
+			self->pos = need_more;
+		} else {
+			memcpy(&size, ptr, 4);
+			self->pos += 4;
+		}
+		if (size == 0) {
+			*r_ptr = 0;
+			*r_size = 0;
+			return 0;
+		}
+		if (size < 255) goto fferror;
+		ptr = self->buf + self->pos;
+		left_in_buf = self->len - self->pos;
+	}
+	if (size > Z) {
+		char *tmp = malloc(size);
+		if (!tmp) {
+			PyErr_NoMemory();
+			return -1;
+		}
+		memcpy(tmp, ptr, left_in_buf);
+		self->pos = self->len;
+		const int want_len = size - left_in_buf;
+		int read_len = gzread(self->fh, tmp + left_in_buf, want_len);
+		if (read_len != want_len) {
+			free(tmp);
+			(void) gzerror(self->fh, &self->error);
+			goto fferror;
+		}
+		*r_ptr = *r_free = tmp;
+		*r_size = size;
+		return 0;
+	}
+	if (size > left_in_buf) {
+		memmove(self->buf, ptr, left_in_buf);
+		ptr = self->buf + left_in_buf;
+		int read_len = gzread(self->fh, ptr, Z - left_in_buf);
+		if (read_len <= 0) {
+			(void) gzerror(self->fh, &self->error);
+			goto fferror;
+		}
+		if (read_len + left_in_buf < size) goto fferror;
+		self->len = read_len + left_in_buf;
+		self->pos = 0;
+		ptr = self->buf;
+	}
+	self->pos += size;
+	*r_ptr = ptr;
+	*r_size = size;
+	return 0;
+fferror:
+	PyErr_SetString(PyExc_ValueError, "File format error");
+	return -1;
+}
+
+// Skip count values in col, returns 0 for ok and -1 on error.
+static int csv_skip(PyObject *col, const int kind, PY_LONG_LONG count)
+{
+	if (kind == CSV_ITER) {
+		while (count--) {
+			PyObject *obj = PyIter_Next(col);
+			if (!obj) return PyErr_Occurred() ? -1 : 0;
+			Py_DECREF(obj);
+		}
+		return 0;
+	}
+	GzRead *r = (GzRead *)col;
+	if (r->max_count >= 0 && count > r->max_count - r->count) {
+		count = r->max_count - r->count;
+	}
+	const PY_LONG_LONG done = gzread_skip_(r, count);
+	r->count += done;
+	if (done < count && r->error) {
+		PyErr_SetString(PyExc_ValueError, "File format error");
+		return -1;
+	}
+	return 0;
+}
+
+typedef struct csvgroup {
+	PyObject *seq;
+	PyObject **cols;
+	int *kinds;
+	Py_buffer mask;
+	int active;
+} csvgroup;
+
+static PyObject *format_lines(PyObject *dummy, PyObject *args, PyObject *kwds)
+{
+	static char *kwlist[] = {"groups", "separator", "quote", "names", "raw_columns", "masks", "max_lines", 0};
+	PyObject *groups_arg;
+	const char *sep = "\t";
+	Py_ssize_t sep_len = 1;
+	const char *quote_str = "";
+	Py_ssize_t quote_len = 0;
+	PyObject *names = Py_None;
+	PyObject *raw_columns = Py_None;
+	PyObject *masks = Py_None;
+	PY_LONG_LONG max_lines = -1;
+	if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|s#s#OOOL", kwlist, &groups_arg, &sep, &sep_len, &quote_str, &quote_len, &names, &raw_columns, &masks, &max_lines)) return 0;
+	if (quote_len > 1) {
+		PyErr_SetString(PyExc_ValueError, "quote must be at most one character");
+		return 0;
+	}
+	int quote = quote_len ? *quote_str : 0;
+	PyObject *res = 0;
+	csvbuf b = {0, 0, 0};
+	csvbuf keys = {0, 0, 0};
+	size_t *key_ends = 0;
+	csvgroup *groups = 0;
+	Py_ssize_t ngroups = 0;
+	Py_ssize_t ncols = -1;
+	PY_LONG_LONG lines = 0;
+	PyObject *seq = PySequence_Fast(groups_arg, "groups must be a sequence");
+	if (!seq) return 0;
+	const Py_ssize_t groups_len = PySequence_Fast_GET_SIZE(seq);
+	groups = PyMem_Malloc(sizeof(*groups) * (groups_len + 1));
+	if (!groups) {
+		PyErr_NoMemory();
+		goto err;
+	}
+	for (; ngroups < groups_len; ngroups++) {
+		csvgroup *g = &groups[ngroups];
+		memset(g, 0, sizeof(*g));
+		g->active = 1;
+		g->seq = PySequence_Fast(PySequence_Fast_GET_ITEM(seq, ngroups), "groups must be sequences of columns");
+		if (!g->seq) goto err;
+		if (ncols == -1) ncols = PySequence_Fast_GET_SIZE(g->seq);
+		if (ncols != PySequence_Fast_GET_SIZE(g->seq)) {
+			PyErr_SetString(PyExc_ValueError, "All groups must have the same number of columns");
+			goto err;
+		}
+		g->cols = PySequence_Fast_ITEMS(g->seq);
+		g->kinds = PyMem_Malloc(sizeof(int) * (ncols + 1));
+		if (!g->kinds) {
+			PyErr_NoMemory();
+			goto err;
+		}
+		for (Py_ssize_t ix = 0; ix < ncols; ix++) {
+			g->kinds[ix] = csv_kind(g->cols[ix]);
+			if (g->kinds[ix] == -1) goto err;
+		}
+		if (masks != Py_None) {
+			PyObject *mask = PySequence_GetItem(masks, ngroups);
+			if (!mask) goto err;
+			if (mask != Py_None) {
+				const int bad = PyObject_GetBuffer(mask, &g->mask, PyBUF_SIMPLE);
+				Py_DECREF(mask);
+				if (bad) goto err;
+				if (!ncols || g->kinds[0] == CSV_ITER) {
+					PyErr_SetString(PyExc_TypeError, "The first column must be a reader to use a mask");
+					goto err;
+				}
+			} else {
+				Py_DECREF(mask);
+			}
+		}
+	}
+	if (ncols <= 0) goto done;
+	if (raw_columns != Py_None) {
+		PyObject *raw_seq = PySequence_Fast(raw_columns, "raw_columns must be a sequence");
+		if (!raw_seq) goto err;
+		for (Py_ssize_t ix = 0; ix < PySequence_Fast_GET_SIZE(raw_seq); ix++) {
+			const Py_ssize_t colix = PyNumber_AsSsize_t(PySequence_Fast_GET_ITEM(raw_seq, ix), 0);
+			if (colix == -1 && PyErr_Occurred()) {
+				Py_DECREF(raw_seq);
+				goto err;
+			}
+			if (colix < 0 || colix >= ncols) {
+				Py_DECREF(raw_seq);
+				PyErr_SetString(PyExc_IndexError, "raw_columns out of range");
+				goto err;
+			}
+			for (Py_ssize_t gix = 0; gix < ngroups; gix++) {
+				const int kind = groups[gix].kinds[colix];
+				if (kind != CSV_TEXT && kind != CSV_BYTES && kind != CSV_ITER) {
+					Py_DECREF(raw_seq);
+					PyErr_SetString(PyExc_TypeError, "raw_columns must be text");
+					goto err;
+				}
+				groups[gix].kinds[colix] = CSV_RAW;
+			}
+		}
+		Py_DECREF(raw_seq);
+	}
+	if (names != Py_None) {
+		// JSON objects, with the keys formatted once here.
+		quote = QUOTE_JSON;
+		PyObject *names_seq = PySequence_Fast(names, "names must be a sequence");
+		if (!names_seq) goto err;
+		if (PySequence_Fast_GET_SIZE(names_seq) != ncols) {
+			Py_DECREF(names_seq);
+			PyErr_SetString(PyExc_ValueError, "Need one name per column");
+			goto err;
+		}
+		key_ends = PyMem_Malloc(sizeof(size_t) * ncols);
+		if (!key_ends) {
+			Py_DECREF(names_seq);
+			PyErr_NoMemory();
+			goto err;
+		}
+		for (Py_ssize_t ix = 0; ix < ncols; ix++) {
+			if (csvbuf_add(&keys, ix ? "," : "{", 1)
+			    || csvbuf_text(&keys, PySequence_Fast_GET_ITEM(names_seq, ix), QUOTE_JSON)
+			    || csvbuf_add(&keys, ":", 1)
+			) {
+				Py_DECREF(names_seq);
+				goto err;
+			}
+			key_ends[ix] = keys.len;
+		}
+		Py_DECREF(names_seq);
+	}
+	Py_ssize_t nactive = ngroups;
+	while (nactive && b.len < CSV_CHUNK && lines != max_lines) {
+		for (Py_ssize_t gix = 0; gix < ngroups && lines != max_lines; gix++) {
+			csvgroup *g = &groups[gix];
+			if (!g->active) continue;
+			if (g->mask.buf) {
+				const char *mask = g->mask.buf;
+				const PY_LONG_LONG pos = ((GzRead *)g->cols[0])->count;
+				PY_LONG_LONG end = pos;
+				while (end < g->mask.len && !mask[end]) end++;
+				if (end > pos) {
+					for (Py_ssize_t ix = 0; ix < ncols; ix++) {
+						if (csv_skip(g->cols[ix], g->kinds[ix], end - pos)) goto err;
+					}
+				}
+				if (end >= g->mask.len) {
+					g->active = 0;
+					nactive--;
+					continue;
+				}
+			}
+			const size_t line_start = b.len;
+			for (Py_ssize_t ix = 0; ix < ncols; ix++) {
+				if (key_ends) {
+					const size_t key_start = ix ? key_ends[ix - 1] : 0;
+					if (csvbuf_add(&b, keys.buf + key_start, key_ends[ix] - key_start)) goto err;
+				} else if (ix && csvbuf_add(&b, sep, sep_len)) {
+					goto err;
+				}
+				const int r = csv_one(&b, g->cols[ix], g->kinds[ix], quote, 1);
+				if (r < 0) goto err;
+				if (r) {
+					// Like zip, a partial line is dropped.
+					b.len = line_start;
+					g->active = 0;
+					nactive--;
+					break;
+				}
+			}
+			if (!g->active) continue;
+			if (key_ends && csvbuf_add(&b, "}", 1)) goto err;
+			if (csvbuf_add(&b, "\n", 1)) goto err;
+			lines++;
+		}
+	}
+done:
+	res = Py_BuildValue("(NL)", PyBytes_FromStringAndSize(b.buf, b.len), lines);
+err:
+	for (Py_ssize_t gix = 0; gix < ngroups; gix++) {
+		if (groups[gix].mask.buf) PyBuffer_Release(&groups[gix].mask);
+		PyMem_Free(groups[gix].kinds);
+		Py_XDECREF(groups[gix].seq);
+	}
+	if (ngroups < groups_len && groups) {
+		// The group that failed during setup.
+		if (groups[ngroups].mask.buf) PyBuffer_Release(&groups[ngroups].mask);
+		PyMem_Free(groups[ngroups].kinds);
+		Py_XDECREF(groups[ngroups].seq);
+	}
+	PyMem_Free(groups);
+	PyMem_Free(keys.buf);
+	PyMem_Free(key_ends);
+	PyMem_Free(b.buf);
+	Py_DECREF(seq);
+	return res;
+}
+
+// Search the values of a blob reader, either for a fixed string (directly
+// in the file data) or with a function called with each value. Values that
+// are already marked in the result bytearray are not searched.
+static PyObject *grep(PyObject *dummy, PyObject *args)
+{
+	PyObject *col;
+	PyObject *res;
+	const char *needle = 0;
+	Py_ssize_t needle_len = 0;
+	PyObject *search = Py_None;
+	int none_match = 0;
+	if (!PyArg_ParseTuple(args, "OO|z#Oi", &col, &res, &needle, &needle_len, &search, &none_match)) return 0;
+	PyObject *(*mkblob)(GzRead *, const char *, int) = 0;
+	if (Py_TYPE(col) == &GzBytes_Type) mkblob = mkblobBytes;
+	if (Py_TYPE(col) == &GzAscii_Type) mkblob = mkblobAscii;
+	if (Py_TYPE(col) == &GzUnicode_Type) mkblob = mkblobUnicode;
+	if (!mkblob) {
+		PyErr_Format(PyExc_TypeError, "Can only grep in GzBytes, GzAscii and GzUnicode, not %s", Py_TYPE(col)->tp_name);
+		return 0;
+	}
+	if (!PyByteArray_Check(res)) {
+		PyErr_SetString(PyExc_TypeError, "result must be a bytearray");
+		return 0;
+	}
+	if (!needle && search == Py_None) {
+		PyErr_SetString(PyExc_ValueError, "Specify needle or search");
+		return 0;
+	}
+	GzRead *r = (GzRead *)col;
+	if (!r->fh) return err_closed();
+	if (r->callback || r->slices) {
+		PyErr_SetString(PyExc_ValueError, "Readers with callback or hashfilter are not supported");
+		return 0;
+	}
+	char *matched = PyByteArray_AS_STRING(res);
+	const Py_ssize_t count = PyByteArray_GET_SIZE(res);
+	Py_ssize_t ix;
+	for (ix = 0; ix < count; ix++) {
+		const char *ptr;
+		uint32_t size;
+		char *tofree;
+		const int got = gzread_blob_(r, &ptr, &size, &tofree);
+		if (got < 0) return 0;
+		if (got) break;
+		if (matched[ix]) {
+			free(tofree);
+			continue;
+		}
+		int hit;
+		if (!ptr) {
+			hit = none_match;
+		} else if (needle) {
+			hit = !needle_len || memmem(ptr, size, needle, needle_len);
+		} else {
+			PyObject *obj = mkblob(r, ptr, size);
+			if (!obj) goto err;
+			PyObject *m = PyObject_CallFunctionObjArgs(search, obj, NULL);
+			Py_DECREF(obj);
+			if (!m) goto err;
+			hit = PyObject_IsTrue(m);
+			Py_DECREF(m);
+			if (hit < 0) goto err;
+		}
+		free(tofree);
+		if (hit) matched[ix] = 1;
+		continue;
+err:
+		free(tofree);
+		return 0;
+	}
+	return PyLong_FromSsize_t(ix);
+}
+
+// Copying values from a reader to a writer of the same type, without
+// decoding and encoding them. Returns 0 for a value, 1 at the end and -1
+// on error, like gzread_blob_.
+
+static int copy_none_check(GzWrite *w)
+{
+	if (!w->none_support) {
+		PyErr_SetString(PyExc_ValueError, "Refusing to write None value without none_support=True");
+		return -1;
+	}
+	return 0;
+}
+
+#define MKCOPY(name, T, HT, withnone, minmax_value, minmax_set, hash, quantiles)	\
+	static int copy_ ## name(GzRead *r, GzWrite *w)                                  	\
+	{                                                                                	\
+		if (r->count == r->max_count) return 1;                                  	\
+		if (r->error || r->pos >= r->len) {                                      	\
+			if (gzread_read_(r, sizeof(T))) return PyErr_Occurred() ? -1 : 1;	\
+		}                                                                        	\
+		r->count++;                                                              	\
+		T value;                                                                 	\
+		/* Z is a multiple of sizeof(T), so this never overruns. */              	\
+		memcpy(&value, r->buf + r->pos, sizeof(T));                              	\
+		r->pos += sizeof(T);                                                     	\
+		if (withnone && !memcmp(&value, &noneval_ ## T, sizeof(T))) {            	\
+			if (copy_none_check(w)) return -1;                               	\
+		} else {                                                                 	\
+			T cmp_value = minmax_value(value);                               	\
+			if (!w->min_obj || (cmp_value < w->min_u.as_ ## T)) {            	\
+				minmax_set(&w->min_obj, 0, &w->min_u, &cmp_value, sizeof(cmp_value));	\
+			}                                                                	\
+			if (!w->max_obj || (cmp_value > w->max_u.as_ ## T)) {            	\
+				minmax_set(&w->max_obj, 0, &w->max_u, &cmp_value, sizeof(cmp_value));	\
+			}                                                                	\
+			if (w->hll) {                                                    	\
+				const HT h_value = value;                                	\
+				sketch_hash(w, hash(&h_value));                          	\
+				if (quantiles) sketch_sample(w, (double)value);          	\
+			}                                                                	\
+		}                                                                        	\
+		PyObject *ret = gzwrite_write_(w, (char *)&value, sizeof(value));        	\
+		if (!ret) return -1;                                                     	\
+		Py_DECREF(ret);                                                          	\
+		w->count++;                                                              	\
+		return 0;                                                                	\
+	}
+MKCOPY(Float64 , double  , double  , 1, , minmax_set_Float64 , hash_double , 1);
+MKCOPY(Float32 , float   , double  , 1, , minmax_set_Float32 , hash_double , 1);
+MKCOPY(Int64   , int64_t , int64_t , 1, , minmax_set_Int64   , hash_integer, 1);
+MKCOPY(Int32   , int32_t , int64_t , 1, , minmax_set_Int32   , hash_integer, 1);
+MKCOPY(Bits64  , uint64_t, uint64_t, 0, , minmax_set_Bits64  , hash_integer, 0);
+MKCOPY(Bits32  , uint32_t, uint64_t, 0, , minmax_set_Bits32  , hash_integer, 0);
+MKCOPY(Bool    , uint8_t , uint8_t , 1, , minmax_set_Bool    , hash_bool   , 0);
+MKCOPY(DateTime, uint64_t, uint64_t, 1, minmax_value_datetime, minmax_set_DateTime, hash_64bits, 0);
+MKCOPY(Date    , uint32_t, uint32_t, 1, , minmax_set_Date    , hash_32bits , 0);
+MKCOPY(Time    , uint64_t, uint64_t, 1, minmax_value_datetime, minmax_set_Time, hash_64bits, 0);
+
+static int copy_Blob(GzRead *r, GzWrite *w)
+{
+	const char *ptr;
+	uint32_t size;
+	char *tofree;
+	const int got = gzread_blob_(r, &ptr, &size, &tofree);
+	if (got) return got;
+	PyObject *ret;
+	if (!ptr) {
+		if (copy_none_check(w)) return -1;
+		ret = gzwrite_write_(w, "\xff\x00\x00\x00\x00", 5);
+	} else {
+		if (w->hll) sketch_hash(w, hash(ptr, size));
+		if (size < 255) {
+			uint8_t short_len = size;
+			ret = gzwrite_write_(w, (char *)&short_len, 1);
+		} else {
+			uint8_t lenbuf[5];
+			lenbuf[0] = 255;
+			memcpy(lenbuf + 1, &size, 4);
+			ret = gzwrite_write_(w, (char *)lenbuf, 5);
+		}
+		if (ret) {
+			Py_DECREF(ret);
+			ret = gzwrite_write_(w, ptr, size);
+		}
+	}
+	free(tofree);
+	if (!ret) return -1;
+	Py_DECREF(ret);
+	w->count++;
+	return 0;
+}
+
+static int (*copy_func(PyTypeObject *r_type, PyTypeObject *w_type))(GzRead *, GzWrite *)
+{
+	struct { PyTypeObject *r, *w; int (*f)(GzRead *, GzWrite *); } funcs[] = {
+		{&GzFloat64_Type , &GzWriteFloat64_Type , copy_Float64 },
+		{&GzFloat32_Type , &GzWriteFloat32_Type , copy_Float32 },
+		{&GzInt64_Type   , &GzWriteInt64_Type   , copy_Int64   },
+		{&GzInt32_Type   , &GzWriteInt32_Type   , copy_Int32   },
+		{&GzBits64_Type  , &GzWriteBits64_Type  , copy_Bits64  },
+		{&GzBits32_Type  , &GzWriteBits32_Type  , copy_Bits32  },
+		{&GzBool_Type    , &GzWriteBool_Type    , copy_Bool    },
+		{&GzDateTime_Type, &GzWriteDateTime_Type, copy_DateTime},
+		{&GzDate_Type    , &GzWriteDate_Type    , copy_Date    },
+		{&GzTime_Type    , &GzWriteTime_Type    , copy_Time    },
+		{&GzBytes_Type   , &GzWriteBytes_Type   , copy_Blob    },
+		{&GzAscii_Type   , &GzWriteAscii_Type   , copy_Blob    },
+		{&GzUnicode_Type , &GzWriteUnicode_Type , copy_Blob    },
+	};
+	for (size_t i = 0; i < sizeof(funcs) / sizeof(*funcs); i++) {
+		if (funcs[i].r == r_type && funcs[i].w == w_type) return funcs[i].f;
+	}
+	return 0;
+}
+
+static int is_reader(PyTypeObject *type)
+{
+	PyTypeObject *types[] = {
+		&GzBytes_Type, &GzAscii_Type, &GzUnicode_Type,
+		&GzBytesLines_Type, &GzAsciiLines_Type, &GzUnicodeLines_Type,
+		&GzNumber_Type, &GzFloat64_Type, &GzFloat32_Type,
+		&GzInt64_Type, &GzInt32_Type, &GzBits64_Type, &GzBits32_Type,
+		&GzBool_Type, &GzDateTime_Type, &GzDate_Type, &GzTime_Type,
+	};
+	for (size_t i = 0; i < sizeof(types) / sizeof(*types); i++) {
+		if (type == types[i]) return 1;
+	}
+	return 0;
+}
+
+// Skip up to count values, respecting max_count. Returns how many were skipped.
+static PY_LONG_LONG copy_skip(GzRead *r, PY_LONG_LONG count)
+{
+	if (r->max_count >= 0 && count > r->max_count - r->count) {
+		count = r->max_count - r->count;
+	}
+	const PY_LONG_LONG done = gzread_skip_(r, count);
+	r->count += done;
+	return done;
+}
+
+typedef struct copysource {
+	GzRead *r;
+	int (*copy_one)(GzRead *, GzWrite *);
+	int active;
+} copysource;
+
+// Copy the values that have a non-zero byte in mask from reader to writer,
+// skipping the others. reader can also be a list of readers, which are then
+// read round robin (like format_lines groups, leaving out readers that have
+// ended). With cyclic=True the mask is repeated until all readers end.
+// When the writer is of the same type as the reader (and has no hashfilter)
+// the values are copied as they are stored, otherwise they are passed to
+// writer.write. Returns how many values were copied.
+static PyObject *copy(PyObject *dummy, PyObject *args, PyObject *kwds)
+{
+	static char *kwlist[] = {"reader", "writer", "mask", "cyclic", 0};
+	PyObject *reader_arg;
+	PyObject *writer;
+	PyObject *mask_obj;
+	int cyclic = 0;
+	if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOO|i", kwlist, &reader_arg, &writer, &mask_obj, &cyclic)) return 0;
+	PyObject *write = 0;
+	PyObject *seq = 0;
+	copysource *sources = 0;
+	Py_buffer mask;
+	mask.obj = 0;
+	Py_ssize_t nsources;
+	if (PyList_Check(reader_arg) || PyTuple_Check(reader_arg)) {
+		seq = PySequence_Fast(reader_arg, "");
+		if (!seq) return 0;
+		nsources = PySequence_Fast_GET_SIZE(seq);
+	} else {
+		nsources = 1;
+	}
+	sources = PyMem_Malloc(sizeof(*sources) * (nsources + 1));
+	if (!sources) {
+		PyErr_NoMemory();
+		goto err;
+	}
+	GzWrite *w = (GzWrite *)writer;
+	int need_write = 0;
+	Py_ssize_t active = nsources;
+	for (Py_ssize_t i = 0; i < nsources; i++) {
+		PyObject *reader = seq ? PySequence_Fast_GET_ITEM(seq, i) : reader_arg;
+		if (!is_reader(Py_TYPE(reader))) {
+			PyErr_Format(PyExc_TypeError, "Can only copy from Gz* readers, not %s", Py_TYPE(reader)->tp_name);
+			goto err;
+		}
+		GzRead *r = (GzRead *)reader;
+		if (!r->fh) {
+			err_closed();
+			goto err;
+		}
+		if (r->callback || r->slices) {
+			PyErr_SetString(PyExc_ValueError, "Readers with callback or hashfilter are not supported");
+			goto err;
+		}
+		sources[i].r = r;
+		sources[i].active = 1;
+		sources[i].copy_one = copy_func(Py_TYPE(reader), Py_TYPE(writer));
+		if (sources[i].copy_one) {
+			if (!w->fh) {
+				err_closed();
+				goto err;
+			}
+			if (w->slices) sources[i].copy_one = 0;
+		}
+		if (!sources[i].copy_one) need_write = 1;
+	}
+	if (need_write) {
+		write = PyObject_GetAttrString(writer, "write");
+		if (!write) goto err;
+	}
+	if (PyObject_GetBuffer(mask_obj, &mask, PyBUF_SIMPLE)) {
+		mask.obj = 0;
+		goto err;
+	}
+	if (cyclic && !mask.len) {
+		PyErr_SetString(PyExc_ValueError, "A cyclic mask can not be empty");
+		goto err;
+	}
+	const char *m = mask.buf;
+	Py_ssize_t pos = 0;
+	Py_ssize_t ix = 0;
+	PY_LONG_LONG copied = 0;
+	while (active) {
+		if (pos == mask.len) {
+			if (!cyclic) break;
+			pos = 0;
+		}
+		copysource *src = &sources[ix];
+		if (!src->active) {
+			ix = (ix + 1) % nsources;
+			continue;
+		}
+		int ended = 0;
+		if (!m[pos]) {
+			// With only one reader a whole run can be skipped at once.
+			Py_ssize_t end = pos + 1;
+			if (nsources == 1) {
+				while (end < mask.len && !m[end]) end++;
+			}
+			const PY_LONG_LONG done = copy_skip(src->r, end - pos);
+			if (src->r->error) {
+				PyErr_SetString(PyExc_ValueError, "File format error");
+				goto err;
+			}
+			pos += done;
+			ended = (pos != end);
+		} else if (src->copy_one) {
+			const int got = src->copy_one(src->r, w);
+			if (got < 0) goto err;
+			ended = got;
+			copied += !ended;
+			pos += !ended;
+		} else {
+			PyObject *value = Py_TYPE(src->r)->tp_iternext((PyObject *)src->r);
+			if (value) {
+				PyObject *ret = PyObject_CallFunctionObjArgs(write, value, NULL);
+				Py_DECREF(value);
+				if (!ret) goto err;
+				Py_DECREF(ret);
+				if (ret == Py_False) {
+					PyErr_SetString(PyExc_ValueError, "Value does not belong in this slice of the writer");
+					goto err;
+				}
+				copied++;
+				pos++;
+			} else {
+				if (PyErr_Occurred()) goto err;
+				ended = 1;
+			}
+		}
+		if (ended) {
+			src->active = 0;
+			active--;
+		}
+		ix = (ix + 1) % nsources;
+	}
+	PyBuffer_Release(&mask);
+	Py_XDECREF(write);
+	Py_XDECREF(seq);
+	PyMem_Free(sources);
+	return PyLong_FromLongLong(copied);
+err:
+	if (mask.obj) PyBuffer_Release(&mask);
+	Py_XDECREF(write);
+	Py_XDECREF(seq);
+	PyMem_Free(sources);
+	return 0;
+}
+
+// Conditions for where. The comparisons (and in) never match None.
+enum { W_EQ, W_NE, W_LT, W_LE, W_GT, W_GE, W_IN, W_NOTIN, W_ISNONE, W_ISNOTNONE };
+static const char *where_ops[] = {"==", "!=", "<", "<=", ">", ">=", "in", "not in", "is None", "is not None", 0};
+static const int where_pyops[] = {Py_EQ, Py_NE, Py_LT, Py_LE, Py_GT, Py_GE};
+
+#define WHERE_CMP(op, cmp) (                	\
+	(op) == W_EQ ? (cmp) == 0 :         	\
+	(op) == W_NE ? (cmp) != 0 :         	\
+	(op) == W_LT ? (cmp) <  0 :         	\
+	(op) == W_LE ? (cmp) <= 0 :         	\
+	(op) == W_GT ? (cmp) >  0 :         	\
+	               (cmp) >= 0           	\
+)
+
+// Skip the values with a zero in m from pos, returns the new pos (or -1 on error).
+static Py_ssize_t where_skip(GzRead *r, const char *m, Py_ssize_t pos, Py_ssize_t len)
+{
+	Py_ssize_t end = pos;
+	while (end < len && !m[end]) end++;
+	if (end > pos) {
+		const PY_LONG_LONG done = copy_skip(r, end - pos);
+		if (r->error) {
+			PyErr_SetString(PyExc_ValueError, "File format error");
+			return -1;
+		}
+		if (done < end - pos) return len + 1; // ended
+	}
+	return end;
+}
+
+static inline PyObject *where_unfmt_datetime(uint64_t v)
+{
+	uint32_t a[2];
+	memcpy(a, &v, 8);
+	return unfmt_datetime(a[0], a[1]);
+}
+
+static inline PyObject *where_unfmt_time(uint64_t v)
+{
+	uint32_t a[2];
+	memcpy(a, &v, 8);
+	return unfmt_time(a[0], a[1]);
+}
+
+// Fixed size types. The values are converted to stored form once, and
+// only used if they survive the trip back unchanged. Otherwise (say an
+// int column compared to 2.5) the comparisons are done on objects.
+// Returns 1 if done, 0 if the values could not be used, -1 on error.
+#define MKWHERE(name, T, withnone, minmax_value, check, conv, unconv)                   	\
+	static int where_cmp_ ## name(const void *a, const void *b)                     	\
+	{                                                                               	\
+		const T va = *(const T *)a;                                             	\
+		const T vb = *(const T *)b;                                             	\
+		return (va > vb) - (va < vb);                                           	\
+	}                                                                               	\
+	static int where_ ## name(GzRead *r, char *m, Py_ssize_t len, int op, PyObject *value)	\
+	{                                                                               	\
+		T *values = 0;                                                          	\
+		Py_ssize_t nvalues = 0;                                                 	\
+		PyObject *seq = 0;                                                      	\
+		int res = 0;                                                            	\
+		if (op <= W_NOTIN) {                                                    	\
+			if (op >= W_IN) {                                               	\
+				seq = PySequence_Fast(value, "in needs a sequence (or set)");	\
+				if (!seq) return -1;                                    	\
+			} else {                                                        	\
+				seq = PyTuple_Pack(1, value);                           	\
+				if (!seq) return -1;                                    	\
+			}                                                               	\
+			const Py_ssize_t seqlen = PySequence_Fast_GET_SIZE(seq);        	\
+			values = PyMem_Malloc(sizeof(T) * (seqlen + 1));                	\
+			if (!values) {                                                  	\
+				PyErr_NoMemory();                                       	\
+				res = -1;                                               	\
+				goto out;                                               	\
+			}                                                               	\
+			for (Py_ssize_t i = 0; i < seqlen; i++) {                       	\
+				PyObject *obj = PySequence_Fast_GET_ITEM(seq, i);       	\
+				if (obj == Py_None) {                                   	\
+					if (op == W_IN || op == W_NOTIN) continue;      	\
+					goto out;                                       	\
+				}                                                       	\
+				if (!check(obj)) goto out;                              	\
+				T v = conv(obj);                                        	\
+				if (PyErr_Occurred()) {                                 	\
+					PyErr_Clear();                                  	\
+					goto out;                                       	\
+				}                                                       	\
+				PyObject *back = unconv(v);                             	\
+				if (!back) {                                            	\
+					PyErr_Clear();                                  	\
+					goto out;                                       	\
+				}                                                       	\
+				const int same = PyObject_RichCompareBool(back, obj, Py_EQ);	\
+				Py_DECREF(back);                                        	\
+				if (same != 1) {                                        	\
+					PyErr_Clear();                                  	\
+					goto out;                                       	\
+				}                                                       	\
+				if (withnone && !memcmp(&v, &noneval_ ## T, sizeof(T))) goto out;	\
+				v = minmax_value(v);                                    	\
+				if (v != v) { /* NaN, never equal to anything */        	\
+					if (op == W_IN || op == W_NOTIN) continue;      	\
+				}                                                       	\
+				values[nvalues++] = v;                                  	\
+			}                                                               	\
+			if (op >= W_IN) qsort(values, nvalues, sizeof(T), where_cmp_ ## name);	\
+		}                                                                       	\
+		Py_ssize_t pos = 0;                                                     	\
+		while (1) {                                                             	\
+			pos = where_skip(r, m, pos, len);                               	\
+			if (pos < 0) {                                                  	\
+				res = -1;                                               	\
+				goto out;                                               	\
+			}                                                               	\
+			if (pos == len) break;                                          	\
+			if (pos > len || r->count == r->max_count) goto ended;          	\
+			if (r->error || r->pos >= r->len) {                             	\
+				if (gzread_read_(r, sizeof(T))) {                       	\
+					if (PyErr_Occurred()) {                         	\
+						res = -1;                               	\
+						goto out;                               	\
+					}                                               	\
+					goto ended;                                     	\
+				}                                                       	\
+			}                                                               	\
+			r->count++;                                                     	\
+			T v;                                                            	\
+			/* Z is a multiple of sizeof(T), so this never overruns. */     	\
+			memcpy(&v, r->buf + r->pos, sizeof(T));                         	\
+			r->pos += sizeof(T);                                            	\
+			int hit;                                                        	\
+			if (withnone && !memcmp(&v, &noneval_ ## T, sizeof(T))) {       	\
+				hit = (op == W_ISNONE);                                 	\
+			} else if (op == W_ISNONE || op == W_ISNOTNONE) {               	\
+				hit = (op == W_ISNOTNONE);                              	\
+			} else if (op >= W_IN) {                                        	\
+				v = minmax_value(v);                                    	\
+				/* NaN is not in anything (and compares equal in bsearch) */	\
+				hit = v == v && bsearch(&v, values, nvalues, sizeof(T), where_cmp_ ## name);	\
+				if (op == W_NOTIN) hit = !hit;                          	\
+			} else {                                                        	\
+				v = minmax_value(v);                                    	\
+				if (v != v || values[0] != values[0]) {                 	\
+					hit = (op == W_NE);                             	\
+				} else {                                                	\
+					hit = WHERE_CMP(op, (v > values[0]) - (v < values[0]));	\
+				}                                                       	\
+			}                                                               	\
+			m[pos] = hit;                                                   	\
+			pos++;                                                          	\
+		}                                                                       	\
+		res = 1;                                                                	\
+		goto out;                                                               	\
+ended:                                                                                  	\
+		PyErr_SetString(PyExc_ValueError, "Reader ended before the mask");      	\
+		res = -1;                                                               	\
+out:                                                                                    	\
+		Py_XDECREF(seq);                                                        	\
+		PyMem_Free(values);                                                     	\
+		return res;                                                             	\
+	}
+#define where_any(obj) 1
+MKWHERE(Float64 , double  , 1, , where_any     , PyFloat_AsDouble, PyFloat_FromDouble);
+MKWHERE(Float32 , float   , 1, , where_any     , PyFloat_AsDouble, PyFloat_FromDouble);
+MKWHERE(Int64   , int64_t , 1, , Integer_Check , pyLong_AsS64    , pyInt_FromS64);
+MKWHERE(Int32   , int32_t , 1, , Integer_Check , pyLong_AsS32    , pyInt_FromS32);
+MKWHERE(Bits64  , uint64_t, 0, , Integer_Check , pyLong_AsU64    , pyInt_FromU64);
+MKWHERE(Bits32  , uint32_t, 0, , Integer_Check , pyLong_AsU32    , pyInt_FromU32);
+MKWHERE(Bool    , uint8_t , 1, , Integer_Check , pyLong_AsBool   , PyBool_FromLong);
+MKWHERE(DateTime, uint64_t, 1, minmax_value_datetime, where_any, fmt_datetime, where_unfmt_datetime);
+MKWHERE(Date    , uint32_t, 1, , where_any     , fmt_date        , unfmt_date);
+MKWHERE(Time    , uint64_t, 1, minmax_value_datetime, where_any, fmt_time, where_unfmt_time);
+
+// Blob types compare the stored bytes (UTF-8 sorts like the code points)
+// for the comparison ops. Returns like the fixed size versions.
+static int where_Blob(GzRead *r, char *m, Py_ssize_t len, int op, PyObject *value)
+{
+	if (op >= W_IN && op <= W_NOTIN) return 0;
+	const char *needle = 0;
+	Py_ssize_t needle_len = 0;
+	PyObject *tmp = 0;
+	if (op < W_IN) {
+		if (Py_TYPE(r) == &GzBytes_Type || (Py_TYPE(r) == &GzAscii_Type && PY_MAJOR_VERSION < 3)) {
+			if (!PyBytes_Check(value)) return 0;
+			tmp = value;
+			Py_INCREF(tmp);
+		} else {
+			if (!PyUnicode_Check(value)) return 0;
+			tmp = PyUnicode_AsUTF8String(value);
+			if (!tmp) {
+				PyErr_Clear();
+				return 0;
+			}
+		}
+		needle = PyBytes_AS_STRING(tmp);
+		needle_len = PyBytes_GET_SIZE(tmp);
+	}
+	int res = -1;
+	Py_ssize_t pos = 0;
+	while (1) {
+		pos = where_skip(r, m, pos, len);
+		if (pos < 0) goto out;
+		if (pos == len) break;
+		const char *ptr;
+		uint32_t size;
+		char *tofree;
+		const int got = (pos > len ? 1 : gzread_blob_(r, &ptr, &size, &tofree));
+		if (got < 0) goto out;
+		if (got) {
+			PyErr_SetString(PyExc_ValueError, "Reader ended before the mask");
+			goto out;
+		}
+		int hit;
+		if (!ptr) {
+			hit = (op == W_ISNONE);
+		} else if (op == W_ISNONE || op == W_ISNOTNONE) {
+			hit = (op == W_ISNOTNONE);
+		} else {
+			int cmp = memcmp(ptr, needle, size < needle_len ? size : needle_len);
+			if (!cmp) cmp = (size > needle_len) - (size < needle_len);
+			hit = WHERE_CMP(op, cmp);
+		}
+		free(tofree);
+		m[pos] = hit;
+		pos++;
+	}
+	res = 1;
+out:
+	Py_XDECREF(tmp);
+	return res;
+}
+
+// Anything else compares objects (like Python does).
+static int where_object(GzRead *r, char *m, Py_ssize_t len, int op, PyObject *value)
+{
+	Py_ssize_t pos = 0;
+	while (1) {
+		pos = where_skip(r, m, pos, len);
+		if (pos < 0) return -1;
+		if (pos == len) break;
+		PyObject *obj = (pos > len ? 0 : Py_TYPE(r)->tp_iternext((PyObject *)r));
+		if (!obj) {
+			if (!PyErr_Occurred()) {
+				PyErr_SetString(PyExc_ValueError, "Reader ended before the mask");
+			}
+			return -1;
+		}
+		int hit;
+		if (obj == Py_None) {
+			hit = (op == W_ISNONE);
+		} else if (op == W_ISNONE || op == W_ISNOTNONE) {
+			hit = (op == W_ISNOTNONE);
+		} else if (op >= W_IN) {
+			hit = PySequence_Contains(value, obj);
+			if (hit >= 0 && op == W_NOTIN) hit = !hit;
+		} else {
+			hit = PyObject_RichCompareBool(obj, value, where_pyops[op]);
+		}
+		Py_DECREF(obj);
+		if (hit < 0) return -1;
+		m[pos] = hit;
+		pos++;
+	}
+	return 1;
+}
+
+static int (*where_func(PyTypeObject *type))(GzRead *, char *, Py_ssize_t, int, PyObject *)
+{
+	struct { PyTypeObject *t; int (*f)(GzRead *, char *, Py_ssize_t, int, PyObject *); } funcs[] = {
+		{&GzFloat64_Type , where_Float64 },
+		{&GzFloat32_Type , where_Float32 },
+		{&GzInt64_Type   , where_Int64   },
+		{&GzInt32_Type   , where_Int32   },
+		{&GzBits64_Type  , where_Bits64  },
+		{&GzBits32_Type  , where_Bits32  },
+		{&GzBool_Type    , where_Bool    },
+		{&GzDateTime_Type, where_DateTime},
+		{&GzDate_Type    , where_Date    },
+		{&GzTime_Type    , where_Time    },
+		{&GzBytes_Type   , where_Blob    },
+		{&GzAscii_Type   , where_Blob    },
+		{&GzUnicode_Type , where_Blob    },
+	};
+	for (size_t i = 0; i < sizeof(funcs) / sizeof(*funcs); i++) {
+		if (funcs[i].t == type) return funcs[i].f;
+	}
+	return 0;
+}
+
+// Clear the bytes in mask (a bytearray with one byte per value) for the
+// values in reader that don't satisfy "value op value". Values that
+// already have a zero in mask are skipped without being looked at.
+// Returns the number of non-zero bytes left in mask.
+static PyObject *where(PyObject *dummy, PyObject *args)
+{
+	PyObject *reader;
+	PyObject *mask;
+	const char *op_name;
+	PyObject *value = Py_None;
+	if (!PyArg_ParseTuple(args, "OOs|O", &reader, &mask, &op_name, &value)) return 0;
+	if (!is_reader(Py_TYPE(reader))) {
+		PyErr_Format(PyExc_TypeError, "Can only use where on Gz* readers, not %s", Py_TYPE(reader)->tp_name);
+		return 0;
+	}
+	if (!PyByteArray_Check(mask)) {
+		PyErr_SetString(PyExc_TypeError, "mask must be a bytearray");
+		return 0;
+	}
+	int op;
+	for (op = 0; where_ops[op]; op++) {
+		if (!strcmp(op_name, where_ops[op])) break;
+	}
+	if (!where_ops[op]) {
+		PyErr_Format(PyExc_ValueError, "Unknown op %s", op_name);
+		return 0;
+	}
+	GzRead *r = (GzRead *)reader;
+	if (!r->fh) return err_closed();
+	if (r->callback || r->slices) {
+		PyErr_SetString(PyExc_ValueError, "Readers with callback or hashfilter are not supported");
+		return 0;
+	}
+	char *m = PyByteArray_AS_STRING(mask);
+	const Py_ssize_t len = PyByteArray_GET_SIZE(mask);
+	int (*f)(GzRead *, char *, Py_ssize_t, int, PyObject *) = where_func(Py_TYPE(reader));
+	int got = f ? f(r, m, len, op, value) : 0;
+	if (!got) got = where_object(r, m, len, op, value);
+	if (got < 0) return 0;
+	Py_ssize_t left = 0;
+	for (Py_ssize_t i = 0; i < len; i++) left += !!m[i];
+	return PyLong_FromSsize_t(left);
+}
+
+// The values in reader that have a non-zero byte in mask, as a list.
+// The others are skipped without creating any objects.
+static PyObject *take(PyObject *dummy, PyObject *args)
+{
+	PyObject *reader;
+	PyObject *mask_obj;
+	Py_buffer mask;
+	if (!PyArg_ParseTuple(args, "OO", &reader, &mask_obj)) return 0;
+	if (!is_reader(Py_TYPE(reader))) {
+		PyErr_Format(PyExc_TypeError, "Can only take from Gz* readers, not %s", Py_TYPE(reader)->tp_name);
+		return 0;
+	}
+	GzRead *r = (GzRead *)reader;
+	if (!r->fh) return err_closed();
+	if (r->callback || r->slices) {
+		PyErr_SetString(PyExc_ValueError, "Readers with callback or hashfilter are not supported");
+		return 0;
+	}
+	if (PyObject_GetBuffer(mask_obj, &mask, PyBUF_SIMPLE)) return 0;
+	const char *m = mask.buf;
+	PyObject *res = PyList_New(0);
+	if (!res) goto err;
+	Py_ssize_t pos = 0;
+	while (pos < mask.len) {
+		pos = where_skip(r, m, pos, mask.len);
+		if (pos < 0) goto err;
+		if (pos >= mask.len) break;
+		PyObject *obj = Py_TYPE(reader)->tp_iternext(reader);
+		if (!obj) {
+			if (PyErr_Occurred()) goto err;
+			break;
+		}
+		const int failed = PyList_Append(res, obj);
+		Py_DECREF(obj);
+		if (failed) goto err;
+		pos++;
+	}
+	PyBuffer_Release(&mask);
+	return res;
+err:
+	PyBuffer_Release(&mask);
+	Py_XDECREF(res);
+	return 0;
+}
+
 static PyMethodDef module_methods[] = {
 	{"hash", generic_hash, METH_O, "hash(v) - The hash a writer for type(v) would have used to slice v"},
 	{"siphash24", siphash24, METH_VARARGS, "siphash24(v, k=...) - SipHash-2-4 of v, defaults to the same k as the slicing hash"},
+	{"csv_format", csv_format, METH_VARARGS, "csv_format(columns, separator, quote='', check_lines=False) - About 1MB of csv lines from readers (or iterators of str), empty at the end"},
+	{"format_lines", (PyCFunction)format_lines, METH_VARARGS | METH_KEYWORDS, "format_lines(groups, separator='\\t', quote='', names=None, raw_columns=None, masks=None, max_lines=-1) - (data, lines) with about 1MB of lines from lists of readers, one line from each group in turn. names gives JSON objects. Empty at the end."},
+	{"grep", grep, METH_VARARGS, "grep(reader, result, needle=None, search=None, none_match=False) - Mark matching values in the bytearray result, returns how many values were read"},
+	{"copy", (PyCFunction)copy, METH_VARARGS | METH_KEYWORDS, "copy(reader, writer, mask, cyclic=False) - Copy the values where mask (bytes-like) is non-zero from reader (or a list of readers, round robin) to writer, without decoding them when the types match. Returns how many were copied."},
+	{"where", where, METH_VARARGS, "where(reader, mask, op, value=None) - Clear mask (bytearray) where the values don't satisfy op (==, !=, <, <=, >, >=, in, not in, is None, is not None) against value. Values with mask already clear are skipped. Returns how many are left set."},
+	{"take", take, METH_VARARGS, "take(reader, mask) - List of the values where mask (bytes-like) is non-zero, skipping the others without decoding them"},
 	{0}
 };
 
@@ -2169,7 +3907,7 @@ PyMODINIT_FUNC INITFUNC(void)
 	PyObject *c_hash = PyCapsule_New((void *)hash, "gzutil._C_hash", 0);
 	if (!c_hash) return INITERR;
 	PyModule_AddObject(m, "_C_hash", c_hash);
-	PyObject *version = Py_BuildValue("(iii)", 2, 11, 0);
+	PyObject *version = Py_BuildValue("(iii)", 2, 19, 0);
 	PyModule_AddObject(m, "version", version);
 #if PY_MAJOR_VERSION >= 3
 	return m;
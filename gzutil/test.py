@@ -26,6 +26,7 @@ from __future__ import division, print_function, unicode_literals
 from datetime import datetime, date, time
 from sys import version_info
 from itertools import compress
+from os import unlink
 
 from accelerator import gzutil
 
@@ -373,6 +374,32 @@ with gzutil.GzWriteAscii(TMP_FN) as fh:
 with gzutil.GzAscii(TMP_FN) as fh:
 	assert data == list(fh)
 
+print("Skip test")
+# Skipping should end up in the same place as reading, also across blocks.
+for name, values in (
+	("AsciiLines", a),
+	("Ascii", data),
+	("Number", want),
+	("Int64", list(range(Z))),
+	("Bool", [True, False, False] * Z),
+	("Date", [dt0] * 5),
+):
+	with getattr(gzutil, "GzWrite" + name)(TMP_FN) as fh:
+		for v in values:
+			fh.write(v)
+	if len(values) < 10:
+		to_skip = range(len(values) + 2)
+	else:
+		to_skip = (0, 1, len(values) // 2, len(values) - 1, len(values), len(values) + 1)
+	for cnt in to_skip:
+		with getattr(gzutil, "Gz" + name)(TMP_FN) as fh:
+			assert fh.skip(cnt) == min(cnt, len(values)), "Gz%s skipped wrong count" % (name,)
+			assert list(fh) == values[cnt:], "Gz%s wrong values after skip(%d)" % (name, cnt,)
+	with getattr(gzutil, "Gz" + name)(TMP_FN, max_count=3) as fh:
+		assert fh.skip(2) == 2
+		assert fh.skip(2) == 1
+		assert list(fh) == []
+
 print("Callback tests")
 with gzutil.GzWriteNumber(TMP_FN) as fh:
 	for n in range(1000):
@@ -412,3 +439,244 @@ with gzutil.GzNumber(TMP_FN, callback=callback3, callback_interval=1) as fh:
 	except ZeroDivisionError:
 		good = True
 	assert good
+
+print("csv_format")
+with gzutil.GzWriteFloat64(TMP_FN, none_support=True) as fh:
+	for v in (1.0, -0.0, 0.1, 1e16, None, float('inf')):
+		fh.write(v)
+with gzutil.GzFloat64(TMP_FN) as fh:
+	assert gzutil.csv_format([fh, iter(['a', 'b"c', "d'e", 'f', 'g', 'h'])], ';', '"') == b'"1.0";"a"\n"-0.0";"b""c"\n"0.1";"d\'e"\n"1e+16";"f"\n"None";"g"\n"inf";"h"\n'
+	assert gzutil.csv_format([fh], ',') == b''
+with gzutil.GzFloat64(TMP_FN, max_count=2) as fh:
+	assert gzutil.csv_format([fh], ',') == b'1.0\n-0.0\n'
+for bad in ([iter(['a\nb'])], [iter(['a\r'])]):
+	try:
+		gzutil.csv_format(bad, ',', '', True)
+		raise Exception("csv_format accepted a bad line")
+	except ValueError:
+		pass
+
+print("grep")
+long_value = "x" * 200000 + "needle"
+with gzutil.GzWriteUnicode(TMP_FN, none_support=True) as fh:
+	for v in ("hay", "needle", None, "r\xe4ksm\xf6rg\xe5s", long_value, "NEEDLE", ""):
+		fh.write(v)
+with gzutil.GzUnicode(TMP_FN) as fh:
+	res = bytearray(10)
+	assert gzutil.grep(fh, res, "needle".encode("utf-8")) == 7
+	assert res == bytearray([0, 1, 0, 0, 1, 0, 0, 0, 0, 0])
+with gzutil.GzUnicode(TMP_FN) as fh:
+	res = bytearray(4)
+	assert gzutil.grep(fh, res, "\xf6rg".encode("utf-8"), None, True) == 4
+	assert res == bytearray([0, 0, 1, 1])
+	res = bytearray(4)
+	assert gzutil.grep(fh, res, None, lambda v: v.lower() == "needle") == 3
+	assert res == bytearray([0, 1, 0, 0])
+with gzutil.GzUnicode(TMP_FN, max_count=3) as fh:
+	res = bytearray([1, 0, 0, 0])
+	seen = []
+	assert gzutil.grep(fh, res, None, seen.append) == 3
+	assert seen == ["needle"], "Already matched values and None should not be searched"
+with gzutil.GzInt64(TMP_FN) as fh:
+	try:
+		gzutil.grep(fh, bytearray(1), b"1")
+		raise Exception("grep accepted an int64 reader")
+	except TypeError:
+		pass
+
+print("format_lines")
+with gzutil.GzWriteInt64(TMP_FN, none_support=True) as fh:
+	for v in (1, None, 3, 4):
+		fh.write(v)
+with gzutil.GzWriteFloat64("_tmp_test2.gz") as fh:
+	for v in (0.5, float('nan'), float('-inf'), 2.0):
+		fh.write(v)
+with gzutil.GzWriteUnicode("_tmp_test3.gz") as fh:
+	for v in ('a"b', 'c\nd', '\x01', '{"x": [1]}'):
+		fh.write(v)
+def readers(max_count=-1):
+	return [gzutil.GzInt64(TMP_FN, max_count=max_count), gzutil.GzFloat64("_tmp_test2.gz", max_count=max_count), gzutil.GzUnicode("_tmp_test3.gz", max_count=max_count)]
+assert gzutil.format_lines([readers()], ',', '"') == (b'"1","0.5","a""b"\n"None","nan","c\nd"\n"3","-inf","\x01"\n"4","2.0","{""x"": [1]}"\n', 4)
+assert gzutil.format_lines([readers()], names=['i', 'f', 'u'], max_lines=2) == (b'{"i":1,"f":0.5,"u":"a\\"b"}\n{"i":null,"f":NaN,"u":"c\\nd"}\n', 2)
+assert gzutil.format_lines([readers()], names=['i', 'f', 'u'], masks=[b'\x00\x00\x01\x01']) == (b'{"i":3,"f":-Infinity,"u":"\\u0001"}\n{"i":4,"f":2.0,"u":"{\\"x\\": [1]}"}\n', 2)
+assert gzutil.format_lines([readers()], names=['i', 'f', 'u'], raw_columns=[2], masks=[b'\x00\x00\x00\x01']) == (b'{"i":4,"f":2.0,"u":{"x": [1]}}\n', 1)
+# Round robin, the second group ends first.
+assert gzutil.format_lines([readers(), readers(2)], masks=[None, b'\x01\x00']) == (b'1\t0.5\ta"b\n1\t0.5\ta"b\nNone\tnan\tc\nd\n3\t-inf\t\x01\n4\t2.0\t{"x": [1]}\n', 5)
+assert gzutil.format_lines([readers()], max_lines=0) == (b'', 0)
+unlink("_tmp_test2.gz")
+unlink("_tmp_test3.gz")
+
+print("copy")
+long_text = "x" * 200000
+for name, values in (
+	("Float64", [1.5, None, -0.0, inf, 7.25, None]),
+	("Float32", [1.5, None, 2.0, ninf, 7.25, 3.0]),
+	("Int64", [1, None, -9007199254740991, 4, 5, 6]),
+	("Int32", [1, None, -3, 4, 5, -2147483647]),
+	("Bits64", [1, 2, 18446744073709551615, 4, 5, 6]),
+	("Bits32", [1, 2, 3, 4294967295, 5, 6]),
+	("Bool", [True, None, False, True, False, True]),
+	("DateTime", [dttm0, None, dttm1, dttm2, dttm0, dttm2]),
+	("Date", [dt0, None, date(2020, 2, 29), date(1, 1, 1), dt0, dt0]),
+	("Time", [tm0, None, tm1, tm2, tm1, tm0]),
+	("Bytes", [b"a", None, b"", long_text.encode("ascii"), b"\xff" * 300, b"b"]),
+	("Ascii", ["a", None, "", long_text, "y" * 300, "b"]),
+	("Unicode", ["\xe5", None, "", long_text, "\u20ac" * 300, "b"]),
+):
+	none_support = (name not in ("Bits64", "Bits32"))
+	with getattr(gzutil, "GzWrite" + name)(TMP_FN, none_support=none_support) as fh:
+		for v in values:
+			fh.write(v)
+	for mask in (b"\x01" * 6, b"\x00\x01\x01\x00\x00\x01", b"\x01\x00\x00\x00\x00\x00\x01\x01", b"\x00\x00\x01"):
+		mask = bytearray(mask) # iterates as ints on py2 too
+		want = list(compress(values, mask))
+		with getattr(gzutil, "Gz" + name)(TMP_FN) as r:
+			with getattr(gzutil, "GzWrite" + name)("_tmp_test2.gz", none_support=none_support) as w:
+				assert gzutil.copy(r, w, mask) == len(want), name
+				assert w.count == len(want), name
+				not_none = [v for v in want if v is not None]
+				if not_none and name not in ("Bytes", "Ascii", "Unicode"):
+					assert (w.min, w.max) == (min(not_none), max(not_none)), name
+				else:
+					assert w.min is None, name
+		with getattr(gzutil, "Gz" + name)("_tmp_test2.gz") as fh:
+			assert list(fh) == want, name
+	if None in values:
+		with getattr(gzutil, "Gz" + name)(TMP_FN) as r:
+			with getattr(gzutil, "GzWrite" + name)("_tmp_test2.gz") as w:
+				try:
+					gzutil.copy(r, w, b"\x01" * 6)
+					raise Exception("copy wrote None to %s writer without none_support" % (name,))
+				except ValueError:
+					pass
+# max_count on the reader stops the copy, also while skipping.
+with gzutil.GzWriteInt64(TMP_FN) as fh:
+	for v in range(10000):
+		fh.write(v)
+with gzutil.GzInt64(TMP_FN, max_count=5000) as r:
+	with gzutil.GzWriteInt64("_tmp_test2.gz") as w:
+		assert gzutil.copy(r, w, b"\x00" * 4000 + b"\x01" * 2000 + b"\x00" * 4000) == 1000
+with gzutil.GzInt64("_tmp_test2.gz") as fh:
+	assert list(fh) == list(range(4000, 5000))
+# Different types, and writers with a hashfilter, go through write.
+with gzutil.GzInt64(TMP_FN) as r:
+	with gzutil.GzWriteNumber("_tmp_test2.gz") as w:
+		assert gzutil.copy(r, w, bytearray([1, 0] * 5)) == 5
+with gzutil.GzNumber("_tmp_test2.gz") as fh:
+	assert list(fh) == [0, 2, 4, 6, 8]
+with gzutil.GzInt64(TMP_FN) as r:
+	with gzutil.GzWriteInt64("_tmp_test2.gz", hashfilter=(0, 3)) as w:
+		mask = bytearray(w.hashcheck(v) for v in range(20))
+		assert gzutil.copy(r, w, mask) == sum(mask)
+		try:
+			gzutil.copy(r, w, b"\x01" * 20)
+			raise Exception("copy wrote a value to the wrong slice")
+		except ValueError:
+			pass
+# A list of readers is read round robin, and a cyclic mask is repeated.
+lens = (7, 3, 7, 0, 5)
+for sliceno, length in enumerate(lens):
+	with gzutil.GzWriteUnicode("_tmp_test%d.gz" % (sliceno + 3,)) as fh:
+		for v in range(length):
+			fh.write("%d.%d" % (sliceno, v,))
+rr = []
+for ix in range(max(lens)):
+	rr.extend("%d.%d" % (sliceno, ix,) for sliceno, length in enumerate(lens) if ix < length)
+for mask, cyclic, want in (
+	(b"\x01" * 30, False, rr),
+	(b"\x01\x00\x01", False, rr[:3:2]),
+	(b"\x00\x01\x00", True, rr[1::3]),
+	(b"\x01\x00\x00\x00", True, rr[::4]),
+):
+	rs = [gzutil.GzUnicode("_tmp_test%d.gz" % (sliceno + 3,)) for sliceno in range(len(lens))]
+	with gzutil.GzWriteUnicode("_tmp_test2.gz") as w:
+		assert gzutil.copy(rs, w, mask, cyclic=cyclic) == len(want)
+	with gzutil.GzUnicode("_tmp_test2.gz") as fh:
+		assert list(fh) == want, (mask, list(fh), want)
+for sliceno in range(len(lens)):
+	unlink("_tmp_test%d.gz" % (sliceno + 3,))
+with gzutil.GzInt64(TMP_FN, hashfilter=(0, 3)) as r:
+	try:
+		gzutil.copy(r, gzutil.GzWriteInt64("_tmp_test2.gz"), b"\x01")
+		raise Exception("copy accepted a reader with a hashfilter")
+	except ValueError:
+		pass
+unlink("_tmp_test2.gz")
+
+print("where")
+import operator
+def where_want(v, op, x):
+	if op == "is None":
+		return v is None
+	if op == "is not None":
+		return v is not None
+	if v is None:
+		return False
+	if op == "in":
+		return v in x
+	if op == "not in":
+		return v not in x
+	return {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}[op](v, x)
+for name, values, tests in (
+	("Float64", [1.5, None, -0.0, inf, 7.25, float("nan"), 2], [1.5, 2, 0, float("nan"), [1.5, 7.25, float("nan")], 2.5]),
+	("Float32", [1.5, None, 0.1, ninf, 7.25, 3.0], [1.5, 0.1, 3, [0.1, 3.0]]),
+	("Int64", [1, None, -9007199254740991, 4, 5, 6], [4, 2.5, 4.0, -9007199254740991, [1, 6, 7], [2.5, 4]]),
+	("Int32", [1, None, -3, 4, 5, -2147483647], [-3, 5, 2 ** 40, [5, 1]]),
+	("Bits64", [1, 2, 18446744073709551615, 4, 5, 6], [4, 18446744073709551615, -1, [2, 4]]),
+	("Bits32", [1, 2, 3, 4294967295, 5, 6], [3, [4294967295, 1]]),
+	("Bool", [True, None, False, True, False, True], [True, False, [True]]),
+	("DateTime", [dttm0, None, dttm1, dttm2, dttm0, dttm2], [dttm0, dttm2, [dttm1, dttm0]]),
+	("Date", [dt0, None, date(2020, 2, 29), date(1, 1, 1), dt0, dt0], [dt0, date(2020, 2, 29), [date(1, 1, 1)]]),
+	("Time", [tm0, None, tm1, tm2, tm1, tm0], [tm1, tm2, [tm0, tm2]]),
+	("Bytes", [b"a", None, b"", b"ab", b"\xff" * 300, b"b"], [b"a", b"", b"b", [b"a", b""]]),
+	("Ascii", ["a", None, "", "ab", "y" * 300, "b"], ["a", "ab", "b", ["a", "b"]]),
+	("Unicode", ["\xe5", None, "", "z", "\u20ac" * 300, "\U0001f600", "b"], ["\xe5", "z", "\u20ac", "\U0001f600", ["z", ""]]),
+	("Number", [1, None, 2.5, 10 ** 30, -7], [2.5, 10 ** 30, [1, -7]]),
+):
+	none_support = (name not in ("Bits64", "Bits32"))
+	with getattr(gzutil, "GzWrite" + name)(TMP_FN, none_support=none_support) as fh:
+		for v in values:
+			fh.write(v)
+	with getattr(gzutil, "Gz" + name)(TMP_FN) as fh:
+		values = list(fh) # as stored (float32 is not exact)
+	for x in tests:
+		if isinstance(x, list):
+			ops = ("in", "not in")
+		else:
+			ops = ("==", "!=", "<", "<=", ">", ">=")
+		for op in ops + ("is None", "is not None"):
+			for start in (bytearray([1] * len(values)), bytearray([1, 0] * len(values))[:len(values)]):
+				want = [int(s and where_want(v, op, x)) for v, s in zip(values, start)]
+				mask = bytearray(start)
+				with getattr(gzutil, "Gz" + name)(TMP_FN) as fh:
+					assert gzutil.where(fh, mask, op, x) == sum(want), (name, op, x)
+				assert list(mask) == want, (name, op, x, list(mask), want)
+# Stops at the end of the mask, so the next call continues from there.
+with gzutil.GzWriteFloat64(TMP_FN) as fh:
+	for v in (1.0, -1.0, -2.0, 3.0, -4.0):
+		fh.write(v)
+with gzutil.GzFloat64(TMP_FN) as fh:
+	mask = bytearray([1, 1, 1])
+	assert gzutil.where(fh, mask, ">", 0.0) == 1
+	mask = bytearray([1, 0])
+	assert gzutil.where(fh, mask, ">", 0.0) == 1
+	assert mask == bytearray([1, 0])
+	try:
+		gzutil.where(fh, bytearray([1]), ">", 0.0)
+		raise Exception("where did not notice the reader ending")
+	except ValueError:
+		pass
+
+print("take")
+with gzutil.GzWriteUnicode(TMP_FN) as fh:
+	for v in range(100):
+		fh.write("%d" % (v,) * (v % 7))
+want = ["%d" % (v,) * (v % 7) for v in range(100)]
+for mask in (b"\x01" * 100, b"\x00" * 100, bytearray([0, 1, 0, 0]) * 25, b"\x01" + b"\x00" * 98 + b"\x01", b"\x01" * 10):
+	mask = bytearray(mask) # iterates as ints on py2 too
+	with gzutil.GzUnicode(TMP_FN) as fh:
+		assert gzutil.take(fh, mask) == list(compress(want, mask)), mask
+		# and the reader is left after the mask
+		assert next(fh, None) == (want[len(mask)] if len(mask) < 100 else None)
+with gzutil.GzUnicode(TMP_FN, max_count=10) as fh:
+	assert gzutil.take(fh, b"\x00" * 9 + b"\x01" * 10) == [want[9]]